@@ -0,0 +1,6 @@
+import sys
+
+from skinIO import batch
+
+
+sys.exit(batch.main())
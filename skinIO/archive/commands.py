@@ -0,0 +1,540 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import xml.etree.ElementTree
+import zipfile
+
+from skinIO.archive import deformerWeights
+from skinIO.archive import payloads
+from skinIO.archive import reader
+from skinIO.archive import weights
+from skinIO.core import serialization
+
+
+COMMANDS = ('inspect',
+            'validate',
+            'stats')
+
+CONVERT_EXTENSIONS = ('.zip',
+                      '.json',
+                      '.npz')
+
+WEIGHT_SUM_TOLERANCE = 1e-3
+
+
+def inspectArchive(archiveFile):
+    """
+        returns:
+            (dict) injection settings and skin list of archiveFile.
+    """
+    with reader.ArchiveReader(archiveFile) as archiveReader:
+        settingsData = archiveReader.injectionSettings.toDict()
+
+        return {'archive': archiveFile,
+                'settings': settingsData,
+                'shards': archiveReader.getShardFiles(),
+                'skins': [skinPayload.toDict() for skinPayload in archiveReader.skinArray]}
+
+
+def validateArchive(archiveFile,
+                    decode=True):
+    """
+        Check archive integrity, payload presence and, when the payload type 
+        can be decoded, weight values.
+
+        returns:
+            (dict) {'archive', 'errors': [...], 'warnings': [...]}
+    """
+    report = {'archive': archiveFile,
+              'errors': [],
+              'warnings': []}
+
+    try:
+        archiveReader = reader.ArchiveReader(archiveFile)
+    except (payloads.ArchiveError, zipfile.BadZipfile, IOError, OSError, ValueError) as error:
+        report['errors'].append(str(error))
+        return report
+
+    with archiveReader:
+        corruptedMember = archiveReader.testMembers()
+
+        if corruptedMember is not None:
+            report['errors'].append('{0} fails its crc check'.format(corruptedMember))
+
+        for shardFile in archiveReader.getShardFiles():
+            if not os.path.exists(shardFile):
+                report['errors'].append('shard {0} is missing'.format(shardFile))
+                continue
+
+            shardReport = validateArchive(shardFile,
+                                          decode=decode)
+
+            report['errors'].extend(shardReport['errors'])
+            report['warnings'].extend(shardReport['warnings'])
+
+        for skinPayload in archiveReader.skinArray:
+            if skinPayload.getMemberInfo() is None:
+                report['errors'].append('{0}: payload {1} is missing'.format(skinPayload.deformerName,
+                                                                             skinPayload.memberName))
+                continue
+
+            if decode is False:
+                continue
+
+            try:
+                weightData = skinPayload.decode()
+            except payloads.DecoderUnavailable as error:
+                report['warnings'].append('{0}: {1}'.format(skinPayload.deformerName, error))
+                continue
+            except payloads.ArchiveError as error:
+                report['errors'].append('{0}: {1}'.format(skinPayload.deformerName, error))
+                continue
+
+            validateWeights(skinPayload,
+                            weightData,
+                            report)
+
+    return report
+
+
+def validateWeights(skinPayload,
+                    weightData,
+                    report):
+    invalidCount = sum(1 for value in weightData.values if value < 0.0 or math.isnan(value))
+
+    if invalidCount > 0:
+        report['errors'].append('{0}: {1} negative or NaN weights'.format(skinPayload.deformerName,
+                                                                          invalidCount))
+
+    if not skinPayload.skinSettings.normalizeWeights:
+        return
+
+    weightSums = weightData.getSums()
+
+    emptyCount = sum(1 for weightSum in weightSums if weightSum == 0.0)
+    unnormalizedCount = sum(1 for weightSum in weightSums 
+                            if weightSum != 0.0 and abs(weightSum - 1.0) > WEIGHT_SUM_TOLERANCE)
+
+    if emptyCount > 0:
+        report['warnings'].append('{0}: {1} points without weights'.format(skinPayload.deformerName,
+                                                                            emptyCount))
+
+    if unnormalizedCount > 0:
+        report['warnings'].append('{0}: {1} points are not normalized'.format(skinPayload.deformerName,
+                                                                               unnormalizedCount))
+
+
+def getArchiveStats(archiveFile):
+    """
+        returns:
+            (dict) per skin and total sizes, point counts and weight density.
+    """
+    stats = {'archive': archiveFile,
+             'archiveBytes': os.path.getsize(archiveFile),
+             'skins': [],
+             'totals': {'skins': 0,
+                        'points': 0,
+                        'nonZeroCount': 0,
+                        'bytes': 0,
+                        'compressedBytes': 0}}
+
+    with reader.ArchiveReader(archiveFile) as archiveReader:
+        stats['weightMode'] = archiveReader.weightMode
+
+        collectSkinStats(archiveReader,
+                         stats)
+
+        for shardFile in getShardFiles(archiveReader):
+            with reader.ArchiveReader(shardFile) as shardReader:
+                collectSkinStats(shardReader,
+                                 stats)
+
+    return stats
+
+
+def collectSkinStats(archiveReader,
+                     stats):
+    """
+        Add the skins of archiveReader to stats, see getArchiveStats.
+    """
+    for skinPayload in archiveReader.skinArray:
+        skinStats = skinPayload.toDict()
+
+        try:
+            weightData = skinPayload.decode()
+        except payloads.ArchiveError:
+            weightData = None
+
+        if weightData is not None:
+            skinStats['points'] = weightData.pointCount
+            skinStats['nonZeroCount'] = weightData.getNonZeroCount()
+            skinStats['maxInfluences'] = weightData.getMaxInfluences()
+            skinStats['density'] = skinStats['nonZeroCount'] / float(max(len(weightData), 1))
+
+            stats['totals']['points'] += skinStats['points']
+            stats['totals']['nonZeroCount'] += skinStats['nonZeroCount']
+
+        stats['skins'].append(skinStats)
+
+        stats['totals']['skins'] += 1
+        stats['totals']['bytes'] += skinStats['bytes']
+        stats['totals']['compressedBytes'] += skinStats['compressedBytes']
+
+
+def getShardFiles(archiveReader):
+    """
+        Shard archives listed by a sharded index archive.
+
+        returns:
+            (list of string) empty for a regular archive.
+    """
+    shardFileArray = archiveReader.getShardFiles()
+
+    for shardFile in shardFileArray:
+        if not os.path.exists(shardFile):
+            raise payloads.ArchiveError('shard {0} is missing'.format(shardFile))
+
+    return shardFileArray
+
+
+def decodeArchive(archiveReader):
+    """
+        returns:
+            (list of tuple) (SkinPayload, WeightData) of every skin.
+    """
+    return [(skinPayload, skinPayload.decode()) for skinPayload in archiveReader.skinArray]
+
+
+def convertArchive(archiveFile,
+                   targetFile):
+    """
+        Convert decoded weights, the output format follows targetFile extension:
+            .zip: mayaAscii archive importable by skinIO.
+            .json: dense weights per skin.
+            .npz: NumPy matrices and influence names per skin.
+
+        returns:
+            (string) targetFile
+    """
+    targetExtension = os.path.splitext(targetFile)[1].lower()
+
+    if targetExtension not in CONVERT_EXTENSIONS:
+        raise payloads.ArchiveError('Unsupported conversion target {0}'.format(targetFile))
+
+    with reader.ArchiveReader(archiveFile) as archiveReader:
+        decodedArray = decodeArchive(archiveReader)
+
+        for shardFile in getShardFiles(archiveReader):
+            with reader.ArchiveReader(shardFile) as shardReader:
+                decodedArray.extend(decodeArchive(shardReader))
+
+        if len(decodedArray) == 0:
+            raise payloads.ArchiveError('{0} holds no skins'.format(archiveFile))
+
+        if targetExtension == '.zip':
+            writeAsciiArchive(archiveReader,
+                              decodedArray,
+                              targetFile)
+
+        elif targetExtension == '.json':
+            outputData = {}
+
+            for skinPayload, weightData in decodedArray:
+                outputData[skinPayload.deformerName] = weightData.toDict()
+                outputData[skinPayload.deformerName]['shape'] = skinPayload.shape
+
+            with open(targetFile, 'w') as outfile:
+                json.dump(outputData, outfile)
+
+        else:
+            if weights.numpy is None:
+                raise payloads.ArchiveError('NumPy is required to write {0}'.format(targetFile))
+
+            arrayMap = {}
+
+            for skinPayload, weightData in decodedArray:
+                arrayMap[skinPayload.deformerName] = weightData.toNumpy()
+                arrayMap['{0}__influences'.format(skinPayload.deformerName)] = weights.numpy.array(weightData.influences)
+
+            weights.numpy.savez_compressed(targetFile, **arrayMap)
+
+    return targetFile
+
+
+def writeAsciiArchive(archiveReader,
+                      decodedArray,
+                      targetFile):
+    archiveName = os.path.splitext(os.path.basename(targetFile))[0]
+
+    injectionData = serialization.InjectionSettings('mayaAscii')
+    injectionData.assetScene = archiveReader.injectionSettings.assetScene
+
+    skinMetadata = {}
+
+    temporaryArchiveFile = '{0}.tmp'.format(targetFile)
+
+    try:
+        with zipfile.ZipFile(temporaryArchiveFile, 
+                             'w', 
+                             compression=zipfile.ZIP_DEFLATED) as outputZip:
+            for skinPayload, weightData in decodedArray:
+                memberName = '{0}_skinWeights.ma'.format(skinPayload.deformerName)
+
+                outputZip.writestr(memberName,
+                                   payloads.encodeAscii(skinPayload.deformerName,
+                                                        weightData))
+
+                skinPayload.skinSettings.abcWeightsFile = memberName
+
+                skinMetadata[skinPayload.deformerName] = skinPayload.skinSettings.toDict()
+
+            outputZip.writestr(archiveName + '.mod',
+                               injectionData.toJson())
+
+            outputZip.writestr(archiveName + serialization.SkinMetadata.EXTENSION,
+                               serialization.SkinMetadata.encode(skinMetadata))
+    except:
+        if os.path.exists(temporaryArchiveFile):
+            os.remove(temporaryArchiveFile)
+
+        raise
+
+    publishArchive(temporaryArchiveFile,
+                   targetFile)
+
+
+def convertDeformerWeights(sourceFile,
+                           targetFile):
+    """
+        Convert a deformerWeights xml file into a mayaAscii archive importable by skinIO.
+        The xml is streamed, only the non zero weights of the current skin are held in memory.
+
+        args:
+            sourceFile(string): xml file written by the deformerWeights command.
+
+            targetFile(string): output .zip archive.
+
+        returns:
+            (string) targetFile
+    """
+    if os.path.splitext(targetFile)[1].lower() != '.zip':
+        raise payloads.ArchiveError('deformerWeights files can only be converted to a .zip archive')
+
+    archiveName = os.path.splitext(os.path.basename(targetFile))[0]
+
+    injectionData = serialization.InjectionSettings('mayaAscii')
+    injectionData.assetScene = sourceFile
+
+    skinMetadata = {}
+
+    temporaryArchiveFile = '{0}.tmp'.format(targetFile)
+
+    try:
+        with zipfile.ZipFile(temporaryArchiveFile, 
+                             'w', 
+                             compression=zipfile.ZIP_DEFLATED) as outputZip:
+            for skinWeights in deformerWeights.iterSkins(sourceFile):
+                memberName = '{0}_skinWeights.ma'.format(skinWeights.deformerName)
+
+                outputZip.writestr(memberName,
+                                   payloads.encodeSparseAscii(skinWeights.deformerName,
+                                                              skinWeights.getPointCount(),
+                                                              skinWeights.iterRows()))
+
+                skinSettings = serialization.SkinSettings(None,
+                                                          collectData=False)
+
+                skinSettings.deformerName = skinWeights.deformerName
+                skinSettings.shape = skinWeights.shape
+                skinSettings.influences = skinWeights.influences
+                skinSettings.normalizeWeights = 1
+                skinSettings.abcWeightsFile = memberName
+
+                skinMetadata[skinWeights.deformerName] = skinSettings.toDict()
+
+            if len(skinMetadata) == 0:
+                raise payloads.ArchiveError('{0} holds no weights'.format(sourceFile))
+
+            outputZip.writestr(archiveName + '.mod',
+                               injectionData.toJson())
+
+            outputZip.writestr(archiveName + serialization.SkinMetadata.EXTENSION,
+                               serialization.SkinMetadata.encode(skinMetadata))
+    except:
+        if os.path.exists(temporaryArchiveFile):
+            os.remove(temporaryArchiveFile)
+
+        raise
+
+    publishArchive(temporaryArchiveFile,
+                   targetFile)
+
+    return targetFile
+
+
+def publishArchive(temporaryArchiveFile,
+                   targetFile):
+    if hasattr(os, 'replace'):
+        os.replace(temporaryArchiveFile, targetFile)
+    else:
+        if os.path.exists(targetFile):
+            os.remove(targetFile)
+
+        os.rename(temporaryArchiveFile, targetFile)
+
+
+def runCommand(commandData):
+    command, archiveFile = commandData
+
+    try:
+        if command == 'inspect':
+            return inspectArchive(archiveFile)
+
+        if command == 'validate':
+            return validateArchive(archiveFile)
+
+        return getArchiveStats(archiveFile)
+    except (payloads.ArchiveError, zipfile.BadZipfile, IOError, OSError, ValueError) as error:
+        return {'archive': archiveFile,
+                'errors': [str(error)]}
+
+
+def formatResult(command,
+                 result):
+    lineArray = ['<{0}>'.format(result['archive'])]
+
+    if command == 'validate' or 'settings' not in result and 'skins' not in result:
+        for error in result.get('errors', []):
+            lineArray.append('\tERROR {0}'.format(error))
+
+        for warning in result.get('warnings', []):
+            lineArray.append('\tWARNING {0}'.format(warning))
+
+        if command == 'validate' and len(lineArray) == 1:
+            lineArray.append('\tOK')
+
+        return '\n'.join(lineArray)
+
+    if command == 'inspect':
+        for key in sorted(result['settings']):
+            lineArray.append('\t{0}: {1}'.format(key, result['settings'][key]))
+
+        for shardFile in result['shards']:
+            lineArray.append('\tshard {0}'.format(shardFile))
+
+        for skinData in result['skins']:
+            lineArray.append('\t{deformerName} -> {shape}: {influences} influences, {member} ({compressedBytes}/{bytes} bytes)'.format(**skinData))
+
+        return '\n'.join(lineArray)
+
+    lineArray.append('\tweightMode: {0}'.format(result['weightMode']))
+
+    for skinData in result['skins']:
+        if 'points' not in skinData:
+            lineArray.append('\t{deformerName}: {influences} influences, {compressedBytes}/{bytes} bytes, not decoded'.format(**skinData))
+            continue
+
+        lineArray.append('\t{deformerName}: {points} points, {influences} influences, '
+                         '{nonZeroCount} weights ({density:.1%}), max {maxInfluences} per point, '
+                         '{compressedBytes}/{bytes} bytes'.format(**skinData))
+
+    lineArray.append('\ttotal: {skins} skins, {points} points, {nonZeroCount} weights, '
+                     '{compressedBytes}/{bytes} bytes'.format(**result['totals']))
+
+    return '\n'.join(lineArray)
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(prog='python -m skinIO.archive',
+                                     description='Inspect, validate, convert and measure skinIO archives without Maya.')
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    for command in COMMANDS:
+        commandParser = subparsers.add_parser(command)
+
+        commandParser.add_argument('archives', nargs='+')
+        commandParser.add_argument('--json', action='store_true',
+                                   help='print results as json')
+        commandParser.add_argument('--workers', type=int, default=1,
+                                   help='number of processes handling archives')
+
+    convertParser = subparsers.add_parser('convert')
+    convertParser.add_argument('source',
+                               help='skinIO archive or deformerWeights .xml file')
+    convertParser.add_argument('target',
+                               help='output file: .zip (mayaAscii archive), .json or .npz')
+
+    return parser
+
+
+def main(argumentArray=None):
+    parser = buildParser()
+    arguments = parser.parse_args(argumentArray)
+
+    if arguments.command is None:
+        parser.print_help()
+        return 2
+
+    if arguments.command == 'convert':
+        try:
+            if arguments.source.lower().endswith('.xml'):
+                convertDeformerWeights(arguments.source,
+                                       arguments.target)
+            else:
+                convertArchive(arguments.source,
+                               arguments.target)
+        except (payloads.ArchiveError, zipfile.BadZipfile, xml.etree.ElementTree.ParseError, IOError, OSError) as error:
+            sys.stderr.write('{0}\n'.format(error))
+            return 1
+
+        return 0
+
+    commandArray = [(arguments.command, archiveFile) for archiveFile in arguments.archives]
+
+    if arguments.workers > 1 and len(commandArray) > 1:
+        workerPool = multiprocessing.Pool(min(arguments.workers, len(commandArray)))
+
+        try:
+            resultArray = workerPool.map(runCommand, commandArray)
+        finally:
+            workerPool.close()
+            workerPool.join()
+    else:
+        resultArray = [runCommand(commandData) for commandData in commandArray]
+
+    if arguments.json:
+        sys.stdout.write(json.dumps(resultArray, indent=2) + '\n')
+    else:
+        for result in resultArray:
+            sys.stdout.write(formatResult(arguments.command, result) + '\n')
+
+    return 1 if any(result.get('errors') for result in resultArray) else 0
@@ -0,0 +1,287 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import array
+import collections
+import xml.etree.ElementTree
+
+from skinIO.archive import payloads
+
+
+class InfluenceWeights(object):
+    """
+        Sparse weights of one influence, read from a deformerWeights <weights> block
+    """
+    def __init__(self,
+                 deformerName,
+                 shape,
+                 source,
+                 defaultValue=0.0):
+        self.deformerName = deformerName
+        self.shape = shape
+        self.source = source
+
+        self.defaultValue = defaultValue
+
+        self.pointIndices = array.array('l')
+        self.values = array.array('d')
+
+    def __len__(self):
+        return len(self.pointIndices)
+
+
+class SkinWeights(object):
+    """
+        <weights> blocks sharing the same deformer, 
+        memory is proportional to the non zero weights of this skin only.
+    """
+    def __init__(self,
+                 deformerName,
+                 shape,
+                 pointCount):
+        self.deformerName = deformerName
+        self.shape = shape
+        self.pointCount = pointCount
+
+        self.influenceArray = []
+
+    @property
+    def influences(self):
+        return [influenceWeights.source for influenceWeights in self.influenceArray]
+
+    def add(self,
+            influenceWeights):
+        self.influenceArray.append(influenceWeights)
+
+    def getPointCount(self):
+        """
+            returns:
+                (int) shape point count, or the highest weighted point + 1 when the file has no shape block.
+        """
+        if self.pointCount:
+            return self.pointCount
+
+        return max([max(influenceWeights.pointIndices) + 1 
+                    for influenceWeights in self.influenceArray 
+                    if len(influenceWeights) > 0] or [0])
+
+    def getNonZeroCount(self):
+        return sum(len(influenceWeights) for influenceWeights in self.influenceArray)
+
+    def iterRows(self):
+        """
+            returns:
+                (generator of (int, list of (int, float))) points sorted by index with
+                their non zero weights sorted by influence index, see payloads.encodeSparseAscii.
+        """
+        rowMap = {}
+
+        for influenceIndex, influenceWeights in enumerate(self.influenceArray):
+            for pointIndex, value in zip(influenceWeights.pointIndices, 
+                                         influenceWeights.values):
+                if value == 0.0:
+                    continue
+
+                rowMap.setdefault(pointIndex, []).append((influenceIndex, value))
+
+        for pointIndex in sorted(rowMap):
+            yield pointIndex, rowMap.pop(pointIndex)
+
+
+def iterInfluenceWeights(sourceFile):
+    """
+        Stream the <weights> blocks of a deformerWeights xml file with iterparse,
+        parsed elements are cleared so only the current block is held in memory.
+
+        args:
+            sourceFile(string): xml file written by the deformerWeights command.
+
+        returns:
+            (generator of InfluenceWeights)
+    """
+    rootElement = None
+
+    influenceWeights = None
+
+    with open(sourceFile, 'rb') as inputFile:
+        for event, element in xml.etree.ElementTree.iterparse(inputFile, 
+                                                               events=('start', 'end')):
+            if event == 'start':
+                if rootElement is None:
+                    rootElement = element
+
+                elif element.tag == 'weights':
+                    influenceWeights = InfluenceWeights(element.get('deformer'),
+                                                        element.get('shape'),
+                                                        element.get('source'),
+                                                        defaultValue=float(element.get('defaultValue') or 0.0))
+
+                continue
+
+            if element.tag == 'point' and influenceWeights is not None:
+                influenceWeights.pointIndices.append(int(element.get('index')))
+                influenceWeights.values.append(float(element.get('value')))
+
+                element.clear()
+
+            elif element.tag == 'weights':
+                yield influenceWeights
+
+                influenceWeights = None
+
+                rootElement.clear()
+
+            elif element.tag == 'shape':
+                rootElement.clear()
+
+
+class WeightsLayout(object):
+    """
+        Header, shape sizes and influence order of every deformer of a deformerWeights 
+        xml file, read in a single pass without keeping any point.
+    """
+    def __init__(self):
+        #Attributes of the <headerInfo> element
+        self.headerInfo = {}
+
+        #{shape: point count}
+        self.shapeSizes = {}
+
+        #{deformerName: SkinWeights without point data}, in file order
+        self.skinMap = collections.OrderedDict()
+
+    @property
+    def skinArray(self):
+        return list(self.skinMap.values())
+
+    def add(self,
+            influenceWeights):
+        """
+            Register a <weights> block, blocks of a deformer don't need to be consecutive.
+        """
+        skinWeights = self.skinMap.get(influenceWeights.deformerName)
+
+        if skinWeights is None:
+            skinWeights = SkinWeights(influenceWeights.deformerName,
+                                      influenceWeights.shape,
+                                      self.shapeSizes.get(influenceWeights.shape, 0))
+
+            self.skinMap[influenceWeights.deformerName] = skinWeights
+
+        if skinWeights.shape != influenceWeights.shape:
+            raise payloads.ArchiveError('{0} deforms several shapes, {1} and {2}'.format(skinWeights.deformerName,
+                                                                                       skinWeights.shape,
+                                                                                       influenceWeights.shape))
+
+        if influenceWeights.source in skinWeights.influences:
+            raise payloads.ArchiveError('{0} weights of {1} are written twice'.format(influenceWeights.source,
+                                                                                     skinWeights.deformerName))
+
+        skinWeights.add(influenceWeights)
+
+    def getBlockCount(self,
+                      deformerName):
+        return len(self.skinMap[deformerName].influenceArray)
+
+
+def readLayout(sourceFile):
+    """
+        args:
+            sourceFile(string): xml file written by the deformerWeights command.
+
+        returns:
+            (WeightsLayout)
+    """
+    layout = WeightsLayout()
+
+    rootElement = None
+
+    with open(sourceFile, 'rb') as inputFile:
+        for event, element in xml.etree.ElementTree.iterparse(inputFile, 
+                                                               events=('start', 'end')):
+            if event == 'start':
+                if rootElement is None:
+                    rootElement = element
+
+                elif element.tag == 'shape':
+                    layout.shapeSizes[element.get('name')] = int(element.get('size') or 0)
+
+                elif element.tag == 'weights':
+                    layout.add(InfluenceWeights(element.get('deformer'),
+                                                element.get('shape'),
+                                                element.get('source'),
+                                                defaultValue=float(element.get('defaultValue') or 0.0)))
+
+                continue
+
+            if element.tag == 'headerInfo':
+                layout.headerInfo = dict(element.attrib)
+
+            elif element.tag == 'point':
+                element.clear()
+
+            elif element.tag in ('shape', 'weights'):
+                rootElement.clear()
+
+    return layout
+
+
+def iterSkins(sourceFile,
+              layout=None):
+    """
+        Group the streamed <weights> blocks by deformer, a skin is yielded 
+        once all of its blocks are read.
+
+        args:
+            sourceFile(string): deformerWeights xml file.
+
+            layout(WeightsLayout): layout of sourceFile, read when None.
+
+        returns:
+            (generator of SkinWeights)
+    """
+    if layout is None:
+        layout = readLayout(sourceFile)
+
+    pendingSkinMap = {}
+
+    for influenceWeights in iterInfluenceWeights(sourceFile):
+        if influenceWeights.defaultValue != 0.0:
+            raise payloads.ArchiveError('{0} weights of {1} use a non zero default value'.format(influenceWeights.source,
+                                                                                                   influenceWeights.deformerName))
+
+        skinWeights = pendingSkinMap.get(influenceWeights.deformerName)
+
+        if skinWeights is None:
+            skinWeights = SkinWeights(influenceWeights.deformerName,
+                                      influenceWeights.shape,
+                                      layout.shapeSizes.get(influenceWeights.shape, 0))
+
+            pendingSkinMap[influenceWeights.deformerName] = skinWeights
+
+        skinWeights.add(influenceWeights)
+
+        if len(skinWeights.influenceArray) == layout.getBlockCount(skinWeights.deformerName):
+            yield pendingSkinMap.pop(skinWeights.deformerName)
@@ -0,0 +1,306 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import array
+import re
+
+from skinIO.archive import weights
+
+
+WEIGHT_PROPERTY = 'skinRepository_weights'
+
+WEIGHT_LIST_PATTERN = re.compile(r'"\.wl\[(\d+)\]\.w(?:\[(\d+)(?::(\d+))?\])?"')
+
+WEIGHT_LIST_SIZE_PATTERN = re.compile(r'-s\s+(\d+)\s+"\.wl"')
+
+MATRIX_CONNECTION_PATTERN = re.compile(r'connectAttr\s+"([^"]+)\.wm(?:\[\d+\])?"\s+"[^"]*\.ma\[(\d+)\]"')
+
+
+class ArchiveError(Exception):
+    pass
+
+
+class DecoderUnavailable(ArchiveError):
+    """
+        Raised when a payload type can't be decoded outside of Maya
+    """
+    pass
+
+
+def iterStatements(text):
+    """
+        Split maya ascii content into statements, values of a setAttr can span several lines.
+    """
+    statement = []
+
+    for line in text.splitlines():
+        line = line.strip()
+
+        if not line or line.startswith('//'):
+            continue
+
+        statement.append(line)
+
+        if line.endswith(';'):
+            yield ' '.join(statement)[:-1]
+
+            statement = []
+
+
+def getAttributeValues(statement,
+                       attributeMatch):
+    """
+        Numeric values following the attribute of a setAttr statement.
+    """
+    valueArray = []
+
+    for token in statement[attributeMatch.end():].split():
+        try:
+            valueArray.append(float(token))
+        except ValueError:
+            continue
+
+    return valueArray
+
+
+def decodeAscii(data,
+                influences):
+    """
+        Read the weightList of the skinCluster stored in a mayaAscii payload.
+
+        args:
+            data(bytes): content of the .ma payload.
+
+            influences(list of string): archived influences, in skinCluster order.
+
+        returns:
+            (WeightData)
+    """
+    if not isinstance(data, type(u'')):
+        data = data.decode('utf-8', 'replace')
+
+    influenceCount = len(influences)
+
+    #Logical .matrix index to influence column, identity unless connections say otherwise
+    columnMap = {}
+
+    shortInfluences = [influence.split('|')[-1] for influence in influences]
+
+    sparseWeights = {}
+    pointCount = 0
+
+    for statement in iterStatements(data):
+        if statement.startswith('connectAttr'):
+            connectionMatch = MATRIX_CONNECTION_PATTERN.search(statement)
+
+            if connectionMatch is None:
+                continue
+
+            influenceName = connectionMatch.group(1).split('|')[-1]
+
+            if influenceName in shortInfluences:
+                columnMap[int(connectionMatch.group(2))] = shortInfluences.index(influenceName)
+
+            continue
+
+        if not statement.startswith('setAttr'):
+            continue
+
+        sizeMatch = WEIGHT_LIST_SIZE_PATTERN.search(statement)
+
+        if sizeMatch is not None:
+            pointCount = max(pointCount, int(sizeMatch.group(1)))
+            continue
+
+        attributeMatch = WEIGHT_LIST_PATTERN.search(statement)
+
+        if attributeMatch is None or attributeMatch.group(2) is None:
+            continue
+
+        pointIndex = int(attributeMatch.group(1))
+        startIndex = int(attributeMatch.group(2))
+
+        for valueIndex, value in enumerate(getAttributeValues(statement,
+                                                              attributeMatch)):
+            sparseWeights[(pointIndex, startIndex + valueIndex)] = value
+
+        pointCount = max(pointCount, pointIndex + 1)
+
+    weightData = weights.WeightData(pointCount,
+                                    influences)
+
+    for (pointIndex, matrixIndex), value in sparseWeights.items():
+        influenceIndex = columnMap.get(matrixIndex, matrixIndex)
+
+        if influenceIndex >= influenceCount:
+            raise ArchiveError('Weight of point {0} targets matrix index {1}, only {2} influences are archived'.format(pointIndex,
+                                                                                                                        matrixIndex,
+                                                                                                                        influenceCount))
+
+        weightData.set(pointIndex,
+                       influenceIndex,
+                       value)
+
+    return weightData
+
+
+def encodeAscii(deformerName,
+                weightData):
+    """
+        Write weights as a mayaAscii skinCluster payload readable by AsciiInjection,
+        consecutive non zero weights of a point are stored in a single setAttr.
+
+        returns:
+            (string)
+    """
+    rowIterator = ((pointIndex, [(influenceIndex, value) for influenceIndex, value in enumerate(row) 
+                                 if value != 0.0]) 
+                   for pointIndex, row in enumerate(weightData.iterRows()))
+
+    return encodeSparseAscii(deformerName,
+                             weightData.pointCount,
+                             rowIterator)
+
+
+def encodeSparseAscii(deformerName,
+                      pointCount,
+                      rowIterator):
+    """
+        args:
+            deformerName(string).
+
+            pointCount(int).
+
+            rowIterator(iterable of (int, list of (int, float))): point index and its 
+            non zero weights sorted by influence index.
+
+        returns:
+            (string) mayaAscii skinCluster payload.
+    """
+    lineArray = ['//Maya ASCII skinIO weights',
+                 'requires maya "2015";',
+                 'createNode skinCluster -n "{0}";'.format(deformerName),
+                 '\tsetAttr -s {0} ".wl";'.format(pointCount)]
+
+    for pointIndex, row in rowIterator:
+        weightRuns = []
+
+        for influenceIndex, value in row:
+            if weightRuns and weightRuns[-1][0] + len(weightRuns[-1][1]) == influenceIndex:
+                weightRuns[-1][1].append(value)
+            else:
+                weightRuns.append((influenceIndex, [value]))
+
+        if len(weightRuns) == 0:
+            continue
+
+        lineArray.append('\tsetAttr -s {0} ".wl[{1}].w";'.format(sum(len(run[1]) for run in weightRuns),
+                                                                   pointIndex))
+
+        for startIndex, valueArray in weightRuns:
+            if len(valueArray) == 1:
+                attribute = '.wl[{0}].w[{1}]'.format(pointIndex, startIndex)
+            else:
+                attribute = '.wl[{0}].w[{1}:{2}]'.format(pointIndex, 
+                                                          startIndex, 
+                                                          startIndex + len(valueArray) - 1)
+
+            lineArray.append('\tsetAttr "{0}" {1};'.format(attribute,
+                                                           ' '.join(repr(value) for value in valueArray)))
+
+    return '\n'.join(lineArray) + '\n'
+
+
+def findAlembicProperty(compoundProperty,
+                        propertyName):
+    for propertyIndex in range(compoundProperty.getNumProperties()):
+        header = compoundProperty.getPropertyHeader(propertyIndex)
+
+        if header.isCompound():
+            childProperty = findAlembicProperty(compoundProperty.getProperty(propertyIndex),
+                                                propertyName)
+
+            if childProperty is not None:
+                return childProperty
+
+            continue
+
+        if header.getName() == propertyName:
+            return compoundProperty.getProperty(propertyIndex)
+
+    return None
+
+
+def decodeAlembic(abcFile,
+                  influences):
+    """
+        Read the weight array stored by AlembicInjection, requires the alembic python module.
+
+        args:
+            abcFile(string): extracted .abc payload.
+
+        returns:
+            (WeightData)
+    """
+    try:
+        from alembic import Abc
+    except ImportError:
+        raise DecoderUnavailable('alembicIO payloads need the alembic python module')
+
+    archive = Abc.IArchive(str(abcFile))
+
+    objectArray = [archive.getTop()]
+
+    while objectArray:
+        currentObject = objectArray.pop(0)
+
+        weightProperty = findAlembicProperty(currentObject.getProperties(),
+                                             WEIGHT_PROPERTY)
+
+        if weightProperty is not None:
+            break
+
+        objectArray.extend(currentObject.children)
+    else:
+        raise ArchiveError('{0} has no {1} property'.format(abcFile,
+                                                            WEIGHT_PROPERTY))
+
+    values = array.array('d', weightProperty.getValue())
+
+    return fromFlatValues(values,
+                          influences)
+
+
+def fromFlatValues(values,
+                   influences):
+    influenceCount = max(len(influences), 1)
+
+    if len(values) % influenceCount != 0:
+        raise ArchiveError('{0} weights can not be split over {1} influences'.format(len(values),
+                                                                                     influenceCount))
+
+    return weights.WeightData(len(values) // influenceCount,
+                              influences,
+                              values)
@@ -0,0 +1,243 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+from skinIO.archive import payloads
+from skinIO.core import serialization
+
+
+class SkinPayload(object):
+    """
+        Metadata of one archived skin and access to its decoded weights
+    """
+    def __init__(self,
+                 reader,
+                 skinSettings):
+        self.reader = reader
+        self.skinSettings = skinSettings
+
+        self.memberName = None
+
+        if skinSettings.abcWeightsFile:
+            self.memberName = os.path.basename(skinSettings.abcWeightsFile)
+
+    @property
+    def deformerName(self):
+        return self.skinSettings.deformerName
+
+    @property
+    def shape(self):
+        return self.skinSettings.shape
+
+    @property
+    def influences(self):
+        return self.skinSettings.influences
+
+    def getMemberInfo(self):
+        """
+            returns:
+                (ZipInfo) or None when the payload is missing from the archive.
+        """
+        if self.memberName is None:
+            return None
+
+        return self.reader.getMemberInfo(self.memberName)
+
+    def decode(self):
+        """
+            returns:
+                (WeightData)
+        """
+        return self.reader.decodePayload(self)
+
+    def toDict(self):
+        memberInfo = self.getMemberInfo()
+
+        return {'deformerName': self.deformerName,
+                'shape': self.shape,
+                'influences': len(self.influences),
+                'member': self.memberName,
+                'bytes': memberInfo.file_size if memberInfo else 0,
+                'compressedBytes': memberInfo.compress_size if memberInfo else 0}
+
+
+class ArchiveReader(object):
+    """
+        Maya free access to a skinIO archive: injection settings (.mod), 
+        skin metadata (.skn or legacy .json) and weight payloads.
+        Skins are parsed from the metadata on first access.
+    """
+    MOD_EXTENSION = '.mod'
+
+    SKN_EXTENSION = serialization.SkinMetadata.EXTENSION
+
+    JSON_EXTENSION = serialization.SkinMetadata.LEGACY_EXTENSION
+
+    SHARD_MANIFEST_EXTENSION = '.shards'
+
+    def __init__(self,
+                 archiveFile):
+        self.archiveFile = archiveFile
+
+        self.archive = zipfile.ZipFile(archiveFile, 'r')
+
+        self.injectionSettings = None
+
+        self.shardManifest = None
+
+        self.skinMetadata = serialization.SkinMetadata()
+
+        #SkinPayload per deformerName, filled on demand
+        self.skinPayloadMap = {}
+
+        self.readMetadata()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.archive.close()
+
+    @property
+    def weightMode(self):
+        return str(self.injectionSettings.weightMode)
+
+    @property
+    def skinArray(self):
+        return [self.getSkin(deformerName) for deformerName in self.skinMetadata.keys()]
+
+    @property
+    def isSharded(self):
+        return self.shardManifest is not None
+
+    def getMemberNames(self,
+                       extension):
+        return [info.filename for info in self.archive.infolist() 
+                if info.filename.endswith(extension)]
+
+    def getMemberInfo(self,
+                      memberName):
+        try:
+            return self.archive.getinfo(memberName)
+        except KeyError:
+            return None
+
+    def readJson(self,
+                 memberName):
+        return json.loads(self.archive.read(memberName).decode('utf-8'))
+
+    def readMetadata(self):
+        modArray = self.getMemberNames(self.MOD_EXTENSION)
+
+        if len(modArray) == 0:
+            raise payloads.ArchiveError('{0} has no {1} settings'.format(self.archiveFile,
+                                                                         self.MOD_EXTENSION))
+
+        self.injectionSettings = serialization.InjectionSettings(None)
+        self.injectionSettings.fromJson(self.readJson(modArray[0]))
+
+        manifestArray = self.getMemberNames(self.SHARD_MANIFEST_EXTENSION)
+
+        if len(manifestArray) > 0:
+            self.shardManifest = self.readJson(manifestArray[0])
+            return
+
+        metadataArray = self.getMemberNames(self.SKN_EXTENSION) or self.getMemberNames(self.JSON_EXTENSION)
+
+        if len(metadataArray) == 0:
+            raise payloads.ArchiveError('{0} has no {1} skin metadata'.format(self.archiveFile,
+                                                                              self.SKN_EXTENSION))
+
+        self.skinMetadata = serialization.SkinMetadata.fromMember(metadataArray[0],
+                                                                  self.archive.read(metadataArray[0]))
+
+    def getShardFiles(self):
+        """
+            returns:
+                (list of string) shard archive paths listed by the manifest.
+        """
+        if self.shardManifest is None:
+            return []
+
+        archiveDirectory = os.path.dirname(self.archiveFile)
+
+        return [os.path.join(archiveDirectory, shardData['file']) 
+                for shardData in self.shardManifest['shards']]
+
+    def getSkin(self,
+                deformerName):
+        if deformerName not in self.skinMetadata:
+            return None
+
+        if deformerName not in self.skinPayloadMap:
+            self.skinPayloadMap[deformerName] = SkinPayload(self,
+                                                            self.skinMetadata.getSkinSettings(deformerName))
+
+        return self.skinPayloadMap[deformerName]
+
+    def decodePayload(self,
+                      skinPayload):
+        """
+            Decode the weights of one skin according to the archive weightMode.
+
+            returns:
+                (WeightData)
+        """
+        if skinPayload.getMemberInfo() is None:
+            raise payloads.ArchiveError('{0} payload {1} is missing'.format(skinPayload.deformerName,
+                                                                            skinPayload.memberName))
+
+        if self.weightMode == 'mayaAscii':
+            return payloads.decodeAscii(self.archive.read(skinPayload.memberName),
+                                        skinPayload.influences)
+
+        if self.weightMode == 'alembicIO':
+            unpackDirectory = tempfile.mkdtemp(prefix='skinIO_')
+
+            try:
+                abcFile = self.archive.extract(skinPayload.memberName,
+                                               unpackDirectory)
+
+                return payloads.decodeAlembic(abcFile,
+                                              skinPayload.influences)
+            finally:
+                shutil.rmtree(unpackDirectory)
+
+        raise payloads.DecoderUnavailable('{0} payloads can only be decoded by Maya'.format(self.weightMode))
+
+    def testMembers(self):
+        """
+            returns:
+                (string) name of the first corrupted member or None.
+        """
+        return self.archive.testzip()
@@ -0,0 +1,128 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+try:
+    xrange
+except NameError:
+    xrange = range
+
+
+class WeightData(object):
+    """
+        Dense point-major weights of one skin, values[pointIndex * influenceCount + influenceIndex].
+        Values are held in an array.array('d'), toNumpy gives a (points, influences) view when NumPy is installed.
+    """
+    def __init__(self,
+                 pointCount,
+                 influences,
+                 values=None):
+        self.pointCount = pointCount
+        self.influences = list(influences)
+
+        if values is None:
+            values = array.array('d', [0.0]) * (pointCount * len(self.influences))
+
+        self.values = values
+
+    @property
+    def influenceCount(self):
+        return len(self.influences)
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self,
+            pointIndex,
+            influenceIndex):
+        return self.values[pointIndex * self.influenceCount + influenceIndex]
+
+    def set(self,
+            pointIndex,
+            influenceIndex,
+            value):
+        self.values[pointIndex * self.influenceCount + influenceIndex] = value
+
+    def getRow(self,
+               pointIndex):
+        startIndex = pointIndex * self.influenceCount
+
+        return self.values[startIndex:startIndex + self.influenceCount]
+
+    def iterRows(self):
+        for pointIndex in xrange(self.pointCount):
+            yield self.getRow(pointIndex)
+
+    def toNumpy(self):
+        """
+            returns:
+                (numpy.ndarray) shaped (pointCount, influenceCount), sharing memory with values.
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required to build weight matrices')
+
+        return numpy.frombuffer(self.values, dtype=numpy.float64).reshape(self.pointCount, 
+                                                                           self.influenceCount)
+
+    def getNonZeroCount(self):
+        if numpy is not None and len(self.values) > 0:
+            return int(numpy.count_nonzero(self.toNumpy()))
+
+        return sum(1 for value in self.values if value != 0.0)
+
+    def getMaxInfluences(self):
+        """
+            returns:
+                (int) highest number of non zero weights on a single point.
+        """
+        if self.pointCount == 0 or self.influenceCount == 0:
+            return 0
+
+        if numpy is not None:
+            return int(numpy.count_nonzero(self.toNumpy(), axis=1).max())
+
+        return max(sum(1 for value in row if value != 0.0) for row in self.iterRows())
+
+    def getSums(self):
+        """
+            returns:
+                (list of float) weight sum of every point.
+        """
+        if numpy is not None and self.influenceCount > 0:
+            return self.toNumpy().sum(axis=1).tolist()
+
+        return [sum(row) for row in self.iterRows()]
+
+    def toDict(self):
+        return {'pointCount': self.pointCount,
+                'influences': self.influences,
+                'weights': [list(row) for row in self.iterRows()]}
@@ -0,0 +1,496 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+OPERATIONS = ('export',
+              'import')
+
+SKIN_PROCESSING_METHOD = ('alembicIO',
+                          'mayaBinary',
+                          'mayaAscii')
+
+
+class BatchJob(object):
+    """
+        One scene/archive pair processed by a mayapy worker
+    """
+    def __init__(self,
+                 operation,
+                 scene,
+                 archive,
+                 method='alembicIO',
+                 saveScene=False,
+                 checkpoint=False,
+                 shardCount=0):
+        self.operation = operation
+        self.scene = os.path.abspath(scene)
+        self.archive = os.path.abspath(archive)
+        self.method = method
+        self.saveScene = saveScene
+        self.checkpoint = checkpoint
+        self.shardCount = shardCount
+
+        self.status = 'pending'
+        self.attempts = 0
+        self.returnCode = None
+        self.duration = 0.0
+        self.result = {}
+        self.errors = []
+
+    def getCommand(self,
+                   mayapy,
+                   resultFile):
+        command = [mayapy,
+                   '-m', 'skinIO',
+                   'worker',
+                   '--operation', self.operation,
+                   '--scene', self.scene,
+                   '--archive', self.archive,
+                   '--method', self.method,
+                   '--result', resultFile]
+
+        if self.saveScene is True:
+            command.append('--save')
+
+        if self.checkpoint is True:
+            command.append('--checkpoint')
+
+        if self.shardCount > 0:
+            command.extend(['--shards', str(self.shardCount)])
+
+        return command
+
+    def toDict(self):
+        return {'operation': self.operation,
+                'scene': self.scene,
+                'archive': self.archive,
+                'method': self.method,
+                'status': self.status,
+                'attempts': self.attempts,
+                'returnCode': self.returnCode,
+                'duration': self.duration,
+                'result': self.result,
+                'errors': self.errors}
+
+
+class WorkerPool(object):
+    """
+        Run BatchJobs over a pool of mayapy processes with per job timeout and retries
+    """
+    POLL_INTERVAL = 0.5
+
+    def __init__(self,
+                 mayapy='mayapy',
+                 workerCount=None,
+                 timeout=None,
+                 retries=0):
+        self.mayapy = mayapy
+        self.workerCount = workerCount or multiprocessing.cpu_count()
+        self.timeout = timeout
+        self.retries = retries
+
+        self.logger = logging.getLogger('skinIO.batch')
+
+    def getEnvironment(self):
+        environment = dict(os.environ)
+
+        pythonPath = environment.get('PYTHONPATH', '')
+        pythonPathArray = [path for path in pythonPath.split(os.pathsep) if path]
+
+        if PACKAGE_ROOT not in pythonPathArray:
+            pythonPathArray.insert(0, PACKAGE_ROOT)
+
+        environment['PYTHONPATH'] = os.pathsep.join(pythonPathArray)
+
+        return environment
+
+    def waitForProcess(self,
+                       process):
+        """
+            Wait for a worker process, killing it once the timeout is reached.
+
+            returns:
+                (bool) True when the process ended before the timeout.
+        """
+        startTime = time.time()
+
+        while process.poll() is None:
+            if self.timeout is not None and time.time() - startTime > self.timeout:
+                process.kill()
+                process.wait()
+
+                return False
+
+            time.sleep(self.POLL_INTERVAL)
+
+        return True
+
+    def runAttempt(self,
+                   job):
+        resultHandle, resultFile = tempfile.mkstemp(prefix='skinIO_', 
+                                                    suffix='.json')
+        os.close(resultHandle)
+
+        job.result = {}
+
+        try:
+            process = subprocess.Popen(job.getCommand(self.mayapy, resultFile),
+                                       env=self.getEnvironment())
+
+            if not self.waitForProcess(process):
+                job.errors.append('timeout after {0} seconds'.format(self.timeout))
+                return False
+
+            job.returnCode = process.returncode
+
+            if os.path.getsize(resultFile) > 0:
+                with open(resultFile, 'r') as resultStream:
+                    job.result = json.load(resultStream)
+
+            if job.returnCode != 0 or job.result.get('status') != 'ok':
+                job.errors.append(job.result.get('error', 'worker exited with code {0}'.format(job.returnCode)))
+                return False
+
+            return True
+        except OSError as error:
+            job.errors.append(str(error))
+            return False
+        finally:
+            if os.path.exists(resultFile):
+                os.remove(resultFile)
+
+    def runJob(self,
+               job):
+        startTime = time.time()
+
+        job.status = 'running'
+
+        while job.attempts <= self.retries:
+            job.attempts += 1
+
+            self.logger.info('%s %s -> %s (attempt %d)',
+                             job.operation,
+                             job.scene,
+                             job.archive,
+                             job.attempts)
+
+            if self.runAttempt(job):
+                job.status = 'succeeded'
+                break
+        else:
+            job.status = 'failed'
+
+        job.duration = time.time() - startTime
+
+        self.logger.info('%s %s: %s in %.2f seconds',
+                         job.operation,
+                         job.scene,
+                         job.status,
+                         job.duration)
+
+        return job
+
+    def run(self,
+            jobArray):
+        """
+            args:
+                jobArray(list of BatchJob).
+
+            returns:
+                (list of BatchJob)
+        """
+        if len(jobArray) == 0:
+            return []
+
+        workerPool = multiprocessing.pool.ThreadPool(min(self.workerCount, len(jobArray)))
+
+        try:
+            return workerPool.map(self.runJob, jobArray)
+        finally:
+            workerPool.close()
+            workerPool.join()
+
+
+def getSummary(jobArray,
+               duration):
+    """
+        Merge the result of every job in a single document.
+
+        returns:
+            (dict)
+    """
+    return {'jobs': [job.toDict() for job in jobArray],
+            'succeeded': len([job for job in jobArray if job.status == 'succeeded']),
+            'failed': len([job for job in jobArray if job.status != 'succeeded']),
+            'duration': duration}
+
+
+def getSkinnedTransforms():
+    """
+        Transforms of every shape deformed by a skinCluster in the current scene.
+    """
+    import maya.cmds
+
+    transformArray = []
+
+    for skinCluster in maya.cmds.ls(type='skinCluster') or []:
+        for shape in maya.cmds.skinCluster(skinCluster, q=True, geometry=True) or []:
+            parentArray = maya.cmds.listRelatives(shape, p=True, fullPath=True) or []
+
+            for transform in parentArray:
+                if transform not in transformArray:
+                    transformArray.append(transform)
+
+    return transformArray
+
+
+def runWorker(arguments):
+    """
+        Process one job inside mayapy and write its result json.
+    """
+    startTime = time.time()
+
+    result = {'status': 'error',
+              'operation': arguments.operation,
+              'scene': arguments.scene,
+              'archive': arguments.archive}
+
+    standaloneModule = None
+
+    try:
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+
+        standaloneModule = maya.standalone
+
+        import maya.cmds
+
+        from skinIO import skinUtils
+        from skinIO.core import progress
+
+        maya.cmds.file(arguments.scene,
+                       open=True,
+                       force=True)
+
+        skinManager = skinUtils.SkinIO()
+        skinManager.skinHandler = arguments.method
+        skinManager.progressReporter = progress.LoggerProgressReporter()
+        skinManager.checkpointExport = arguments.checkpoint
+        skinManager.shardCount = arguments.shards
+
+        if arguments.operation == 'export':
+            objectArray = getSkinnedTransforms()
+
+            if len(objectArray) == 0:
+                raise RuntimeError('No skinned objects found in {0}'.format(arguments.scene))
+
+            processingTime = skinManager.exportAssetWeights(objectArray,
+                                                            arguments.archive,
+                                                            exposeWeightDetails=False,
+                                                            showProgressbar=False)
+
+            if not isinstance(processingTime, float):
+                raise RuntimeError('Unable to export {0}: {1}'.format(arguments.archive,
+                                                                     processingTime))
+
+            result['skinCount'] = len(skinManager.skinProcessor.sceneWeights)
+        else:
+            processingTime = skinManager.importAssetWeights(arguments.archive,
+                                                            exposeWeightDetails=False,
+                                                            showProgressbar=False)
+
+            if processingTime is None or processingTime is False:
+                #Failed shards are named in the report
+                if skinManager.skinProcessor is not None:
+                    result['report'] = skinManager.skinProcessor.batchProcessing.report
+
+                raise RuntimeError('Unable to import {0}'.format(arguments.archive))
+
+            result['skinCount'] = skinManager.skinProcessor.batchProcessing.processObjectCount
+
+            if arguments.save is True:
+                maya.cmds.file(save=True,
+                               force=True)
+
+        result['report'] = skinManager.skinProcessor.batchProcessing.report
+        result['status'] = 'ok'
+    except Exception as error:
+        result['error'] = '{0}: {1}'.format(error.__class__.__name__, error)
+
+    result['duration'] = time.time() - startTime
+
+    try:
+        with open(arguments.result, 'w') as resultStream:
+            json.dump(result, resultStream, indent=2)
+    finally:
+        #mayapy 2016+ can crash or hang on exit when standalone isn't uninitialized
+        if standaloneModule is not None:
+            standaloneModule.uninitialize()
+
+    return 0 if result['status'] == 'ok' else 1
+
+
+def readJobsFile(jobsFile,
+                 operation,
+                 method,
+                 saveScene,
+                 checkpoint,
+                 shardCount):
+    """
+        Read a json list of {"scene": ..., "archive": ...} entries.
+    """
+    with open(jobsFile, 'r') as jobStream:
+        jobData = json.load(jobStream)
+
+    return [BatchJob(operation,
+                     entry['scene'],
+                     entry['archive'],
+                     method=entry.get('method', method),
+                     saveScene=entry.get('save', saveScene),
+                     checkpoint=checkpoint,
+                     shardCount=entry.get('shards', shardCount))
+            for entry in jobData]
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(prog='python -m skinIO',
+                                     description='Export or import skin weights of many scenes with a pool of mayapy workers.')
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    for operation in OPERATIONS:
+        operationParser = subparsers.add_parser(operation)
+
+        operationParser.add_argument('--job', nargs=2, action='append', default=[],
+                                     metavar=('SCENE', 'ARCHIVE'),
+                                     help='scene file and archive file, can be repeated')
+        operationParser.add_argument('--jobs-file', dest='jobsFile',
+                                     help='json list of {"scene": ..., "archive": ...}')
+        operationParser.add_argument('--method', default='alembicIO',
+                                     choices=SKIN_PROCESSING_METHOD)
+        operationParser.add_argument('--workers', type=int, default=None,
+                                     help='number of mayapy processes (cpu count by default)')
+        operationParser.add_argument('--timeout', type=float, default=None,
+                                     help='seconds allowed per job attempt')
+        operationParser.add_argument('--retries', type=int, default=0)
+        operationParser.add_argument('--mayapy', default=os.environ.get('MAYAPY', 'mayapy'))
+        operationParser.add_argument('--summary',
+                                     help='merged json summary file')
+
+        if operation == 'import':
+            operationParser.add_argument('--save', action='store_true',
+                                         help='save scenes after import')
+        else:
+            operationParser.add_argument('--checkpoint', action='store_true',
+                                         help='resume interrupted exports from their journal')
+            operationParser.add_argument('--shards', type=int, default=0,
+                                         help='split skins over this many shard archives')
+
+    workerParser = subparsers.add_parser('worker')
+    workerParser.add_argument('--operation', choices=OPERATIONS, required=True)
+    workerParser.add_argument('--scene', required=True)
+    workerParser.add_argument('--archive', required=True)
+    workerParser.add_argument('--method', default='alembicIO',
+                              choices=SKIN_PROCESSING_METHOD)
+    workerParser.add_argument('--result', required=True)
+    workerParser.add_argument('--save', action='store_true')
+    workerParser.add_argument('--checkpoint', action='store_true')
+    workerParser.add_argument('--shards', type=int, default=0)
+
+    return parser
+
+
+def main(argumentArray=None):
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s %(name)s %(message)s')
+
+    parser = buildParser()
+    arguments = parser.parse_args(argumentArray)
+
+    if arguments.command is None:
+        parser.print_help()
+        return 2
+
+    if arguments.command == 'worker':
+        return runWorker(arguments)
+
+    saveScene = getattr(arguments, 'save', False)
+    checkpoint = getattr(arguments, 'checkpoint', False)
+    shardCount = getattr(arguments, 'shards', 0)
+
+    jobArray = [BatchJob(arguments.command,
+                         scene,
+                         archive,
+                         method=arguments.method,
+                         saveScene=saveScene,
+                         checkpoint=checkpoint,
+                         shardCount=shardCount)
+                for scene, archive in arguments.job]
+
+    if arguments.jobsFile:
+        jobArray.extend(readJobsFile(arguments.jobsFile,
+                                     arguments.command,
+                                     arguments.method,
+                                     saveScene,
+                                     checkpoint,
+                                     shardCount))
+
+    if len(jobArray) == 0:
+        parser.error('no job provided')
+
+    startTime = time.time()
+
+    workerPool = WorkerPool(mayapy=arguments.mayapy,
+                            workerCount=arguments.workers,
+                            timeout=arguments.timeout,
+                            retries=arguments.retries)
+
+    workerPool.run(jobArray)
+
+    summary = getSummary(jobArray,
+                         time.time() - startTime)
+
+    summaryData = json.dumps(summary, indent=2, sort_keys=True)
+
+    if arguments.summary:
+        with open(arguments.summary, 'w') as summaryStream:
+            summaryStream.write(summaryData)
+    else:
+        sys.stdout.write(summaryData + '\n')
+
+    return 0 if summary['failed'] == 0 else 1
@@ -0,0 +1,623 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import array
+import collections
+import hashlib
+import os
+import threading
+import time
+import uuid
+import zipfile
+
+
+class DecodeCache(object):
+    """
+        Process wide LRU cache of decoded archive members, keyed by archive path, 
+        modification time, size and member name so edited archives are never served stale.
+        The cache is disabled unless SKINIO_DECODE_CACHE_MB or setMemoryCap gives it a size,
+        one-shot imports don't keep a copy of every payload.
+    """
+    ENVIRONMENT_VARIABLE = 'SKINIO_DECODE_CACHE_MB'
+
+    DEFAULT_MEMORY_CAP = 0
+
+    #Largest entry accepted, as a fraction of memoryCap
+    MAX_ENTRY_RATIO = 0.25
+
+    def __init__(self,
+                 memoryCap=None):
+        if memoryCap is None:
+            memoryCap = self.getDefaultMemoryCap()
+
+        self.memoryCap = memoryCap
+        self.byteSize = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        #{key: (value, byteSize)} from least to most recently used
+        self.entries = collections.OrderedDict()
+
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self,
+                     key):
+        return key in self.entries
+
+    @classmethod
+    def getDefaultMemoryCap(cls):
+        environmentValue = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+
+        if not environmentValue:
+            return cls.DEFAULT_MEMORY_CAP
+
+        return int(float(environmentValue) * 1024 * 1024)
+
+    @staticmethod
+    def getArchiveKey(archiveFile):
+        """
+            returns:
+                (tuple) absolute path, modification time and size of archiveFile.
+        """
+        archiveStat = os.stat(archiveFile)
+
+        return (os.path.abspath(archiveFile),
+                archiveStat.st_mtime,
+                archiveStat.st_size)
+
+    def getKey(self,
+               archiveFile,
+               member):
+        return self.getArchiveKey(archiveFile) + (member,)
+
+    def isEnabled(self):
+        return self.memoryCap > 0
+
+    def get(self,
+            key):
+        """
+            returns:
+                cached value or None.
+        """
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+
+            entry = self.entries.pop(key)
+            self.entries[key] = entry
+
+            self.hits += 1
+
+            return entry[0]
+
+    def put(self,
+            key,
+            value,
+            byteSize):
+        """
+            Store value, evicting least recently used entries above memoryCap.
+
+            returns:
+                (bool) False when value is larger than MAX_ENTRY_RATIO of the cache.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.byteSize -= self.entries.pop(key)[1]
+
+            if byteSize > self.memoryCap * self.MAX_ENTRY_RATIO:
+                return False
+
+            self.entries[key] = (value, byteSize)
+            self.byteSize += byteSize
+
+            self.evict()
+
+            return True
+
+    def evict(self):
+        while self.byteSize > self.memoryCap and len(self.entries) > 0:
+            self.byteSize -= self.entries.popitem(last=False)[1][1]
+
+    def setMemoryCap(self,
+                     memoryCap):
+        with self.lock:
+            self.memoryCap = memoryCap
+
+            self.evict()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+            self.byteSize = 0
+            self.hits = 0
+            self.misses = 0
+
+    def getStats(self):
+        return {'entries': len(self.entries),
+                'bytes': self.byteSize,
+                'memoryCap': self.memoryCap,
+                'hits': self.hits,
+                'misses': self.misses}
+
+
+DECODE_CACHE = DecodeCache()
+
+
+def getDecodeCache():
+    return DECODE_CACHE
+
+
+class LockFile(object):
+    """
+        Cross process lock built on exclusive file creation, 
+        locks older than STALE_TIME are considered left by a dead process.
+    """
+    STALE_TIME = 120.0
+
+    def __init__(self,
+                 lockFile):
+        self.lockFile = lockFile
+
+        self.isLocked = False
+
+    def acquire(self):
+        """
+            returns:
+                (bool) True when the lock was taken, never blocks.
+        """
+        try:
+            lockHandle = os.open(self.lockFile, 
+                                 os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            if not self.isStale():
+                return False
+
+            #A single retry, the stale lock may be held by a file we can not remove
+            self.removeLockFile()
+
+            try:
+                lockHandle = os.open(self.lockFile, 
+                                     os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except OSError:
+                return False
+
+        os.write(lockHandle, str(os.getpid()).encode('ascii'))
+        os.close(lockHandle)
+
+        self.isLocked = True
+
+        return True
+
+    def isStale(self):
+        try:
+            return time.time() - os.path.getmtime(self.lockFile) > self.STALE_TIME
+        except OSError:
+            return False
+
+    def removeLockFile(self):
+        try:
+            os.remove(self.lockFile)
+        except OSError:
+            pass
+
+    def release(self):
+        if self.isLocked is False:
+            return
+
+        self.removeLockFile()
+
+        self.isLocked = False
+
+    def __enter__(self):
+        self.acquire()
+
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class DiskDecodeCache(object):
+    """
+        Local disk cache of uncompressed archive members shared by every process of a host,
+        entries are keyed by a hash of the archive central directory (member names, crc and sizes)
+        and evicted least recently used first above maxBytes.
+
+        Entries are published with an atomic rename so readers never see partial files,
+        eviction runs under a lock file and is skipped while another process holds it.
+        Eviction scans the whole cache directory, it runs once EVICTION_RATIO of maxBytes
+        has been written and when the owner calls evict at the end of a batch.
+    """
+    ENVIRONMENT_VARIABLE = 'SKINIO_DISK_CACHE'
+
+    SIZE_ENVIRONMENT_VARIABLE = 'SKINIO_DISK_CACHE_MB'
+
+    DEFAULT_MAX_BYTES = 8 * 1024 * 1024 * 1024
+
+    LOCK_FILE_NAME = '.lock'
+
+    TEMPORARY_SUFFIX = '.tmp'
+
+    EVICTION_RATIO = 0.1
+
+    def __init__(self,
+                 directory,
+                 maxBytes=None):
+        if maxBytes is None:
+            maxBytes = self.getDefaultMaxBytes()
+
+        self.directory = directory
+        self.maxBytes = maxBytes
+
+        #{(path, mtime, size): archive hash}
+        self.archiveHashMap = {}
+
+        #Bytes published since the last eviction scan
+        self.pendingBytes = 0
+
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):
+                    raise
+
+    @classmethod
+    def getDefaultMaxBytes(cls):
+        environmentValue = os.environ.get(cls.SIZE_ENVIRONMENT_VARIABLE)
+
+        if not environmentValue:
+            return cls.DEFAULT_MAX_BYTES
+
+        return int(float(environmentValue) * 1024 * 1024)
+
+    @classmethod
+    def fromEnvironment(cls):
+        """
+            returns:
+                (DiskDecodeCache) or None when SKINIO_DISK_CACHE isn't set.
+        """
+        directory = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+
+        if not directory:
+            return None
+
+        return cls(directory)
+
+    def getArchiveHash(self,
+                       archiveFile):
+        """
+            Hash of the archive central directory, only the end of the zip is read.
+
+            returns:
+                (string)
+        """
+        archiveKey = DecodeCache.getArchiveKey(archiveFile)
+
+        if archiveKey in self.archiveHashMap:
+            return self.archiveHashMap[archiveKey]
+
+        archiveHash = hashlib.sha1()
+
+        with zipfile.ZipFile(archiveFile, 'r') as archive:
+            for info in sorted(archive.infolist(), key=lambda info: info.filename):
+                archiveHash.update('{0}:{1}:{2}\n'.format(info.filename,
+                                                          info.CRC,
+                                                          info.file_size).encode('utf-8'))
+
+        self.archiveHashMap[archiveKey] = archiveHash.hexdigest()
+
+        return self.archiveHashMap[archiveKey]
+
+    def getEntryFile(self,
+                     archiveHash,
+                     member,
+                     extension):
+        memberHash = hashlib.sha1(member.encode('utf-8')).hexdigest()[:16]
+
+        return os.path.join(self.directory,
+                            archiveHash,
+                            '{0}.{1}'.format(memberHash, extension))
+
+    def readBytes(self,
+                  archiveHash,
+                  member,
+                  extension='bin'):
+        """
+            returns:
+                (bytes) entry content or None.
+        """
+        entryFile = self.getEntryFile(archiveHash,
+                                      member,
+                                      extension)
+
+        try:
+            with open(entryFile, 'rb') as entryStream:
+                data = entryStream.read()
+        except (IOError, OSError):
+            return None
+
+        self.touch(entryFile)
+
+        return data
+
+    def readArray(self,
+                  archiveHash,
+                  member,
+                  typecode='d'):
+        """
+            Read a cached numeric payload with a single copy from the file.
+
+            returns:
+                (array.array) or None.
+        """
+        entryFile = self.getEntryFile(archiveHash,
+                                      member,
+                                      'f64' if typecode == 'd' else typecode)
+
+        try:
+            entryStream = open(entryFile, 'rb')
+        except (IOError, OSError):
+            return None
+
+        values = array.array(typecode)
+
+        with entryStream:
+            valueCount = os.fstat(entryStream.fileno()).st_size // values.itemsize
+
+            try:
+                values.fromfile(entryStream, valueCount)
+            except EOFError:
+                return None
+
+        self.touch(entryFile)
+
+        return values
+
+    def readInto(self,
+                 archiveHash,
+                 member,
+                 allocate,
+                 extension='f64'):
+        """
+            Read an entry straight into storage owned by the caller, 
+            such as the memory of a Maya array.
+
+            args:
+                allocate(callable): called with the entry size in bytes, 
+                returns a writable buffer of that size.
+
+            returns:
+                (object) what allocate returned, None when the entry is missing.
+        """
+        entryFile = self.getEntryFile(archiveHash,
+                                      member,
+                                      extension)
+
+        try:
+            entryStream = open(entryFile, 'rb')
+        except (IOError, OSError):
+            return None
+
+        with entryStream:
+            byteCount = os.fstat(entryStream.fileno()).st_size
+
+            targetBuffer = allocate(byteCount)
+
+            if byteCount > 0 and entryStream.readinto(targetBuffer) != byteCount:
+                return None
+
+        self.touch(entryFile)
+
+        return targetBuffer
+
+    def writeBytes(self,
+                   archiveHash,
+                   member,
+                   data,
+                   extension='bin'):
+        return self.publish(self.getEntryFile(archiveHash,
+                                              member,
+                                              extension),
+                            data)
+
+    def writeArray(self,
+                   archiveHash,
+                   member,
+                   values,
+                   typecode='d'):
+        """
+            args:
+                values(iterable of numbers): payload, stored uncompressed in native byte order.
+        """
+        if not isinstance(values, array.array):
+            values = array.array(typecode, values)
+
+        data = values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+        return self.publish(self.getEntryFile(archiveHash,
+                                              member,
+                                              'f64' if typecode == 'd' else typecode),
+                            data)
+
+    def publish(self,
+                entryFile,
+                data):
+        """
+            Write data next to entryFile then rename it in place.
+
+            returns:
+                (string) entry file path or None when the write failed.
+        """
+        if len(data) > self.maxBytes:
+            return None
+
+        entryDirectory = os.path.dirname(entryFile)
+
+        temporaryFile = '{0}.{1}.{2}{3}'.format(entryFile,
+                                                os.getpid(),
+                                                uuid.uuid4().hex[:8],
+                                                self.TEMPORARY_SUFFIX)
+
+        try:
+            if not os.path.isdir(entryDirectory):
+                os.makedirs(entryDirectory)
+        except OSError:
+            if not os.path.isdir(entryDirectory):
+                return None
+
+        try:
+            with open(temporaryFile, 'wb') as entryStream:
+                entryStream.write(data)
+
+            if hasattr(os, 'replace'):
+                os.replace(temporaryFile, entryFile)
+            else:
+                os.rename(temporaryFile, entryFile)
+        except (IOError, OSError):
+            #Another process may already have published the same entry
+            if os.path.exists(temporaryFile):
+                os.remove(temporaryFile)
+
+            return None
+
+        self.pendingBytes += len(data)
+
+        if self.pendingBytes >= self.maxBytes * self.EVICTION_RATIO:
+            self.evict()
+
+        return entryFile
+
+    def touch(self,
+              entryFile):
+        try:
+            os.utime(entryFile, None)
+        except OSError:
+            pass
+
+    def getEntries(self):
+        """
+            returns:
+                (list of tuple) (last use time, size, path) of every published entry.
+        """
+        entryArray = []
+
+        for rootDirectory, directoryArray, fileArray in os.walk(self.directory):
+            for fileName in fileArray:
+                if fileName == self.LOCK_FILE_NAME or fileName.endswith(self.TEMPORARY_SUFFIX):
+                    continue
+
+                entryFile = os.path.join(rootDirectory, fileName)
+
+                try:
+                    entryStat = os.stat(entryFile)
+                except OSError:
+                    continue
+
+                entryArray.append((entryStat.st_mtime, 
+                                   entryStat.st_size, 
+                                   entryFile))
+
+        return entryArray
+
+    def getSize(self):
+        return sum(entry[1] for entry in self.getEntries())
+
+    def evict(self):
+        """
+            Remove least recently used entries until the cache fits in maxBytes.
+
+            returns:
+                (int) number of removed entries.
+        """
+        self.pendingBytes = 0
+
+        entryArray = self.getEntries()
+
+        cacheSize = sum(entry[1] for entry in entryArray)
+
+        if cacheSize <= self.maxBytes:
+            return 0
+
+        lockFile = LockFile(os.path.join(self.directory,
+                                         self.LOCK_FILE_NAME))
+
+        removedCount = 0
+
+        with lockFile:
+            if lockFile.isLocked is False:
+                return 0
+
+            for lastUseTime, entrySize, entryFile in sorted(entryArray):
+                if cacheSize <= self.maxBytes:
+                    break
+
+                try:
+                    os.remove(entryFile)
+                except OSError:
+                    continue
+
+                cacheSize -= entrySize
+                removedCount += 1
+
+        return removedCount
+
+    def clear(self):
+        lockFile = LockFile(os.path.join(self.directory,
+                                         self.LOCK_FILE_NAME))
+
+        with lockFile:
+            if lockFile.isLocked is False:
+                return False
+
+            for lastUseTime, entrySize, entryFile in self.getEntries():
+                try:
+                    os.remove(entryFile)
+                except OSError:
+                    continue
+
+        self.archiveHashMap = {}
+
+        return True
+
+
+DISK_CACHES = {}
+
+
+def getDiskCache(directory):
+    """
+        returns:
+            (DiskDecodeCache) shared instance for directory.
+    """
+    if directory not in DISK_CACHES:
+        DISK_CACHES[directory] = DiskDecodeCache(directory)
+
+    return DISK_CACHES[directory]
@@ -0,0 +1,218 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+try:
+    import maya.OpenMaya 
+except ImportError:
+    #Outside of Maya only the index conversions can be used
+    pass
+
+import array
+
+
+try:
+    xrange
+except NameError:
+    xrange = range
+
+
+#Flat point indices follow the skinCluster weightList order:
+#   nurbsSurface: pointIndex = u * vCount + v
+#   lattice: pointIndex = s + t * sCount + u * sCount * tCount
+
+
+def getPointRange(startIndex,
+                  endIndex):
+    """
+        returns:
+            (array of int) points [startIndex, endIndex[.
+    """
+    return array.array('i', xrange(startIndex, endIndex))
+
+
+def getDoubleIndices(pointIndices,
+                     vCount):
+    """
+        Map flat point indices to surface (u, v) indices.
+
+        args:
+            pointIndices(sequence of int).
+
+            vCount(int): number of CVs in V.
+
+        returns:
+            (array of int, array of int) u and v indices.
+    """
+    uIndices = array.array('i', [pointIndex // vCount for pointIndex in pointIndices])
+    vIndices = array.array('i', [pointIndex % vCount for pointIndex in pointIndices])
+
+    return uIndices, vIndices
+
+
+def getTripleIndices(pointIndices,
+                     sCount,
+                     tCount):
+    """
+        Map flat point indices to lattice (s, t, u) indices.
+
+        args:
+            pointIndices(sequence of int).
+
+            sCount(int): lattice S divisions.
+
+            tCount(int): lattice T divisions.
+
+        returns:
+            (array of int, array of int, array of int) s, t and u indices.
+    """
+    layerCount = sCount * tCount
+
+    sIndices = array.array('i', [pointIndex % sCount for pointIndex in pointIndices])
+    tIndices = array.array('i', [(pointIndex // sCount) % tCount for pointIndex in pointIndices])
+    uIndices = array.array('i', [pointIndex // layerCount for pointIndex in pointIndices])
+
+    return sIndices, tIndices, uIndices
+
+
+def getFlatIndices(componentIndices,
+                   componentCounts):
+    """
+        Inverse of getDoubleIndices and getTripleIndices.
+
+        args:
+            componentIndices(tuple of int sequences): (u, v) or (s, t, u) indices.
+
+            componentCounts(tuple of int): (uCount, vCount) or (sCount, tCount, uCount).
+
+        returns:
+            (array of int)
+    """
+    if len(componentIndices) == 1:
+        return array.array('i', componentIndices[0])
+
+    if len(componentIndices) == 2:
+        vCount = componentCounts[1]
+
+        return array.array('i', [uIndex * vCount + vIndex 
+                                 for uIndex, vIndex in zip(*componentIndices)])
+
+    sCount, tCount = componentCounts[0], componentCounts[1]
+
+    return array.array('i', [sIndex + tIndex * sCount + uIndex * sCount * tCount
+                             for sIndex, tIndex, uIndex in zip(*componentIndices)])
+
+
+def toIntArray(values):
+    """
+        returns:
+            (MIntArray)
+    """
+    intArray = maya.OpenMaya.MIntArray()
+    maya.OpenMaya.MScriptUtil.createIntArrayFromList(list(values), 
+                                                     intArray)
+
+    return intArray
+
+
+def createComponent(componentType,
+                    componentCounts,
+                    pointIndices):
+    """
+        Build a component from flat point indices in one call per index array.
+
+        args:
+            componentType(MFn.Type): kMeshVertComponent, kCurveCVComponent,
+                                     kSurfaceCVComponent or kLatticeComponent.
+
+            componentCounts(tuple of int): (pointCount,), (uCount, vCount) or (sCount, tCount, uCount).
+
+            pointIndices(sequence of int).
+
+        returns:
+            (MObject)
+    """
+    if len(componentCounts) == 1:
+        pointComponentFunction = maya.OpenMaya.MFnSingleIndexedComponent()
+        component = pointComponentFunction.create(componentType)
+
+        pointComponentFunction.addElements(toIntArray(pointIndices))
+
+        return component
+
+    if len(componentCounts) == 2:
+        uIndices, vIndices = getDoubleIndices(pointIndices,
+                                              componentCounts[1])
+
+        pointComponentFunction = maya.OpenMaya.MFnDoubleIndexedComponent()
+        component = pointComponentFunction.create(componentType)
+
+        pointComponentFunction.addElements(toIntArray(uIndices),
+                                           toIntArray(vIndices))
+
+        return component
+
+    sIndices, tIndices, uIndices = getTripleIndices(pointIndices,
+                                                    componentCounts[0],
+                                                    componentCounts[1])
+
+    pointComponentFunction = maya.OpenMaya.MFnTripleIndexedComponent()
+    component = pointComponentFunction.create(componentType)
+
+    pointComponentFunction.addElements(toIntArray(sIndices),
+                                       toIntArray(tIndices),
+                                       toIntArray(uIndices))
+
+    return component
+
+
+def getComponentStrings(shape,
+                        shapeType,
+                        componentCounts,
+                        pointIndices):
+    """
+        Component names of flat point indices, for maya.cmds queries.
+
+        returns:
+            (list of string)
+    """
+    if shapeType == 'nurbsSurface':
+        uIndices, vIndices = getDoubleIndices(pointIndices,
+                                              componentCounts[1])
+
+        return ['{0}.cv[{1}][{2}]'.format(shape, uIndex, vIndex) 
+                for uIndex, vIndex in zip(uIndices, vIndices)]
+
+    if shapeType == 'lattice':
+        sIndices, tIndices, uIndices = getTripleIndices(pointIndices,
+                                                        componentCounts[0],
+                                                        componentCounts[1])
+
+        return ['{0}.pt[{1}][{2}][{3}]'.format(shape, sIndex, tIndex, uIndex) 
+                for sIndex, tIndex, uIndex in zip(sIndices, tIndices, uIndices)]
+
+    componentName = 'cv' if shapeType == 'nurbsCurve' else 'vtx'
+
+    return ['{0}.{1}[{2}]'.format(shape, componentName, pointIndex) 
+            for pointIndex in pointIndices]
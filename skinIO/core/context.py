@@ -23,14 +23,23 @@
     https://opensource.org/licenses/MIT
 """
 
-import maya.cmds 
+try:
+    import maya.OpenMaya 
+    import maya.OpenMayaAnim 
+    import maya.cmds 
+except ImportError:
+    #Outside of Maya only TimeProcessor and TemporaryDirectory can be used
+    pass
 
 import os
 import posixpath 
 import tempfile
-import time
 import shutil
 
+from skinIO.core import nodes
+from skinIO.core import profiling
+from skinIO.core import progress
+
 
 class SelectionSaved(object):
     """
@@ -63,6 +72,8 @@ class SkinDisabled(object):
 
     def __init__(self,
                  currentSkinCluster):
+        self.isBatched = False
+
         self.lockState = False
 
         self.jointLockState = []
@@ -75,6 +86,11 @@ class SkinDisabled(object):
         '''
             Disable skinCluster before write operation
         '''
+        self.isBatched = self.currentSkinCluster in BatchSkinDisabled.activeSkinClusters
+
+        if self.isBatched is True:
+            return
+
         self.lockState = maya.cmds.getAttr('{0}.{1}'.format(self.currentSkinCluster,
                                                             'normalizeWeights'), l=True)
 
@@ -105,6 +121,9 @@ class SkinDisabled(object):
         '''
             Restore skinCluster after write operation
         '''
+        if self.isBatched is True:
+            return
+
         maya.cmds.setAttr('{0}.normalizeWeights'.format(self.currentSkinCluster), 
                           self.ENABLE_VALUE)
 
@@ -119,11 +138,204 @@ class SkinDisabled(object):
                               self.jointLockState[jointIndex])
 
 
+class BatchSkinDisabled(object):
+    """
+        Python context disabling a whole batch of skinClusters for skinweight IO.
+        State of every skinCluster and unique influence is recorded and changed 
+        through a single MDGModifier, then restored in one pass.
+        SkinDisabled contexts opened on these skinClusters become no-ops.
+    """
+    DISABLE_VALUE = 0.0
+
+    activeSkinClusters = set()
+
+    def __init__(self,
+                 skinClusterArray):
+        self.skinClusterArray = [skin for skin in skinClusterArray]
+
+        self.plugStates = []
+
+        self.batchedSkinClusters = []
+
+    def getMObject(self, nodeName):
+        return nodes.getMObject(nodeName)
+
+    def getPlugValue(self,
+                     plug,
+                     valueType):
+        if valueType == 'bool':
+            return plug.asBool()
+
+        if valueType == 'int':
+            return plug.asInt()
+
+        return plug.asDouble()
+
+    def queuePlugValue(self,
+                       stateModifier,
+                       plug,
+                       valueType,
+                       value):
+        if valueType == 'bool':
+            stateModifier.newPlugValueBool(plug,
+                                           bool(value))
+        elif valueType == 'int':
+            stateModifier.newPlugValueInt(plug,
+                                          int(value))
+        else:
+            stateModifier.newPlugValueDouble(plug,
+                                             float(value))
+
+    def disablePlug(self,
+                    plug,
+                    valueType,
+                    stateModifier):
+        """
+            Record the current state of a plug and queue its disabled value.
+
+            args:
+                plug(MPlug).
+
+                valueType(string): bool, int or double.
+
+                stateModifier(MDGModifier).
+        """
+        isLocked = plug.isLocked()
+
+        self.plugStates.append((plug,
+                                valueType,
+                                self.getPlugValue(plug, valueType),
+                                isLocked))
+
+        if isLocked is True:
+            plug.setLocked(False)
+
+        self.queuePlugValue(stateModifier,
+                            plug,
+                            valueType,
+                            self.DISABLE_VALUE)
+
+    def __enter__(self):
+        '''
+            Disable all skinClusters and influences before write operation
+        '''
+        self.plugStates = []
+
+        self.batchedSkinClusters = []
+
+        stateModifier = maya.OpenMaya.MDGModifier()
+
+        try:
+            self.disableSkinClusters(stateModifier)
+        except:
+            #Plugs are unlocked while their disabled value is queued, a failure must not leave them so
+            self.restorePlugStates()
+
+            raise
+
+        self.activeSkinClusters.update(self.batchedSkinClusters)
+
+        return self
+
+    def disableSkinClusters(self,
+                            stateModifier):
+        """
+            Disable the skinClusters not handled by an enclosing context, and their influences.
+
+            args:
+                stateModifier(MDGModifier).
+        """
+        influenceNames = set()
+
+        for skinCluster in self.skinClusterArray:
+            if skinCluster in self.activeSkinClusters:
+                continue
+
+            if not maya.cmds.objExists(skinCluster):
+                continue
+
+            skinApiObject = self.getMObject(skinCluster)
+            skinNodeUtils = maya.OpenMaya.MFnDependencyNode(skinApiObject)
+
+            self.disablePlug(skinNodeUtils.findPlug('normalizeWeights', False),
+                             'int',
+                             stateModifier)
+
+            self.disablePlug(skinNodeUtils.findPlug('envelope', False),
+                             'double',
+                             stateModifier)
+
+            influencePaths = maya.OpenMaya.MDagPathArray()
+            maya.OpenMayaAnim.MFnSkinCluster(skinApiObject).influenceObjects(influencePaths)
+
+            for influenceIndex in xrange(influencePaths.length()):
+                influencePath = influencePaths[influenceIndex]
+                influenceName = influencePath.fullPathName()
+
+                if influenceName in influenceNames:
+                    continue
+
+                influenceNames.add(influenceName)
+
+                influenceNodeUtils = maya.OpenMaya.MFnDependencyNode(influencePath.node())
+
+                if not influenceNodeUtils.hasAttribute('lockInfluenceWeights'):
+                    continue
+
+                self.disablePlug(influenceNodeUtils.findPlug('lockInfluenceWeights', False),
+                                 'bool',
+                                 stateModifier)
+
+            self.batchedSkinClusters.append(skinCluster)
+
+        stateModifier.doIt()
+
+    def restorePlugStates(self):
+        """
+            Set back the recorded plug values and locks.
+        """
+        stateModifier = maya.OpenMaya.MDGModifier()
+
+        for plug, valueType, previousValue, isLocked in self.plugStates:
+            self.queuePlugValue(stateModifier,
+                                plug,
+                                valueType,
+                                previousValue)
+
+        stateModifier.doIt()
+
+        for plug, valueType, previousValue, isLocked in self.plugStates:
+            if isLocked is True:
+                plug.setLocked(True)
+
+        self.plugStates = []
+
+    def __exit__(self, 
+                 type, 
+                 value, 
+                 traceback):
+        '''
+            Restore all skinClusters and influences after write operation
+        '''
+        self.restorePlugStates()
+
+        self.activeSkinClusters.difference_update(self.batchedSkinClusters)
+
+
 class TimeProcessor(object):
     """
-        Time stamping utility context
+        Time stamping utility context, timing is recorded as a profiling span
+        nested in any span already running.
+        Progress goes through progressReporter (a progress.ProgressReporter), 
+        the default reporter of the session is used when only displayProgressbar is set.
     """
-    def __init__(self):
+    def __init__(self,
+                 spanName='process',
+                 skin=None):
+        self.spanName = spanName
+        self.skin = skin
+        self.span = None
+
         self.startTime = 0.0
         self.endTime = 0.0
         self.report = ''
@@ -133,18 +345,21 @@ class TimeProcessor(object):
         self.displayReport = True
 
         self.displayProgressbar = False
+        self.progressReporter = None
         self.progressbar = None
         self.progressbarRange = 1
 
         self.processObjectCount = 0
 
     def __enter__(self):
-        if self.displayProgressbar is True:
-            self.progressbar = maya.OpenMayaUI.MProgressWindow()
-            self.progressbar.reserve()
-            self.progressbar.setProgressRange(0, self.progressbarRange)
+        self.progressbar = self.progressReporter
+
+        if self.progressbar is None and self.displayProgressbar is True:
+            self.progressbar = progress.getDefaultReporter()
 
-            self.progressbar.startProgress()
+        if self.progressbar is not None:
+            self.progressbar.start(self.progressbarRange,
+                                   title=self.spanName)
 
         self.stampProcessingTime()
 
@@ -154,28 +369,60 @@ class TimeProcessor(object):
 
         self.reportProcessingTime()
 
-        if self.displayProgressbar is True:
-            self.progressbar.endProgress()
+        if self.progressbar is not None:
+            self.progressbar.end()
+
+            self.progressbar = None
+
+    def advanceProgress(self,
+                        skins=1,
+                        byteCount=0,
+                        label=''):
+        if self.progressbar is None:
+            return
+
+        self.progressbar.advance(skins=skins,
+                                 byteCount=byteCount,
+                                 label=label)
+
+    def checkCancelled(self):
+        """
+            Raise progress.OperationCancelled if the reporter was cancelled.
+        """
+        if self.progressbar is None:
+            return
+
+        self.progressbar.checkCancelled()
 
     def stampProcessingTime(self):
-        self.startTime = time.clock()
+        self.span = profiling.PROFILER.span(self.spanName,
+                                            category='process',
+                                            skin=self.skin)
+        self.span.start()
+
+        self.startTime = self.span.startTime
 
     def reportProcessingTime(self):
-        self.endTime = time.clock()
-        self.timeRange = (self.endTime - self.startTime)
+        self.span.stop()
+
+        self.endTime = self.span.endTime
+        self.timeRange = self.span.wallTime
 
         self.report = '{0}\n{1}\nProcessings took {2} seconds'.format(self.report,
                                                                       '-'*70,
                                                                       self.timeRange)
 
         if self.displayReport is True:
-            print self.report
+            print(self.report)
 
 
 class TemporaryNamespace(object):
     """
         namespace utility use to isoled imported object with 
         namespace and clean it up once processing is done
+
+        targetSkinFile can be a single file path or a list of file paths
+        imported in the same namespace.
     """
     def __init__(self,
                  rootNameSpace,
@@ -196,14 +443,20 @@ class TemporaryNamespace(object):
 
             maya.cmds.namespace(setNamespace=self.namespacePrefix)
         else:
-            maya.cmds.file(self.targetSkinFile,
-                           i=True, 
-                           type=self.fileType,  
-                           ignoreVersion=True, 
-                           ra=True, 
-                           mergeNamespacesOnClash=False, 
-                           namespace=self.namespacePrefix, 
-                           pr=True)
+            targetSkinFileArray = self.targetSkinFile
+
+            if not isinstance(targetSkinFileArray, (list, tuple)):
+                targetSkinFileArray = [targetSkinFileArray]
+
+            for targetSkinFile in targetSkinFileArray:
+                maya.cmds.file(targetSkinFile,
+                               i=True, 
+                               type=self.fileType,  
+                               ignoreVersion=True, 
+                               ra=True, 
+                               mergeNamespacesOnClash=True, 
+                               namespace=self.namespacePrefix, 
+                               pr=True)
 
     def __exit__(self, 
                  type, 
@@ -221,18 +474,22 @@ class TemporaryNamespace(object):
 class TemporaryDirectory(object):
     """
         Temporary directory used for compressing/decompressing archive elements
+        keepOnError leaves the directory in place when processing fails.
     """
     def __init__(self, 
                  suffix="", 
                  prefix="tmp", 
-                 dir=None):
+                 dir=None,
+                 keepOnError=False):
+        self.keepOnError = keepOnError
+
         if dir is None:
             self.tempfolder = tempfile.mkdtemp(suffix, prefix, dir)
         else:
             if os.path.exists(dir): 
                 self.tempfolder = dir 
             else:
-                maya.cmds.sysFile(dir, makeDir=True)
+                os.makedirs(dir)
                                                     
                 self.tempfolder = dir
 
@@ -240,5 +497,8 @@ class TemporaryDirectory(object):
         return self.tempfolder
 
     def __exit__(self, type, value, traceback):
+        if type is not None and self.keepOnError is True:
+            return
+
         if os.path.exists(self.tempfolder): 
             shutil.rmtree(self.tempfolder)
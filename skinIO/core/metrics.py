@@ -0,0 +1,151 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import datetime
+import getpass
+import json
+import os
+import socket
+
+
+class SkinMetrics(object):
+    """
+        Structured record describing the processing of one skinCluster
+    """
+    FIELDS = ('operation',
+              'method',
+              'archive',
+              'deformerName',
+              'shape',
+              'points',
+              'influences',
+              'nonZeroCount',
+              'rawBytes',
+              'compressedBytes',
+              'stages',
+              'timestamp',
+              'host',
+              'user')
+
+    def __init__(self,
+                 operation,
+                 method,
+                 deformerName):
+        self.operation = operation
+        self.method = method
+        self.archive = None
+
+        self.deformerName = deformerName
+        self.shape = None
+
+        self.points = 0
+        self.influences = 0
+        self.nonZeroCount = None
+
+        self.rawBytes = 0
+        self.compressedBytes = None
+
+        self.stages = {}
+
+        self.timestamp = str(datetime.datetime.now())
+        self.host = socket.gethostname()
+        self.user = getpass.getuser()
+
+    def toDict(self):
+        return dict((field, getattr(self, field)) for field in self.FIELDS)
+
+
+class MetricsSink(object):
+    """
+        Append SkinMetrics records to a JSON Lines file.
+        The target defaults to a .metrics.jsonl file next to the archive, 
+        SKINIO_METRICS_SINK can point to a shared file or directory instead.
+    """
+    ENVIRONMENT_VARIABLE = 'SKINIO_METRICS_SINK'
+
+    FILE_SUFFIX = '.metrics.jsonl'
+
+    def __init__(self,
+                 targetFile):
+        self.targetFile = targetFile
+
+    @classmethod
+    def fromArchive(cls,
+                    archiveFile,
+                    targetFile=None):
+        """
+            Build a sink for the provided archive.
+
+            args:
+                archiveFile(string): archive file path.
+
+            kwargs:
+                targetFile(string): explicit sink file or directory.
+
+            returns:
+                (MetricsSink)
+        """
+        if targetFile is None:
+            targetFile = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+
+        archiveName = os.path.splitext(os.path.basename(archiveFile))[0]
+
+        if targetFile is None:
+            targetFile = os.path.join(os.path.dirname(archiveFile),
+                                      archiveName + cls.FILE_SUFFIX)
+
+        elif os.path.isdir(targetFile):
+            targetFile = os.path.join(targetFile,
+                                      archiveName + cls.FILE_SUFFIX)
+
+        return cls(targetFile)
+
+    def write(self,
+              metricsArray):
+        """
+            args:
+                metricsArray(list of SkinMetrics).
+        """
+        if len(metricsArray) == 0:
+            return
+
+        lines = [json.dumps(skinMetrics.toDict(), sort_keys=True) + '\n'
+                 for skinMetrics in metricsArray]
+
+        with open(self.targetFile, 'a') as outfile:
+            outfile.write(''.join(lines))
+
+
+def countNonZero(values):
+    """
+        Count in bulk, array.count runs in C.
+
+        args:
+            values(array.array of double).
+
+        returns:
+            (int)
+    """
+    return len(values) - values.count(0.0)
@@ -0,0 +1,210 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+try:
+    import maya.OpenMaya 
+except ImportError:
+    #Outside of Maya NodeCache can not resolve any node
+    pass
+
+
+class NodeCache(object):
+    """
+        Cache resolving node names to MObjectHandle and MDagPath during an import 
+        or export batch, entered as a context manager.
+        Handles are checked for validity before reuse, renames clear the cache and 
+        removed nodes are dropped through Maya callbacks installed for the batch only.
+        Outside of a batch nodes are resolved without being cached.
+    """
+    def __init__(self):
+        #{nodeName: [MObjectHandle, MDagPath or None, dict of data derived from the node]}
+        self.nodeMap = {}
+
+        #{MObjectHandle.hashCode: set of nodeName}
+        self.hashMap = {}
+
+        self.callbackIds = []
+
+        #Nested batches share the callbacks of the outermost one
+        self.batchDepth = 0
+
+        self.hitCount = 0
+        self.missCount = 0
+
+    def __contains__(self,
+                     nodeName):
+        return nodeName in self.nodeMap
+
+    def __enter__(self):
+        if self.batchDepth == 0:
+            self.clear()
+            self.installCallbacks()
+
+        self.batchDepth += 1
+
+        return self
+
+    def __exit__(self, *args):
+        self.batchDepth -= 1
+
+        if self.batchDepth == 0:
+            self.removeCallbacks()
+            self.clear()
+
+    def installCallbacks(self):
+        if len(self.callbackIds) > 0:
+            return
+
+        self.callbackIds.append(maya.OpenMaya.MNodeMessage.addNameChangedCallback(maya.OpenMaya.MObject(),
+                                                                                  self.onNodeRenamed))
+
+        self.callbackIds.append(maya.OpenMaya.MDGMessage.addNodeRemovedCallback(self.onNodeRemoved))
+
+    def removeCallbacks(self):
+        for callbackId in self.callbackIds:
+            maya.OpenMaya.MMessage.removeCallback(callbackId)
+
+        self.callbackIds = []
+
+    def onNodeRenamed(self,
+                      node,
+                      previousName,
+                      clientData):
+        #Renaming a transform changes the full path of every node below it
+        if len(self.nodeMap) > 0:
+            self.clear()
+
+    def onNodeRemoved(self,
+                      node,
+                      clientData):
+        hashCode = maya.OpenMaya.MObjectHandle(node).hashCode()
+
+        for nodeName in self.hashMap.pop(hashCode, ()):
+            self.nodeMap.pop(nodeName, None)
+
+    def resolve(self,
+                nodeName):
+        """
+            returns:
+                ([MObjectHandle, MDagPath or None, dict]) cache entry of nodeName.
+        """
+        nodeEntry = self.nodeMap.get(nodeName)
+
+        if nodeEntry is not None and nodeEntry[0].isValid():
+            self.hitCount += 1
+            return nodeEntry
+
+        self.missCount += 1
+
+        selList = maya.OpenMaya.MSelectionList()
+        maya.OpenMaya.MGlobal.getSelectionListByName(nodeName, 
+                                                     selList)
+        depNode = maya.OpenMaya.MObject()
+        selList.getDependNode(0, depNode) 
+
+        nodeHandle = maya.OpenMaya.MObjectHandle(depNode)
+
+        nodeEntry = [nodeHandle, None, {}]
+
+        if self.batchDepth == 0:
+            return nodeEntry
+
+        self.nodeMap[nodeName] = nodeEntry
+        self.hashMap.setdefault(nodeHandle.hashCode(), set()).add(nodeName)
+
+        return nodeEntry
+
+    def getMObject(self,
+                   nodeName):
+        """
+            args:
+                nodeName(string): node name or path.
+
+            returns:
+                (MObject)
+        """
+        return self.resolve(nodeName)[0].object()
+
+    def getDagPath(self,
+                   nodeName):
+        """
+            args:
+                nodeName(string): dag node name or path.
+
+            returns:
+                (MDagPath) copy of the cached path, safe to be modified by the caller.
+        """
+        nodeEntry = self.resolve(nodeName)
+
+        if nodeEntry[1] is None or not nodeEntry[1].isValid():
+            dagPath = maya.OpenMaya.MDagPath()
+            maya.OpenMaya.MDagPath.getAPathTo(nodeEntry[0].object(),
+                                              dagPath)
+
+            nodeEntry[1] = dagPath
+
+        return maya.OpenMaya.MDagPath(nodeEntry[1])
+
+    def getNodeData(self,
+                    nodeName):
+        """
+            Storage for values derived from a node, such as its ShapeSettings,
+            discarded together with the node handle.
+
+            args:
+                nodeName(string): node name or path.
+
+            returns:
+                (dict)
+        """
+        return self.resolve(nodeName)[2]
+
+    def clear(self):
+        self.nodeMap = {}
+        self.hashMap = {}
+
+    def getStats(self):
+        return {'nodes': len(self.nodeMap),
+                'hits': self.hitCount,
+                'misses': self.missCount}
+
+
+NODE_CACHE = NodeCache()
+
+
+def getNodeCache():
+    return NODE_CACHE
+
+
+def getMObject(nodeName):
+    return NODE_CACHE.getMObject(nodeName)
+
+
+def getDagPath(nodeName):
+    return NODE_CACHE.getDagPath(nodeName)
+
+
+def getNodeData(nodeName):
+    return NODE_CACHE.getNodeData(nodeName)
@@ -0,0 +1,262 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import array
+
+
+try:
+    xrange
+except NameError:
+    xrange = range
+
+
+#Sparse line oriented .wgt format written by skinUtils.PointWeights, 
+#one line per point holding its non zero weights:
+#
+#   # skinIO.wgt 1
+#   skin skinCluster1
+#   shape |body|bodyShape
+#   points 3
+#   influences 2
+#   influence 0 joint1
+#   influence 1 joint2
+#   weights
+#   0 0:0.25 1:0.75
+#   1 1:1.0
+#   2 0:0.5 1:0.5
+#
+#Points without any weight are omitted, indices of the weights lines refer to the influence lines.
+
+
+class WgtError(Exception):
+    pass
+
+
+class WgtWriter(object):
+    """
+        Stream a skin to a .wgt file, chunk after chunk of dense point weights.
+    """
+    FORMAT_LINE = '# skinIO.wgt 1'
+
+    def __init__(self,
+                 targetFile):
+        self.targetFile = targetFile
+
+        self.outputFile = None
+
+        self.influenceCount = 0
+
+        self.pointCount = 0
+
+        self.nonZeroCount = 0
+
+    def __enter__(self):
+        self.outputFile = open(self.targetFile, 'w')
+
+        return self
+
+    def __exit__(self, *args):
+        self.outputFile.close()
+
+    def writeHeader(self,
+                    deformerName,
+                    shape,
+                    pointCount,
+                    influences):
+        """
+            args:
+                deformerName(string): skinCluster name.
+
+                shape(string): deformed shape path.
+
+                pointCount(int).
+
+                influences(list of string): influence names in weight order.
+        """
+        self.influenceCount = len(influences)
+        self.pointCount = pointCount
+
+        lineArray = [self.FORMAT_LINE,
+                     'skin {0}'.format(deformerName),
+                     'shape {0}'.format(shape),
+                     'points {0}'.format(pointCount),
+                     'influences {0}'.format(len(influences))]
+
+        lineArray.extend('influence {0} {1}'.format(influenceIndex, influence) 
+                         for influenceIndex, influence in enumerate(influences))
+
+        lineArray.append('weights')
+
+        self.outputFile.write('\n'.join(lineArray) + '\n')
+
+    def writeChunk(self,
+                   startIndex,
+                   values):
+        """
+            args:
+                startIndex(int): point index of the first row of values.
+
+                values(indexable sequence of float): dense point major weights of the chunk.
+        """
+        influenceCount = self.influenceCount
+
+        lineArray = []
+
+        for rowIndex in xrange(len(values) // influenceCount):
+            rowOffset = rowIndex * influenceCount
+
+            row = ['{0}:{1!r}'.format(influenceIndex, float(values[rowOffset + influenceIndex])) 
+                   for influenceIndex in xrange(influenceCount) 
+                   if values[rowOffset + influenceIndex] != 0.0]
+
+            if len(row) == 0:
+                continue
+
+            self.nonZeroCount += len(row)
+
+            lineArray.append('{0} {1}\n'.format(startIndex + rowIndex, 
+                                                ' '.join(row)))
+
+        self.outputFile.write(''.join(lineArray))
+
+
+class WgtReader(object):
+    """
+        Stream a .wgt file back as chunks of dense point weights, 
+        memory stays proportional to the chunk size whatever the point count.
+    """
+    def __init__(self,
+                 sourceFile):
+        self.sourceFile = sourceFile
+
+        self.inputFile = None
+
+        self.deformerName = None
+
+        self.shape = None
+
+        self.pointCount = 0
+
+        self.influences = []
+
+    def __enter__(self):
+        self.inputFile = open(self.sourceFile, 'r')
+
+        self.readHeader()
+
+        return self
+
+    def __exit__(self, *args):
+        self.inputFile.close()
+
+    def readHeader(self):
+        formatLine = self.inputFile.readline().rstrip('\n')
+
+        if formatLine != WgtWriter.FORMAT_LINE:
+            raise WgtError('{0} is not a skinIO .wgt file'.format(self.sourceFile))
+
+        for line in self.inputFile:
+            line = line.rstrip('\n')
+
+            if line == 'weights':
+                return
+
+            key, value = line.split(' ', 1)
+
+            if key == 'skin':
+                self.deformerName = value
+
+            elif key == 'shape':
+                self.shape = value
+
+            elif key == 'points':
+                self.pointCount = int(value)
+
+            elif key == 'influences':
+                self.influences = [None] * int(value)
+
+            elif key == 'influence':
+                influenceIndex, influence = value.split(' ', 1)
+                self.influences[int(influenceIndex)] = influence
+
+        raise WgtError('{0} has no weights section'.format(self.sourceFile))
+
+    def iterChunks(self,
+                   chunkPointCount):
+        """
+            args:
+                chunkPointCount(int): number of points per chunk.
+
+            returns:
+                (generator of (int, int, array of float)) startIndex, endIndex and
+                dense point major weights of the points [startIndex, endIndex[.
+        """
+        influenceCount = len(self.influences)
+
+        chunkPointCount = max(int(chunkPointCount), 1)
+
+        startIndex = 0
+        endIndex = min(chunkPointCount, self.pointCount)
+
+        values = array.array('d', [0.0]) * ((endIndex - startIndex) * influenceCount)
+
+        for line in self.inputFile:
+            pointData = line.split()
+
+            if len(pointData) == 0:
+                continue
+
+            pointIndex = int(pointData[0])
+
+            if pointIndex >= self.pointCount:
+                raise WgtError('Point {0} is out of the {1} points of {2}'.format(pointIndex,
+                                                                                self.pointCount,
+                                                                                self.sourceFile))
+
+            if pointIndex < startIndex:
+                raise WgtError('Point {0} of {1} is out of order, its chunk was already yielded'.format(pointIndex,
+                                                                                                       self.sourceFile))
+
+            while pointIndex >= endIndex:
+                yield startIndex, endIndex, values
+
+                startIndex = endIndex
+                endIndex = min(startIndex + chunkPointCount, self.pointCount)
+
+                values = array.array('d', [0.0]) * ((endIndex - startIndex) * influenceCount)
+
+            rowOffset = (pointIndex - startIndex) * influenceCount
+
+            for weightData in pointData[1:]:
+                influenceIndex, weight = weightData.split(':')
+                values[rowOffset + int(influenceIndex)] = float(weight)
+
+        while startIndex < self.pointCount:
+            yield startIndex, endIndex, values
+
+            startIndex = endIndex
+            endIndex = min(startIndex + chunkPointCount, self.pointCount)
+
+            values = array.array('d', [0.0]) * ((endIndex - startIndex) * influenceCount)
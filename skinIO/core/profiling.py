@@ -0,0 +1,303 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+
+
+if hasattr(time, 'perf_counter'):
+    wallClock = time.perf_counter
+else:
+    wallClock = time.time
+
+if hasattr(time, 'process_time'):
+    cpuClock = time.process_time
+else:
+    cpuClock = time.clock
+
+
+class Span(object):
+    """
+        Timed section of a skinIO process, spans opened while another span 
+        is running on the same thread become its children.
+    """
+    def __init__(self,
+                 profiler,
+                 name,
+                 category,
+                 skin,
+                 args):
+        self.profiler = profiler
+
+        self.name = name
+        self.category = category
+        self.skin = skin
+        self.args = args
+
+        self.parent = None
+        self.depth = 0
+        self.threadId = 0
+
+        self.startTime = 0.0
+        self.endTime = 0.0
+
+        self.cpuStartTime = 0.0
+        self.cpuEndTime = 0.0
+
+        self.byteCount = 0
+
+    @property
+    def wallTime(self):
+        return self.endTime - self.startTime
+
+    @property
+    def cpuTime(self):
+        return self.cpuEndTime - self.cpuStartTime
+
+    def addBytes(self,
+                 byteCount):
+        self.byteCount += int(byteCount)
+
+    def start(self):
+        self.profiler.openSpan(self)
+
+        self.cpuStartTime = cpuClock()
+        self.startTime = wallClock()
+
+        return self
+
+    def stop(self):
+        self.endTime = wallClock()
+        self.cpuEndTime = cpuClock()
+
+        self.profiler.closeSpan(self)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self,
+                 type,
+                 value,
+                 traceback):
+        self.stop()
+
+    def toTraceEvent(self,
+                     originTime):
+        """
+            Chrome trace-event ('X' complete event) describing this span.
+
+            args:
+                originTime(float): wall clock value mapped to timestamp 0.
+
+            returns:
+                (dict)
+        """
+        eventArgs = dict(self.args)
+
+        eventArgs['cpuTime'] = self.cpuTime
+        eventArgs['bytes'] = self.byteCount
+
+        if self.skin is not None:
+            eventArgs['skin'] = self.skin
+
+        return {'name': self.name,
+                'cat': self.category,
+                'ph': 'X',
+                'ts': (self.startTime - originTime) * 1000000.0,
+                'dur': self.wallTime * 1000000.0,
+                'pid': os.getpid(),
+                'tid': self.threadId,
+                'args': eventArgs}
+
+
+class SpanProfiler(object):
+    """
+        Collect nested spans of export and import processes.
+        Stage spans use the names listed in STAGES and carry the skinCluster they work on.
+        Spans are reset by each import or export batch, and only the last 
+        maxSpanCount spans are kept for processes that never reset it.
+    """
+    STAGES = ('collect',
+              'encode',
+              'compress',
+              'write',
+              'read',
+              'decode',
+              'validate',
+              'apply')
+
+    MAX_SPAN_COUNT = 100000
+
+    def __init__(self,
+                 maxSpanCount=MAX_SPAN_COUNT):
+        self.maxSpanCount = maxSpanCount
+
+        self.spans = collections.deque(maxlen=self.maxSpanCount)
+
+        #Spans discarded since the last reset because of maxSpanCount
+        self.droppedCount = 0
+
+        self.originTime = wallClock()
+
+        self.threadStacks = threading.local()
+
+        self.lock = threading.Lock()
+
+    def reset(self):
+        with self.lock:
+            self.spans = collections.deque(maxlen=self.maxSpanCount)
+
+            self.droppedCount = 0
+
+            self.originTime = wallClock()
+
+    def getStack(self):
+        if not hasattr(self.threadStacks, 'stack'):
+            self.threadStacks.stack = []
+
+        return self.threadStacks.stack
+
+    def span(self,
+             name,
+             category='skinIO',
+             skin=None,
+             **args):
+        """
+            Create a span, use it as a python context or with start/stop.
+
+            args:
+                name(string): stage or process name.
+
+            kwargs:
+                category(string).
+
+                skin(string): skinCluster processed in this span.
+
+                args: additional values stored in the trace event.
+
+            returns:
+                (Span)
+        """
+        return Span(self,
+                    name,
+                    category,
+                    skin,
+                    args)
+
+    def openSpan(self,
+                 span):
+        stack = self.getStack()
+
+        if len(stack) > 0:
+            span.parent = stack[-1]
+            span.depth = len(stack)
+
+            if span.skin is None:
+                span.skin = span.parent.skin
+
+        span.threadId = threading.current_thread().ident or 0
+
+        stack.append(span)
+
+    def closeSpan(self,
+                  span):
+        stack = self.getStack()
+
+        if span in stack:
+            stack.remove(span)
+
+        with self.lock:
+            if len(self.spans) == self.spans.maxlen:
+                self.droppedCount += 1
+
+            self.spans.append(span)
+
+    def getSpans(self,
+                 name=None,
+                 skin=None):
+        return [span for span in self.spans
+                if (name is None or span.name == name)
+                and (skin is None or span.skin == skin)]
+
+    def getStageTimes(self,
+                      skin):
+        """
+            Wall time, cpu time and bytes spent in each stage for a skinCluster.
+
+            args:
+                skin(string): skinCluster name.
+
+            returns:
+                (dict) stage name: {'wallTime', 'cpuTime', 'bytes'}
+        """
+        stageTimes = {}
+
+        for span in self.getSpans(skin=skin):
+            if span.name not in self.STAGES:
+                continue
+
+            stageData = stageTimes.setdefault(span.name, {'wallTime': 0.0,
+                                                          'cpuTime': 0.0,
+                                                          'bytes': 0})
+
+            stageData['wallTime'] += span.wallTime
+            stageData['cpuTime'] += span.cpuTime
+            stageData['bytes'] += span.byteCount
+
+        return stageTimes
+
+    def toChromeTrace(self):
+        """
+            returns:
+                (dict) trace-event document readable by chrome://tracing or Perfetto.
+        """
+        traceEvents = [span.toTraceEvent(self.originTime)
+                       for span in sorted(self.spans, key=lambda span: span.startTime)]
+
+        return {'traceEvents': traceEvents,
+                'displayTimeUnit': 'ms'}
+
+    def exportChromeTrace(self,
+                          targetFile):
+        """
+            Save collected spans as Chrome trace-event JSON.
+
+            args:
+                targetFile(string): output json file path.
+        """
+        with open(targetFile, 'w') as outfile:
+            json.dump(self.toChromeTrace(), outfile)
+
+        return targetFile
+
+
+PROFILER = SpanProfiler()
+
+
+def getProfiler():
+    return PROFILER
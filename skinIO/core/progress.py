@@ -0,0 +1,239 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import logging
+import time
+
+
+class OperationCancelled(Exception):
+    """
+        Raised between two skinClusters when the progress reporter was cancelled
+    """
+
+
+class ProgressReporter(object):
+    """
+        Headless progress and cancellation interface.
+        Progress is counted in skins and bytes, subclasses display it by overriding
+        onStart/onUpdate/onEnd and can request cancellation through isCancelled.
+    """
+    def __init__(self):
+        self.title = ''
+
+        self.skinCount = 0
+        self.skinsDone = 0
+
+        self.byteCount = 0
+        self.bytesDone = 0
+
+        self.label = ''
+
+        self.cancelRequested = False
+
+    @property
+    def fraction(self):
+        if self.skinCount <= 0:
+            return 0.0
+
+        return min(float(self.skinsDone) / self.skinCount, 1.0)
+
+    def start(self,
+              skinCount,
+              byteCount=0,
+              title=''):
+        """
+            args:
+                skinCount(int): number of skins to process.
+
+            kwargs:
+                byteCount(int): number of bytes to process when known.
+
+                title(string).
+        """
+        self.title = title
+
+        self.skinCount = skinCount
+        self.skinsDone = 0
+
+        self.byteCount = byteCount
+        self.bytesDone = 0
+
+        self.label = ''
+
+        self.cancelRequested = False
+
+        self.onStart()
+
+    def advance(self,
+                skins=0,
+                byteCount=0,
+                label=''):
+        """
+            kwargs:
+                skins(int): number of skins completed since last call.
+
+                byteCount(int): number of bytes processed since last call.
+
+                label(string): name of the element being processed.
+        """
+        self.skinsDone += skins
+        self.bytesDone += byteCount
+
+        if label:
+            self.label = label
+
+        self.onUpdate()
+
+    def end(self):
+        self.onEnd()
+
+    def cancel(self):
+        self.cancelRequested = True
+
+    def isCancelled(self):
+        return self.cancelRequested
+
+    def checkCancelled(self):
+        if self.isCancelled():
+            raise OperationCancelled('{0} cancelled after {1}/{2} skins'.format(self.title,
+                                                                                self.skinsDone,
+                                                                                self.skinCount))
+
+    def onStart(self):
+        pass
+
+    def onUpdate(self):
+        pass
+
+    def onEnd(self):
+        pass
+
+
+class LoggerProgressReporter(ProgressReporter):
+    """
+        Progress written to a logger, meant for mayapy batch jobs
+    """
+    def __init__(self,
+                 logger=None,
+                 interval=5.0):
+        super(LoggerProgressReporter, self).__init__()
+
+        self.logger = logger or logging.getLogger('skinIO')
+
+        self.interval = interval
+
+        self.lastReportTime = 0.0
+
+    def report(self):
+        self.logger.info('%s: %d/%d skins, %d bytes %s',
+                         self.title,
+                         self.skinsDone,
+                         self.skinCount,
+                         self.bytesDone,
+                         self.label)
+
+        self.lastReportTime = time.time()
+
+    def onStart(self):
+        self.report()
+
+    def onUpdate(self):
+        if time.time() - self.lastReportTime < self.interval:
+            return
+
+        self.report()
+
+    def onEnd(self):
+        self.report()
+
+
+class MayaProgressWindowReporter(ProgressReporter):
+    """
+        Progress displayed in maya.OpenMayaUI.MProgressWindow, ESC cancels the operation
+    """
+    def __init__(self):
+        super(MayaProgressWindowReporter, self).__init__()
+
+        self.progressWindow = None
+
+    def onStart(self):
+        import maya.OpenMayaUI
+
+        self.progressWindow = maya.OpenMayaUI.MProgressWindow
+
+        if not self.progressWindow.reserve():
+            self.progressWindow = None
+            return
+
+        self.progressWindow.setInterruptable(True)
+        self.progressWindow.setTitle(self.title or 'skinIO')
+        self.progressWindow.setProgressRange(0, max(self.skinCount, 1))
+        self.progressWindow.setProgress(0)
+
+        self.progressWindow.startProgress()
+
+    def onUpdate(self):
+        if self.progressWindow is None:
+            return
+
+        self.progressWindow.setProgress(min(self.skinsDone, max(self.skinCount, 1)))
+
+        if self.label:
+            self.progressWindow.setProgressStatus(self.label)
+
+    def onEnd(self):
+        if self.progressWindow is None:
+            return
+
+        self.progressWindow.endProgress()
+
+        self.progressWindow = None
+
+    def isCancelled(self):
+        if self.progressWindow is not None and self.progressWindow.isCancelled():
+            self.cancelRequested = True
+
+        return self.cancelRequested
+
+
+def isInteractiveSession():
+    try:
+        import maya.OpenMaya
+    except ImportError:
+        return False
+
+    return maya.OpenMaya.MGlobal.mayaState() == maya.OpenMaya.MGlobal.kInteractive
+
+
+def getDefaultReporter():
+    """
+        returns:
+            (ProgressReporter) Maya progress window in an interactive session, 
+            logger everywhere else.
+    """
+    if isInteractiveSession():
+        return MayaProgressWindowReporter()
+
+    return LoggerProgressReporter()
@@ -0,0 +1,470 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import array
+import datetime
+import getpass
+import itertools
+import json
+import os
+import zipfile
+
+
+class SparseWeights(object):
+    """
+        Non zero weights of one skin, stored as flat point-major indices and values.
+    """
+    def __init__(self,
+                 pointCount=0,
+                 influenceCount=0):
+        self.pointCount = pointCount
+        self.influenceCount = influenceCount
+
+        self.weightIndices = array.array('l')
+        self.weightValues = array.array('d')
+
+    def __len__(self):
+        return len(self.weightValues)
+
+    def collect(self,
+                weights):
+        """
+            Non zero values are selected in bulk by itertools.compress, 
+            no Python loop runs per weight.
+
+            args:
+                weights(MDoubleArray): dense point-major weights.
+        """
+        from skinIO.core import settings
+
+        denseValues = array.array('d')
+
+        rawBytes = settings.SkinSet.toBytes(weights)
+
+        if hasattr(denseValues, 'frombytes'):
+            denseValues.frombytes(rawBytes)
+        else:
+            denseValues.fromstring(rawBytes)
+
+        self.weightIndices = array.array('l', itertools.compress(itertools.count(), 
+                                                                 denseValues))
+        self.weightValues = array.array('d', itertools.compress(denseValues, 
+                                                                denseValues))
+
+    def toWeights(self):
+        """
+            returns:
+                (MDoubleArray) dense point-major weights, 
+                copied from a Python buffer in one memmove.
+        """
+        from skinIO.core import settings
+
+        denseValues = array.array('d', [0.0]) * (self.pointCount * self.influenceCount)
+
+        for weightIndex, weightValue in zip(self.weightIndices, self.weightValues):
+            denseValues[weightIndex] = weightValue
+
+        return settings.SkinSet.toDoubleArray(denseValues)
+
+    def getByteSize(self):
+        return (self.weightIndices.itemsize * len(self.weightIndices) + 
+                self.weightValues.itemsize * len(self.weightValues))
+
+
+class WeightSnapshot(object):
+    """
+        In memory copy of skin settings and sparse weights, see SkinIO.snapshot.
+    """
+    def __init__(self):
+        self.skinSettingsArray = []
+
+        #{skinCluster: SparseWeights}
+        self.weightMap = {}
+
+    def __len__(self):
+        return len(self.skinSettingsArray)
+
+    def add(self,
+            skinSettings,
+            sparseWeights):
+        self.skinSettingsArray.append(skinSettings)
+        self.weightMap[skinSettings.deformerName] = sparseWeights
+
+    def getByteSize(self):
+        return sum(sparseWeights.getByteSize() for sparseWeights in self.weightMap.values())
+
+
+class InjectionSettings(object):
+    FIELDS = ('weightMode',
+              'assetScene',
+              'userName',
+              'saveTime')
+
+    __slots__ = FIELDS
+
+    def __init__(self,
+                 weightMode,
+                 fillStructure=True):
+        self.weightMode = ''
+
+        self.assetScene = ''
+
+        self.userName = ''
+
+        self.saveTime = ''
+
+        self.collect(weightMode)
+
+    def collect(self,
+                weightMode):
+        self.weightMode = weightMode
+
+        try:
+            import maya.cmds
+
+            self.assetScene = maya.cmds.file(q=True,
+                                             sceneName=True)
+        except ImportError:
+            self.assetScene = ''
+
+        self.userName = getpass.getuser()
+
+        self.saveTime = str(datetime.datetime.now())
+
+    def parseJsonFromArchive(self,
+                             sourceArchiveFile):
+        if not os.path.exists(sourceArchiveFile):
+            return False
+
+        with zipfile.ZipFile(sourceArchiveFile, 'r') as archive:
+            jsonList = [info.filename for info in archive.infolist() 
+                        if info.filename.endswith('.mod')]
+
+            jsonInput = [json.loads(archive.read(jsonElement)) for jsonElement in jsonList][0]
+
+            self.fromJson(jsonInput)
+
+        return True
+
+    def toDict(self):
+        return dict((field, getattr(self, field)) for field in self.FIELDS)
+
+    def toJson(self):
+        return json.dumps(self.toDict(), 
+                          indent=2, 
+                          sort_keys=True)
+
+    def fromJson(self,
+                 inputSettings):
+        for key in inputSettings:
+            if key in self.FIELDS:
+                setattr(self, key, inputSettings[key])
+
+
+class SkinSettings(object):
+    NODE_ATTRIBUTES = ('deformerName',
+                       'shape',
+                       'shapePath',
+                       'influences',
+                       'skinningMethod',
+                       'normalizeWeights',
+                       'abcWeightsFile',
+                       'topology')
+
+    #Serialized fields, archives also carry the export report and timing
+    FIELDS = NODE_ATTRIBUTES + ('skinDeformer',
+                                'processingTime',
+                                'report')
+
+    __slots__ = FIELDS
+
+    def __init__(self, 
+                 skinDeformer,
+                 collectData=True):
+        self.skinDeformer = None
+
+        self.deformerName = None
+        self.shape = None
+        self.shapePath = None
+        self.influences = []
+
+        self.skinningMethod = 0
+        self.normalizeWeights = False
+        self.abcWeightsFile = None
+
+        #Shape topology fingerprint, used to match identical shapes on import
+        self.topology = None
+
+        self.processingTime = 0
+        self.report = ''
+
+        if collectData is False:
+            return
+
+        self.skinDeformer = skinDeformer
+
+        self.getSkinSettings()
+
+    def getSkinSettings(self):
+        import maya.cmds
+
+        self.deformerName = self.skinDeformer
+        self.influences = maya.cmds.skinCluster(self.skinDeformer,
+                                                q=True,
+                                                inf=True)
+
+        self.skinningMethod = maya.cmds.getAttr('{}.skinningMethod'.format(self.skinDeformer))
+        self.normalizeWeights = maya.cmds.getAttr('{}.normalizeWeights'.format(self.skinDeformer))
+
+        self.shape = maya.cmds.skinCluster(self.skinDeformer,
+                                           q=True,
+                                           geometry=True)[0]
+
+    def copy(self):
+        """
+            returns:
+                (SkinSettings) detached copy, validation can rename it 
+                without altering the original.
+        """
+        skinSettings = SkinSettings(None,
+                                    collectData=False)
+
+        for field in self.FIELDS:
+            setattr(skinSettings, field, getattr(self, field))
+
+        skinSettings.influences = list(self.influences)
+
+        return skinSettings
+
+    def toDict(self):
+        skinData = dict((field, getattr(self, field)) for field in self.FIELDS)
+        skinData['influences'] = list(self.influences)
+
+        return skinData
+
+    def toJson(self):
+        return json.dumps(self.toDict(), 
+                          indent=2, 
+                          sort_keys=True)
+
+    def fromJson(self,
+                 inputSkinSettings):
+        for key in inputSkinSettings:
+            if key in self.FIELDS:
+                setattr(self, key, inputSkinSettings[key])
+
+    def __repr__(self):
+        reportData = '<{0}'.format(self.__class__.__name__)
+
+        for attribute in self.NODE_ATTRIBUTES:
+            reportData += '\n\t{0}: {1}'.format(attribute, 
+                                                getattr(self,attribute))
+
+        reportData += '>'
+        return reportData
+
+
+class SkinMetadata(object):
+    """
+        Archived skin settings indexed by skinCluster name.
+
+        The compact .skn encoding starts with a json header holding the influence
+        string table shared by every skin, followed by one line per skin:
+            deformerName<TAB>shape<TAB>json settings with influences stored as string table indices.
+        Opening an archive only splits lines, settings are parsed when a skin is requested.
+    """
+    FORMAT = 'skinIO.skn'
+
+    VERSION = 1
+
+    EXTENSION = '.skn'
+
+    LEGACY_EXTENSION = '.json'
+
+    def __init__(self):
+        self.strings = []
+
+        #{deformerName: (shape, raw line settings or parsed dict)}
+        self.entries = {}
+
+        self.deformerArray = []
+
+    def __len__(self):
+        return len(self.deformerArray)
+
+    def __contains__(self,
+                     deformerName):
+        return deformerName in self.entries
+
+    def keys(self):
+        return list(self.deformerArray)
+
+    def getShape(self,
+                 deformerName):
+        return self.entries[deformerName][0]
+
+    def getSkinData(self,
+                    deformerName):
+        """
+            returns:
+                (dict) settings of one skin, as written by SkinSettings.toDict.
+        """
+        shape, skinData = self.entries[deformerName]
+
+        #Legacy entries are cached dicts, callers get their own influence list
+        if isinstance(skinData, dict):
+            return dict(skinData, 
+                        influences=list(skinData['influences']))
+
+        skinData = json.loads(skinData)
+
+        skinData['deformerName'] = deformerName
+        skinData['shape'] = shape or None
+        skinData['influences'] = [self.strings[stringIndex] for stringIndex in skinData['influences']]
+
+        return skinData
+
+    def getSkinSettings(self,
+                        deformerName):
+        skinSettings = SkinSettings(None,
+                                    collectData=False)
+
+        skinSettings.fromJson(self.getSkinData(deformerName))
+
+        return skinSettings
+
+    def toDict(self):
+        return dict((deformerName, self.getSkinData(deformerName))
+                    for deformerName in self.deformerArray)
+
+    @staticmethod
+    def encode(skinMetadata):
+        """
+            args:
+                skinMetadata(dict): {deformerName: SkinSettings.toDict()}
+
+            returns:
+                (string) .skn content.
+        """
+        strings = []
+        stringIndexMap = {}
+
+        lineArray = []
+
+        for deformerName in sorted(skinMetadata):
+            #Unset settings are left to their SkinSettings defaults
+            skinData = dict((key, value) for key, value in skinMetadata[deformerName].items() 
+                            if value is not None)
+
+            skinData.pop('deformerName', None)
+            shape = skinData.pop('shape', None) or ''
+
+            influenceIndices = []
+
+            for influence in skinData.get('influences') or []:
+                if influence not in stringIndexMap:
+                    stringIndexMap[influence] = len(strings)
+                    strings.append(influence)
+
+                influenceIndices.append(stringIndexMap[influence])
+
+            skinData['influences'] = influenceIndices
+
+            lineArray.append('{0}\t{1}\t{2}'.format(deformerName,
+                                                    shape,
+                                                    json.dumps(skinData, 
+                                                               separators=(',', ':'), 
+                                                               sort_keys=True)))
+
+        header = json.dumps({'format': SkinMetadata.FORMAT,
+                             'version': SkinMetadata.VERSION,
+                             'strings': strings},
+                            separators=(',', ':'))
+
+        return '\n'.join([header] + lineArray) + '\n'
+
+    @classmethod
+    def decode(cls,
+               data):
+        """
+            args:
+                data(string or bytes): .skn content.
+
+            returns:
+                (SkinMetadata)
+        """
+        if not isinstance(data, type(u'')):
+            data = data.decode('utf-8')
+
+        lineArray = data.split('\n')
+
+        header = json.loads(lineArray[0])
+
+        if header.get('format') != cls.FORMAT:
+            raise ValueError('Unknown skin metadata format {0}'.format(header.get('format')))
+
+        metadata = cls()
+        metadata.strings = header['strings']
+
+        for line in lineArray[1:]:
+            if not line:
+                continue
+
+            deformerName, shape, skinData = line.split('\t', 2)
+
+            metadata.entries[deformerName] = (shape, skinData)
+            metadata.deformerArray.append(deformerName)
+
+        return metadata
+
+    @classmethod
+    def fromDict(cls,
+                 skinMetadata):
+        """
+            Wrap metadata already decoded from a legacy .json member.
+        """
+        metadata = cls()
+
+        for deformerName in sorted(skinMetadata):
+            metadata.entries[deformerName] = (skinMetadata[deformerName].get('shape'), 
+                                              skinMetadata[deformerName])
+            metadata.deformerArray.append(deformerName)
+
+        return metadata
+
+    @classmethod
+    def fromMember(cls,
+                   memberName,
+                   data):
+        """
+            Decode .skn or legacy .json member content.
+        """
+        if memberName.endswith(cls.EXTENSION):
+            return cls.decode(data)
+
+        if not isinstance(data, type(u'')):
+            data = data.decode('utf-8')
+
+        return cls.fromDict(json.loads(data))
@@ -23,62 +23,47 @@
     https://opensource.org/licenses/MIT
 """
 
-import maya.OpenMaya 
-import maya.OpenMayaAnim 
-import maya.OpenMayaUI
-import maya.cmds 
-import maya.mel
-
-import inspect
-import json
+try:
+    import maya.OpenMaya 
+    import maya.OpenMayaAnim 
+    import maya.OpenMayaUI
+    import maya.cmds 
+    import maya.mel
+except ImportError:
+    #Outside of Maya only the serialization classes re-exported below can be used
+    pass
+
+import array
+import ctypes
 import os
-import posixpath 
 import tempfile
-import time
-import shutil
-import uuid
-import zipfile
-import getpass
-import datetime
-
-
-for pluginName in ('AbcExport',
-                   'AbcImport'):
-    if maya.cmds.pluginInfo(pluginName, 
-                            query=True,
-                           loaded=True):
-        continue
-    maya.cmds.loadPlugin(pluginName)
-
-
-class ObjectEncoder(json.JSONEncoder):
-    def default(self, inputObject):
-        if hasattr(inputObject, "to_json"):
-            jsonDict = inputObject.to_json()
-
-            if 'NODE_ATTRIBUTES' in jsonDict:
-                jsonDict.pop('NODE_ATTRIBUTES')
-
-            return self.default(jsonDict)
-        elif hasattr(inputObject, "__dict__"):
-            jsonDict = dict(
-                            (key, value)
-                            for key, value in inspect.getmembers(inputObject)
-                            if not key.startswith("__")
-                            and not inspect.isabstract(value)
-                            and not inspect.isbuiltin(value)
-                            and not inspect.isfunction(value)
-                            and not inspect.isgenerator(value)
-                            and not inspect.isgeneratorfunction(value)
-                            and not inspect.ismethod(value)
-                            and not inspect.ismethoddescriptor(value)
-                            and not inspect.isroutine(value)
-                            )
-            if 'NODE_ATTRIBUTES' in jsonDict:
-                jsonDict.pop('NODE_ATTRIBUTES')
-
-            return self.default(jsonDict)
-        return inputObject
+import zlib
+
+from skinIO.core import components
+from skinIO.core import context
+from skinIO.core import nodes
+from skinIO.core.serialization import (SparseWeights,
+                                       WeightSnapshot,
+                                       InjectionSettings,
+                                       SkinSettings,
+                                       SkinMetadata)
+
+
+ALEMBIC_PLUGINS = ('AbcExport',
+                   'AbcImport')
+
+
+def loadAlembicPlugins():
+    """
+        Load the Alembic plugins on first use by the alembicIO handler.
+    """
+    for pluginName in ALEMBIC_PLUGINS:
+        if maya.cmds.pluginInfo(pluginName, 
+                                query=True,
+                                loaded=True):
+            continue
+
+        maya.cmds.loadPlugin(pluginName)
 
 
 class ClusterIO(object):
@@ -95,6 +80,13 @@ class ClusterIO(object):
 class SkinSet(object):
     FIRST_ITEM = 0
 
+    DOUBLE_SIZE = 8
+
+    #Doubles read at once when scanning weights held by a DoubleStorage
+    WEIGHT_BLOCK_SIZE = 1024 * 1024
+
+    RANGE_SHAPE_TYPES = ('mesh', 'nurbsCurve', 'nurbsSurface', 'lattice')
+
     def __init__(self, inputSkinCluster):
         self.shapePath = maya.OpenMaya.MDagPath()
         self.jointPaths = maya.OpenMaya.MDagPathArray()
@@ -105,6 +97,9 @@ class SkinSet(object):
 
         self.pointCount = 0
 
+        #(pointCount,), (uCount, vCount) or (sCount, tCount, uCount), see core.components
+        self.componentCounts = ()
+
         self.shapeType = None
 
         self.influenceIndices = None
@@ -113,16 +108,13 @@ class SkinSet(object):
 
         self.weightUtils = None
 
+        #SkinSet.DoubleStorage with the decoded weights when read from the disk cache
+        self.weightStorage = None
+
         self.extractData(inputSkinCluster)
 
     def getMObject(self, nodeName):
-        selList = maya.OpenMaya.MSelectionList()
-        maya.OpenMaya.MGlobal.getSelectionListByName(nodeName, 
-                                                     selList)
-        depNode = maya.OpenMaya.MObject()
-        selList.getDependNode(0, depNode) 
-
-        return depNode
+        return nodes.getMObject(nodeName)
 
     def extractData(self, inputSkinCluster):
         skinClusterApiObject = self.getMObject(inputSkinCluster)
@@ -162,6 +154,8 @@ class SkinSet(object):
             self.fullComponentPointSet = pointComponentFunction.create(self.componentType)
             pointComponentFunction.setCompleteData(self.pointCount)
 
+            self.componentCounts = (self.pointCount,)
+
         elif self.shapeType == 'nurbsSurface':
             self.componentType = maya.OpenMaya.MFn.kSurfaceCVComponent
             shapeFunctionUtils = maya.OpenMaya.MFnNurbsSurface(self.shapePath)
@@ -174,6 +168,9 @@ class SkinSet(object):
             pointComponentFunction.setCompleteData(shapeFunctionUtils.numCVsInU(),
                                                    shapeFunctionUtils.numCVsInV())
 
+            self.componentCounts = (shapeFunctionUtils.numCVsInU(),
+                                    shapeFunctionUtils.numCVsInV())
+
         elif self.shapeType == 'lattice':
             self.componentType = maya.OpenMaya.MFn.kLatticeComponent
             shapeFunctionUtils = maya.OpenMayaAnim.MFnLattice(self.shapePath)
@@ -207,9 +204,66 @@ class SkinSet(object):
                                                    tDivivision,
                                                    uDivivision)
 
+            self.componentCounts = (sDivivision,
+                                    tDivivision,
+                                    uDivivision)
+
+    def getComponentRange(self,
+                          startIndex,
+                          endIndex):
+        """
+            Build a component holding the points [startIndex, endIndex[ of the shape.
+
+            args:
+                startIndex(int): first point of the range.
+
+                endIndex(int): point following the last point of the range.
+
+            returns:
+                (MObject) or None when the shape type doesn't support ranges.
+        """
+        if self.shapeType not in self.RANGE_SHAPE_TYPES:
+            return None
+
+        return self.getComponentPoints(components.getPointRange(startIndex,
+                                                                endIndex))
+
+    def getComponentPoints(self,
+                           pointIndices):
+        """
+            Build a component holding arbitrary points of the shape, 
+            surface and lattice indices are computed in bulk by core.components.
+
+            args:
+                pointIndices(sequence of int): flat point indices in weightList order.
+
+            returns:
+                (MObject)
+        """
+        return components.createComponent(self.componentType,
+                                          self.componentCounts,
+                                          pointIndices)
+
+    def getChunkPointCount(self,
+                           memoryBudget):
+        """
+            Number of points whose new and old weights fit in the provided budget.
+
+            args:
+                memoryBudget(int): size in bytes allowed for one chunk.
+
+            returns:
+                (int)
+        """
+        chunkPointSize = 2 * self.DOUBLE_SIZE * max(self.jointPaths.length(), 1)
+
+        return max(int(memoryBudget) // chunkPointSize, 1)
+
     def extractFromAlembic(self,
                            sourceAlembic,
                            abcNamespace):
+        loadAlembicPlugins()
+
         maya.cmds.AbcImport(sourceAlembic, 
                             mode='import')
 
@@ -239,128 +293,357 @@ class SkinSet(object):
 
         maya.cmds.delete(anchorNode)
 
+    class DoubleStorage(object):
+        """
+            C storage of valueCount doubles held by an MScriptUtil,
+            writable from Python buffers without building float objects.
+        """
+        def __init__(self,
+                     valueCount):
+            self.valueCount = valueCount
+
+            self.valueUtils = maya.OpenMaya.MScriptUtil(maya.OpenMaya.MDoubleArray(max(valueCount, 1), 
+                                                                                   0.0))
+
+            self.buffer = (ctypes.c_char * (valueCount * SkinSet.DOUBLE_SIZE)).from_address(self.getAddress())
+
+        @classmethod
+        def fromDoubleArray(cls,
+                            doubleArray):
+            """
+                Storage holding a copy of an MDoubleArray, made by MScriptUtil in C.
+
+                returns:
+                    (SkinSet.DoubleStorage)
+            """
+            doubleStorage = cls.__new__(cls)
+
+            doubleStorage.valueCount = doubleArray.length()
+            doubleStorage.valueUtils = maya.OpenMaya.MScriptUtil(doubleArray)
+            doubleStorage.buffer = (ctypes.c_char * (doubleStorage.valueCount * SkinSet.DOUBLE_SIZE)).from_address(doubleStorage.getAddress())
+
+            return doubleStorage
+
+        def getAddress(self,
+                       valueOffset=0):
+            return int(self.valueUtils.asDoublePtr()) + valueOffset * SkinSet.DOUBLE_SIZE
+
+        def copyFrom(self,
+                     sourceStorage,
+                     valueOffset,
+                     valueCount):
+            """
+                Copy valueCount doubles of sourceStorage, starting at valueOffset, 
+                to the start of this storage.
+            """
+            ctypes.memmove(self.getAddress(),
+                           sourceStorage.getAddress(valueOffset),
+                           valueCount * SkinSet.DOUBLE_SIZE)
+
+        def getValues(self,
+                      valueOffset,
+                      valueCount):
+            """
+                returns:
+                    (array.array of double) copy of valueCount doubles starting at valueOffset.
+            """
+            values = array.array('d')
+
+            rawBytes = ctypes.string_at(self.getAddress(valueOffset),
+                                        valueCount * SkinSet.DOUBLE_SIZE)
+
+            if hasattr(values, 'frombytes'):
+                values.frombytes(rawBytes)
+            else:
+                values.fromstring(rawBytes)
+
+            return values
+
+        def toDoubleArray(self,
+                          valueCount=None):
+            if valueCount is None:
+                valueCount = self.valueCount
+
+            if valueCount == 0:
+                return maya.OpenMaya.MDoubleArray()
+
+            return maya.OpenMaya.MDoubleArray(self.valueUtils.asDoublePtr(), 
+                                              valueCount)
+
+    @staticmethod
+    def allocateDoubleStorage(byteCount):
+        """
+            Allocation callback of DiskDecodeCache.readInto.
+
+            returns:
+                (buffer) of a SkinSet.DoubleStorage, its owner is kept alive by the buffer.
+        """
+        doubleStorage = SkinSet.DoubleStorage(byteCount // SkinSet.DOUBLE_SIZE)
+        doubleStorage.buffer.storage = doubleStorage
+
+        return doubleStorage.buffer
+
+    @staticmethod
+    def toDoubleArray(values):
+        """
+            args:
+                values(array.array of float or sequence of float).
+
+            returns:
+                (MDoubleArray)
+        """
+        valueCount = len(values)
+
+        if valueCount == 0:
+            return maya.OpenMaya.MDoubleArray()
+
+        if hasattr(values, 'buffer_info') and values.typecode == 'd':
+            doubleStorage = SkinSet.DoubleStorage(valueCount)
+
+            ctypes.memmove(doubleStorage.getAddress(),
+                           values.buffer_info()[0],
+                           valueCount * SkinSet.DOUBLE_SIZE)
+
+            return doubleStorage.toDoubleArray()
+
+        valueUtils = maya.OpenMaya.MScriptUtil()
+        valueUtils.createFromList(list(values), 
+                                  valueCount)
+
+        return maya.OpenMaya.MDoubleArray(valueUtils.asDoublePtr(), 
+                                          valueCount)
+
+    @staticmethod
+    def toBytes(doubleArray):
+        """
+            Raw native byte order content of an MDoubleArray, copied once.
+
+            returns:
+                (bytes)
+        """
+        valueCount = doubleArray.length()
+
+        if valueCount == 0:
+            return b''
+
+        valueUtils = maya.OpenMaya.MScriptUtil(doubleArray)
+
+        return ctypes.string_at(int(valueUtils.asDoublePtr()),
+                                valueCount * SkinSet.DOUBLE_SIZE)
+
+    def getWeightCount(self):
+        """
+            returns:
+                (int) number of decoded weights, held by weightStorage or weightUtils.
+        """
+        if self.weightStorage is not None:
+            return self.weightStorage.valueCount
+
+        return self.weightUtils.length()
+
+    def getWeightArray(self):
+        """
+            returns:
+                (MDoubleArray) decoded weights, copied when they are only held by weightStorage.
+        """
+        if self.weightUtils is not None:
+            return self.weightUtils.array()
+
+        return self.weightStorage.toDoubleArray()
+
+    def keepWeightStorage(self):
+        """
+            Move decoded weights to a single SkinSet.DoubleStorage, so chunks can be sliced 
+            by address, and release the MFnDoubleArrayData they were decoded in.
+        """
+        if self.weightStorage is None:
+            self.weightStorage = SkinSet.DoubleStorage.fromDoubleArray(self.weightUtils.array())
+
+        self.weightUtils = None
+
+    def iterWeightBlocks(self,
+                         blockValueCount=WEIGHT_BLOCK_SIZE):
+        """
+            Decoded weights as array.array blocks, storage is read one block at a time.
+
+            returns:
+                (generator of array.array of double)
+        """
+        if self.weightStorage is None:
+            yield self.toValues(self.weightUtils.array())
+            return
+
+        for valueOffset in xrange(0, self.weightStorage.valueCount, blockValueCount):
+            yield self.weightStorage.getValues(valueOffset,
+                                               min(blockValueCount, 
+                                                   self.weightStorage.valueCount - valueOffset))
+
+    @staticmethod
+    def toValues(doubleArray):
+        """
+            returns:
+                (array.array of double) copy of an MDoubleArray, made without Python floats.
+        """
+        values = array.array('d')
+
+        rawBytes = SkinSet.toBytes(doubleArray)
+
+        if hasattr(values, 'frombytes'):
+            values.frombytes(rawBytes)
+        else:
+            values.fromstring(rawBytes)
+
+        return values
+
     def extractEmptyWeights(self):
         self.weightUtils = OpenMaya.MDoubleArray(self.pointCount, 0.0)
 
 
-class InjectionSettings(object):
+class WeightJournal(object):
+    """
+        Record of the weights overwritten by setWeights during a batch,
+        built from the oldValues buffers so a rollback needs no archive access.
+        Buffers are kept in memory up to memoryBudget bytes, later ones are spilled 
+        as raw doubles to an anonymous temporary file.
+    """
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
     def __init__(self,
-                 weightMode,
-                 fillStructure=True):
-        self.weightMode = ''
+                 memoryBudget=DEFAULT_MEMORY_BUDGET):
+        #(skinCluster, component, influenceIndices, oldValues or None, spill offset, byte count)
+        self.entries = []
 
-        self.assetScene = ''
+        self.memoryBudget = memoryBudget
 
-        self.userName = ''
+        self.memoryBytes = 0
 
-        self.saveTime = ''
+        self.spillFile = None
 
-        self.collect(weightMode)
+    def __len__(self):
+        return len(self.entries)
 
-    def collect(self,
-                weightMode):
-        self.weightMode = weightMode
+    def clear(self):
+        self.entries = []
 
-        self.assetScene = maya.cmds.file(q=True,
-                                         sceneName=True)
+        self.memoryBytes = 0
 
-        self.userName = getpass.getuser()
+        if self.spillFile is not None:
+            self.spillFile.close()
 
-        self.saveTime = str(datetime.datetime.now())
+        self.spillFile = None
 
-    def parseJsonFromArchive(self,
-                             sourceArchiveFile):
-        if not os.path.exists(sourceArchiveFile):
-            return False
+    def record(self,
+               skinCluster,
+               component,
+               influenceIndices,
+               oldValues):
+        """
+            Store the weights replaced by a setWeights call.
 
-        with zipfile.ZipFile(sourceArchiveFile, 'r') as archive:
-            jsonList = [info.filename for info in archive.infolist() 
-                        if info.filename.endswith('.mod')]
+            args:
+                skinCluster(string): name of the modified skinCluster.
 
-            jsonInput = [json.loads(archive.read(jsonElement)) for jsonElement in jsonList][0]
+                component(MObject): points modified by the call.
 
-            self.fromJson(jsonInput)
+                influenceIndices(MIntArray): influences modified by the call.
 
-        return True
+                oldValues(MDoubleArray): oldValues buffer filled by setWeights.
+        """
+        byteCount = oldValues.length() * SkinSet.DOUBLE_SIZE
 
-    def toJson(self):
-        return json.dumps(self, 
-                          cls=ObjectEncoder, 
-                          indent=2, 
-                          sort_keys=True)
+        if self.memoryBytes + byteCount <= self.memoryBudget:
+            self.memoryBytes += byteCount
 
-    def fromJson(self,
-                 inputSettings):
-        for key in inputSettings:
-            if hasattr(self, key):
-                setattr(self, key, inputSettings[key])
+            self.entries.append((skinCluster,
+                                 component,
+                                 influenceIndices,
+                                 oldValues,
+                                 0,
+                                 byteCount))
+            return
 
+        if self.spillFile is None:
+            self.spillFile = tempfile.TemporaryFile()
 
-class SkinSettings(object):
-    NODE_ATTRIBUTES = ('deformerName',
-                       'shape',
-                       'shapePath',
-                       'influences',
-                       'skinningMethod',
-                       'normalizeWeights',
-                       'abcWeightsFile')
+        self.spillFile.seek(0, os.SEEK_END)
+        spillOffset = self.spillFile.tell()
 
-    def __init__(self, 
-                 skinDeformer,
-                 collectData=True):
-        self.deformerName = None
-        self.shape = None
-        self.shapePath = None
-        self.influences = []
+        self.spillFile.write(SkinSet.toBytes(oldValues))
 
-        self.skinningMethod = 0
-        self.normalizeWeights = False
-        self.abcWeightsFile = None
+        self.entries.append((skinCluster,
+                             component,
+                             influenceIndices,
+                             None,
+                             spillOffset,
+                             byteCount))
 
-        self.processingTime = 0
-        self.report = ''
+    def readSpilledValues(self,
+                          spillOffset,
+                          byteCount):
+        """
+            returns:
+                (MDoubleArray) old values written to the spill file.
+        """
+        doubleBuffer = SkinSet.allocateDoubleStorage(byteCount)
 
-        if collectData is False:
-            return
+        self.spillFile.seek(spillOffset)
+        self.spillFile.readinto(doubleBuffer)
+
+        return doubleBuffer.storage.toDoubleArray()
+
+    def rollback(self):
+        """
+            Restore recorded weights in reverse order and empty the journal.
+
+            returns:
+                (list of string) names of the restored skinClusters.
+        """
+        journalSkinArray = set(entry[0] for entry in self.entries
+                               if maya.cmds.objExists(entry[0]))
+
+        with context.BatchSkinDisabled(journalSkinArray):
+            restoredSkinArray = self.restoreEntries()
+
+        self.clear()
+
+        return restoredSkinArray
 
-        self.skinDeformer = skinDeformer
+    def restoreEntries(self):
+        """
+            Pop journal entries and apply their old values.
 
-        self.getSkinSettings()
+            returns:
+                (list of string) names of the restored skinClusters.
+        """
+        restoredSkinArray = []
 
-    def getSkinSettings(self):
-        self.deformerName = self.skinDeformer
-        self.influences = maya.cmds.skinCluster(self.skinDeformer,
-                                                q=True,
-                                                inf=True)
+        skinDataMap = {}
 
-        self.skinningMethod = maya.cmds.getAttr('{}.skinningMethod'.format(self.skinDeformer))
-        self.normalizeWeights = maya.cmds.getAttr('{}.normalizeWeights'.format(self.skinDeformer))
+        while len(self.entries) > 0:
+            skinCluster, component, influenceIndices, oldValues, spillOffset, byteCount = self.entries.pop()
 
-        self.shape = maya.cmds.skinCluster(self.skinDeformer,
-                                           q=True,
-                                           geometry=True)[0]
+            if not maya.cmds.objExists(skinCluster):
+                continue
 
-    def toJson(self):
-        return json.dumps(self, 
-                          cls=ObjectEncoder, 
-                          indent=2, 
-                          sort_keys=True)
+            if oldValues is None:
+                oldValues = self.readSpilledValues(spillOffset,
+                                                   byteCount)
 
-    def fromJson(self,
-                 inputSkinSettings):
-        for key in inputSkinSettings:
-            if hasattr(self, key):
-                setattr(self, key, inputSkinSettings[key])
+            if skinCluster not in skinDataMap:
+                skinDataMap[skinCluster] = SkinSet(skinCluster)
 
-    def __repr__(self):
-        reportData = '<{0}'.format(self.__class__.__name__)
+            skinData = skinDataMap[skinCluster]
 
-        for attribute in self.NODE_ATTRIBUTES:
-            reportData += '\n\t{0}: {1}'.format(attribute, 
-                                                getattr(self,attribute))
+            skinData.skinFunctionUtils.setWeights(skinData.shapePath,
+                                                  component,
+                                                  influenceIndices,
+                                                  oldValues,
+                                                  False)
 
-        reportData += '>'
-        return reportData
+            if skinCluster not in restoredSkinArray:
+                restoredSkinArray.append(skinCluster)
+
+        return restoredSkinArray
 
 
 class ShapeSettings(object):
@@ -376,50 +659,60 @@ class ShapeSettings(object):
         self.vCount = 0
         self.wCount = 0
 
+        #Topology fingerprint, computed on first request see getTopologyFingerprint
+        self.topology = None
+
         self.getShapeSettings()
 
+    @classmethod
+    def fromShape(cls,
+                  shape):
+        """
+            Settings of a shape, resolved once per batch through the node cache.
+
+            args:
+                shape(string): shape name or path.
+
+            returns:
+                (ShapeSettings)
+        """
+        nodeData = nodes.getNodeData(shape)
+
+        if 'shapeSettings' not in nodeData:
+            nodeData['shapeSettings'] = cls(shape)
+
+        return nodeData['shapeSettings']
+
     @staticmethod
     def getShapeFromTransform(transformName):
         inputShapeArray = maya.cmds.listRelatives(transformName,
                                                   s=True,
-                                                  ni=True)
+                                                  ni=True,
+                                                  fullPath=True)
 
         if not inputShapeArray:
             return None
 
-        for currentShape in inputShapeArray:
-            shapeApiObject = ShapeSettings.getMObject(inputShapeArray[0])
-            shapePath = maya.OpenMaya.MDagPath()
-
-            maya.OpenMaya.MDagPath.getAPathTo(shapeApiObject,
-                                              shapePath)
-
-            geometryProcessor = maya.OpenMaya.MItGeometry(shapePath)
-            if geometryProcessor.count()==0:
-                return None
+        if ShapeSettings.fromShape(inputShapeArray[0]).pointCount == 0:
+            return None
 
         return inputShapeArray[0]
 
     @staticmethod
     def getMObject(nodeName):
-        selList = maya.OpenMaya.MSelectionList()
-        maya.OpenMaya.MGlobal.getSelectionListByName(nodeName, 
-                                                     selList)
-        depNode = maya.OpenMaya.MObject()
-        selList.getDependNode(0, depNode) 
-
-        return depNode
+        return nodes.getMObject(nodeName)
 
     def getShapeSettings(self):
-        self.transform = maya.cmds.listRelatives(self.shape, p=True)[0]
-        shapeApiObject = self.getMObject(self.shape)
+        self.shapePath = nodes.getDagPath(self.shape)
+
+        transformPath = maya.OpenMaya.MDagPath(self.shapePath)
+        transformPath.pop()
 
-        maya.OpenMaya.MDagPath.getAPathTo(shapeApiObject,
-                                          self.shapePath)    
+        self.transform = transformPath.partialPathName()
 
         pointCount = 0
         simpleShapeType = ['mesh', 'nurbsCurve']
-        self.shapeType = maya.cmds.nodeType(self.shape)
+        self.shapeType = maya.OpenMaya.MFnDependencyNode(self.shapePath.node()).typeName()
 
         if self.shapeType in simpleShapeType:
             componentType = maya.OpenMaya.MFn.kMeshVertComponent
@@ -430,7 +723,7 @@ class ShapeSettings(object):
 
             elif self.shapeType == 'nurbsCurve':
                 shapeFunctionUtils = maya.OpenMaya.MFnNurbsCurve(self.shapePath)
-                self.pointCount = shapeFunctionUtils.numVertices()
+                self.pointCount = shapeFunctionUtils.numCVs()
 
             self.uCount = int(self.pointCount)
 
@@ -472,32 +765,97 @@ class ShapeSettings(object):
 
             self.pointCount = sDivivision * tDivivision * uDivivision
 
-    def getComponent(self, pointIndex):
-        simpleShapeType = ['mesh', 'nurbsCurve']
+        else:
+            self.pointCount = maya.OpenMaya.MItGeometry(self.shapePath).count()
 
-        if self.shapeType in simpleShapeType:
-            return '{shape}.vtx[{pointIndex}]'.format(shape=self.transform,
-                                                      pointIndex=pointIndex)
+    @staticmethod
+    def getIntArrayChecksum(intArray,
+                            checksum=0):
+        """
+            Crc32 of the raw content of an MIntArray, no python list is built.
 
-        elif self.shapeType == 'nurbsSurface':
-            targetRow = pointIndex / self.vCount
-            targetColumn = pointIndex - targetRow
-            return '{shape}.cv[{row1}][{row2}]'.format(shape=self.transform,
-                                                       row1=targetRow,
-                                                       row2=targetColumn)
+            args:
+                intArray(MIntArray).
 
-        elif self.shapeType == 'lattice':
-            heightRatio = (self.uCount*self.vCount)
-            targetHeight = pointIndex / heightRatio
+                checksum(int): running checksum to continue from.
+
+            returns:
+                (int)
+        """
+        valueCount = intArray.length()
+
+        if valueCount == 0:
+            return checksum
+
+        valueUtils = maya.OpenMaya.MScriptUtil(intArray)
+
+        return zlib.crc32(ctypes.string_at(int(valueUtils.asIntPtr()),
+                                           valueCount * ctypes.sizeof(ctypes.c_int)),
+                          checksum)
+
+    def getTopologyFingerprint(self):
+        """
+            Identify the shape topology regardless of point positions,
+            meshes also hash their face vertex lists.
+            The result is kept on the instance, cached per batch by fromShape.
 
-            heightLevel = heightRatio*targetHeight
-            rowLevel = (heightLevel - targetHeight)
+            returns:
+                (string)
+        """
+        if self.topology is not None:
+            return self.topology
 
-            #print targetHeight, heightRatio, heightLevel, rowLevel, pointIndex
+        fingerprint = '{0}:{1}:{2}:{3}:{4}'.format(self.shapeType,
+                                                   self.pointCount,
+                                                   self.uCount,
+                                                   self.vCount,
+                                                   self.wCount)
 
-            targetRow = pointIndex / self.vCount
-            targetColumn = pointIndex - targetRow
-            return '{shape}.pt[{row1}][{row2}][{row3}]'.format(shape=self.transform,
-                                                               row1=targetColumn,
-                                                               row2=targetRow,
-                                                               row3=targetHeight)
\ No newline at end of file
+        if self.shapeType != 'mesh':
+            self.topology = fingerprint
+
+            return self.topology
+
+        shapeFunctionUtils = maya.OpenMaya.MFnMesh(self.shapePath)
+
+        vertexCountArray = maya.OpenMaya.MIntArray()
+        vertexArray = maya.OpenMaya.MIntArray()
+
+        shapeFunctionUtils.getVertices(vertexCountArray,
+                                       vertexArray)
+
+        topologyHash = self.getIntArrayChecksum(vertexCountArray)
+        topologyHash = self.getIntArrayChecksum(vertexArray, topologyHash)
+
+        self.topology = '{0}:{1}:{2:08x}'.format(fingerprint,
+                                                 shapeFunctionUtils.numPolygons(),
+                                                 topologyHash & 0xffffffff)
+
+        return self.topology
+
+    def getComponentCounts(self):
+        """
+            returns:
+                (tuple of int) (pointCount,), (uCount, vCount) for surfaces 
+                or (sCount, tCount, uCount) for lattices, see core.components.
+        """
+        if self.shapeType == 'nurbsSurface':
+            return (self.uCount, self.wCount)
+
+        if self.shapeType == 'lattice':
+            return (self.uCount, self.vCount, self.wCount)
+
+        return (self.pointCount,)
+
+    def getComponents(self, pointIndices):
+        """
+            returns:
+                (list of string) component names of the provided flat point indices.
+        """
+        return components.getComponentStrings(self.transform,
+                                              self.shapeType,
+                                              self.getComponentCounts(),
+                                              pointIndices)
+
+    def getComponent(self, pointIndex):
+        return self.getComponents([pointIndex])[0]
\ No newline at end of file
@@ -22,15 +22,21 @@
 
     https://opensource.org/licenses/MIT
 """
+import collections
 import os
 
-import maya.OpenMaya 
-import maya.OpenMayaAnim 
-import maya.OpenMayaUI
-import maya.cmds 
-import maya.mel
+try:
+    import maya.OpenMaya 
+    import maya.OpenMayaAnim 
+    import maya.OpenMayaUI
+    import maya.cmds 
+    import maya.mel
+except ImportError:
+    #Outside of Maya only the report formatting of SkinReport can be used
+    pass
 
 from skinIO.core import context
+from skinIO.core import nodes
 from skinIO.core import settings
 
 
@@ -38,6 +44,12 @@ class SkinValidator(object):
     """
         Test procedure validating if a skin file can be imported on the provided shape
     """
+    #MFn types of the shapes collected by expandObjectArray
+    SKINNABLE_SHAPE_TYPES = ('kMesh',
+                             'kNurbsCurve',
+                             'kNurbsSurface',
+                             'kLattice')
+
     def __init__(self):
         self.isInvalid = False
 
@@ -49,6 +61,18 @@ class SkinValidator(object):
 
         self.namespacePrefix = None
 
+        #Missing skinClusters are queued and built by rebuildPendingSkinClusters
+        self.deferRebuild = False
+
+        self.pendingRebuildArray = []
+
+        self.rebuildTimeMap = {}
+
+        #{skinCluster: number of skinClusters bound by the same call}, their rebuild time is an even split
+        self.rebuildGroupMap = {}
+
+        self.bulkRebuildTime = 0
+
     def getSkinClusters(self, inputTransform):
         skinClusters = []
         outputSkins = []
@@ -122,6 +146,124 @@ class SkinValidator(object):
 
         return list(set(outputSkins))
 
+    def getRootList(self,
+                    inputObjectArray):
+        """
+            Gather the dag roots described by transforms, shapes, objectSets and namespaces.
+
+            args:
+                inputObjectArray(list of string).
+
+            returns:
+                (MSelectionList)
+        """
+        rootList = maya.OpenMaya.MSelectionList()
+
+        for node in inputObjectArray:
+            if maya.cmds.objExists(node):
+                if maya.cmds.nodeType(node) == 'objectSet':
+                    setFunctionUtils = maya.OpenMaya.MFnSet(nodes.getMObject(node))
+                    setFunctionUtils.getMembers(rootList, True)
+                else:
+                    rootList.add(node)
+
+                continue
+
+            if not maya.cmds.namespace(exists=node):
+                continue
+
+            namespaceNodes = maya.cmds.namespaceInfo(node,
+                                                     listOnlyDependencyNodes=True,
+                                                     recurse=True,
+                                                     dagPath=True) or []
+
+            for namespaceNode in namespaceNodes:
+                if maya.cmds.objectType(namespaceNode, isAType='dagNode'):
+                    rootList.add(namespaceNode)
+
+        return rootList
+
+    def expandObjectArray(self,
+                          inputObjectArray):
+        """
+            Expand hierarchy roots, objectSets and namespaces to the transforms of their shapes
+            in a single MItDag walk, already visited branches are pruned. 
+            Intermediate, unsupported and empty shapes are skipped during the walk.
+
+            args:
+                inputObjectArray(list of string).
+
+            returns:
+                (list of string) transform full paths, ready for getSkinHistory.
+        """
+        rootList = self.getRootList(inputObjectArray)
+
+        visitedPaths = set()
+        transformArray = []
+        transformSet = set()
+
+        dagIterator = maya.OpenMaya.MItDag(maya.OpenMaya.MItDag.kDepthFirst,
+                                           maya.OpenMaya.MFn.kInvalid)
+
+        for rootIndex in xrange(rootList.length()):
+            rootPath = maya.OpenMaya.MDagPath()
+
+            try:
+                rootList.getDagPath(rootIndex, rootPath)
+            except RuntimeError:
+                continue
+
+            dagIterator.reset(rootPath,
+                              maya.OpenMaya.MItDag.kDepthFirst,
+                              maya.OpenMaya.MFn.kInvalid)
+
+            while not dagIterator.isDone():
+                currentPath = maya.OpenMaya.MDagPath()
+                dagIterator.getPath(currentPath)
+
+                fullPath = currentPath.fullPathName()
+
+                if fullPath in visitedPaths:
+                    dagIterator.prune()
+                    dagIterator.next()
+                    continue
+
+                visitedPaths.add(fullPath)
+
+                if self.isSkinnableShape(currentPath):
+                    transformPath = maya.OpenMaya.MDagPath(currentPath)
+                    transformPath.pop()
+
+                    transform = transformPath.fullPathName()
+
+                    if transform not in transformSet:
+                        transformSet.add(transform)
+                        transformArray.append(transform)
+
+                dagIterator.next()
+
+        return transformArray
+
+    def isSkinnableShape(self,
+                         shapePath):
+        """
+            args:
+                shapePath(MDagPath).
+
+            returns:
+                (bool) True for non intermediate meshes, curves, surfaces and lattices with points.
+        """
+        shapeObject = shapePath.node()
+
+        if not any(shapeObject.hasFn(getattr(maya.OpenMaya.MFn, shapeType)) 
+                   for shapeType in self.SKINNABLE_SHAPE_TYPES):
+            return False
+
+        if maya.OpenMaya.MFnDagNode(shapePath).isIntermediateObject():
+            return False
+
+        return settings.ShapeSettings.fromShape(shapePath.fullPathName()).pointCount > 0
+
     def getSkinFromObjectSet(self, inputShape):
         outputSkins = []
         skinObjectSets = maya.cmds.listConnections(inputShape,
@@ -148,7 +290,7 @@ class SkinValidator(object):
         return isValidNode
 
     def validateShape(self, inputShapePath):
-        shapeData = settings.ShapeSettings(inputShapePath)
+        shapeData = settings.ShapeSettings.fromShape(inputShapePath)
 
         if shapeData.pointCount==0:
             return True
@@ -277,6 +419,135 @@ class SkinValidator(object):
 
         maya.cmds.delete(unwantedNodes)
 
+    def rebuildPendingSkinClusters(self):
+        """
+            Build every queued skinCluster: skins sharing the same influence list
+            are bound by a single skinCluster call, accessory nodes of all new 
+            skinClusters are removed with a single delete.
+
+            returns:
+                (list of string) names of the rebuilt skinClusters.
+        """
+        if len(self.pendingRebuildArray) == 0:
+            return []
+
+        influenceGroups = collections.OrderedDict()
+
+        for skinSettings in self.pendingRebuildArray:
+            influenceGroups.setdefault(tuple(skinSettings.influences), []).append(skinSettings)
+
+        rebuiltSkinArray = []
+
+        processing = context.TimeProcessor(spanName='rebuild')
+        processing.displayProgressbar = False
+        processing.displayReport = False
+
+        with processing:
+            if maya.cmds.namespace(exists=self.rootNameSpace):
+                maya.cmds.namespace(setNamespace=self.rootNameSpace)
+
+            for influences, skinSettingsArray in influenceGroups.items():
+                groupProcessing = context.TimeProcessor(spanName='rebuild')
+                groupProcessing.displayProgressbar = False
+                groupProcessing.displayReport = False
+
+                with groupProcessing:
+                    groupSkinArray = self.bindSkinGroup(influences,
+                                                        skinSettingsArray)
+
+                #Individual times are not measured, each skin gets an even split of the group time
+                for skin in groupSkinArray:
+                    self.rebuildTimeMap[skin] = float(groupProcessing.timeRange) / len(groupSkinArray)
+                    self.rebuildGroupMap[skin] = len(groupSkinArray)
+
+                rebuiltSkinArray.extend(groupSkinArray)
+
+            if len(rebuiltSkinArray) > 0:
+                self.removeAccessoryNodes(rebuiltSkinArray)
+
+            if maya.cmds.namespace(exists=self.namespacePrefix):
+                maya.cmds.namespace(setNamespace=self.namespacePrefix)
+
+        self.bulkRebuildTime = float(processing.timeRange)
+
+        self.pendingRebuildArray = []
+
+        return rebuiltSkinArray
+
+    def bindSkinGroup(self,
+                      influences,
+                      skinSettingsArray):
+        """
+            Bind all shapes of skinSettingsArray to the same influence list in one call,
+            and give each new skinCluster its archived name.
+            Every shape must end up with its own skinCluster, shapes left unbound 
+            by the group call are bound one by one.
+
+            args:
+                influences(list of string): influence names shared by the group.
+
+                skinSettingsArray(list of SkinSettings).
+
+            returns:
+                (list of string) names of the new skinClusters.
+        """
+        geometryArray = [maya.cmds.listRelatives(skinSettings.shape,
+                                                 p=True,
+                                                 fullPath=True)[0]
+                         for skinSettings in skinSettingsArray]
+
+        maya.cmds.skinCluster(list(influences),
+                              geometryArray,
+                              dr=4.5,
+                              skinMethod=0 ,
+                              toSelectedBones=True ,
+                              maximumInfluences=1)
+
+        groupSkinArray = []
+
+        createdSkinSet = set()
+
+        for skinSettings, geometry in zip(skinSettingsArray, geometryArray):
+            createdSkinArray = self.getSkinHistory(skinSettings.shape)
+
+            if len(createdSkinArray) == 0:
+                maya.cmds.skinCluster(list(influences),
+                                      geometry,
+                                      dr=4.5,
+                                      skinMethod=0 ,
+                                      toSelectedBones=True ,
+                                      maximumInfluences=1)
+
+                createdSkinArray = self.getSkinHistory(skinSettings.shape)
+
+            if len(createdSkinArray) != 1 or createdSkinArray[0] in createdSkinSet:
+                raise RuntimeError('Rebuilding {0} did not create a skinCluster of its own'.format(skinSettings.shape))
+
+            createdSkinSet.add(createdSkinArray[0])
+
+            skinSettings.deformerName = maya.cmds.rename(createdSkinArray[0],
+                                                         skinSettings.deformerName)
+
+            groupSkinArray.append(skinSettings.deformerName)
+
+        return groupSkinArray
+
+    def getRebuildTime(self,
+                       inputDeformerName):
+        return self.rebuildTimeMap.get(inputDeformerName, 0)
+
+    def getRebuildGroupSize(self,
+                            inputDeformerName):
+        """
+            returns:
+                (int) number of skinClusters rebuilt with inputDeformerName by a single call.
+        """
+        return self.rebuildGroupMap.get(inputDeformerName, 1)
+
+    def wasRebuilt(self,
+                   inputDeformerName):
+        return inputDeformerName in self.rebuildTimeMap
+
     def processInputSetting(self,
                             skinSettings):
         self.isInvalid = False
@@ -307,8 +578,15 @@ class SkinValidator(object):
         isSkinClusterDeformingCurrentShape = self.validateSkin(skinSettings.deformerName, 
                                                                skinSettings.shape)
 
+        if isSkinClusterDeformingCurrentShape is None and self.deferRebuild is True:
+            self.pendingRebuildArray.append(skinSettings)
+
+            self.skinWasrebuilt = True
+
+            return
+
         if isSkinClusterDeformingCurrentShape is None:
-            processing = context.TimeProcessor()
+            processing = context.TimeProcessor(spanName='rebuild')
             processing.displayProgressbar = False
             processing.displayReport = False
 
@@ -323,6 +601,8 @@ class SkinValidator(object):
 
             self.rebuildTime = float(processing.timeRange)
 
+            self.rebuildTimeMap[skinSettings.deformerName] = self.rebuildTime
+
             self.skinWasrebuilt = True
 
             return
@@ -342,7 +622,7 @@ class SkinValidator(object):
                                                               skinSettings.influences)
 
         if needsSkinClusterRebuilding is True:
-            processing = context.TimeProcessor()
+            processing = context.TimeProcessor(spanName='rebuild')
             processing.displayProgressbar = False
             processing.displayReport = False
 
@@ -355,6 +635,8 @@ class SkinValidator(object):
 
             self.rebuildTime = float(processing.timeRange)
 
+            self.rebuildTimeMap[skinSettings.deformerName] = self.rebuildTime
+
             self.skinWasrebuilt = True
 
 
@@ -408,12 +690,16 @@ class SkinReport(object):
                             inReport,
                             sourceAbcFile,
                             rebuildTime,
-                            skinWasrebuilt):
+                            skinWasrebuilt,
+                            rebuildGroupSize=1):
         componentReport = '\n<Skin Weights Import report:>' 
         componentReport += '\n\tLoading data from {} .'.format(os.path.basename(sourceAbcFile)) 
         componentReport += '\n\tGeometry {0}'.format(shape) 
 
-        if skinWasrebuilt:
+        if skinWasrebuilt and rebuildGroupSize > 1:
+            componentReport += '\n\tRebuilding skincluster took {0} seconds (even split of {1} skinclusters bound together)'.format(rebuildTime,
+                                                                                                                              rebuildGroupSize)
+        elif skinWasrebuilt:
             componentReport += '\n\tRebuilding skincluster took {0} seconds'.format(rebuildTime)
 
         componentReport += '\t{0}'.format(inReport) 
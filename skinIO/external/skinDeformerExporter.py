@@ -1,14 +1,17 @@
-import xml.etree.ElementTree
 import time
 import maya.mel as mel
 import maya.cmds as cmds
 
+from skinIO import skinUtils
+from skinIO.archive import deformerWeights
+
 
 class SkinDeformerExporter(object):
     def __init__(self, path=None):
         self.path = path
         self.shapes = {}
         self.fileName = None
+        self.layout = None
         
         if self.path:
             self.parseFile(self.path)
@@ -25,11 +28,18 @@ class SkinDeformerExporter(object):
             #make a skincluster using the joints
             if cmds.objExists(shape):
                 ss = self.shapes[shape]
-                skinList = ss.joints
+
+                if mel.eval('findRelatedSkinCluster ' + shape) != '':
+                    continue
+
+                skinList = [joint for joint in ss.joints if cmds.objExists(joint)]
                 skinList.append(shape)
                 cmds.select(skinList, r=True)
-                cluster = cmds.skinCluster(name=ss.skin, tsb=1)
-                cmds.deformerWeights(fname , path = fpath, deformer=ss.skin, im=1)
+                cmds.skinCluster(name=ss.skin, tsb=1)
+
+        #weights are streamed from the xml file, one setWeights per skin
+        return skinUtils.PointWeights().importDeformerWeights(self.path,
+                                                              layout=self.layout)
     
     def saveWeightInfo(self, fpath, meshes, all=True):
         t1 = time.time()
@@ -49,22 +59,19 @@ class SkinDeformerExporter(object):
             cmds.deformerWeights(meshDict[skin] + '.skinWeights', path=fpath, ex=True, deformer=skin)
         
         elapsed = time.time()-t1
-        print 'Exported skinWeights for', len(meshes), 'meshes in', elapsed, 'seconds.'
+        print('Exported skinWeights for {0} meshes in {1} seconds.'.format(len(meshes), elapsed))
     
     def parseFile(self, path):
-        root = xml.etree.ElementTree.parse(path).getroot()
-        
+        self.path = path
+        self.shapes = {}
+
+        #one pass reads the header and influence names, weights are streamed by applyWeightInfo
+        self.layout = deformerWeights.readLayout(path)
+
         #set the header info
-        for atype in root.findall('headerInfo'):
-            self.fileName = atype.get('fileName')
-        
-        for atype in root.findall('weights'):
-            jnt = atype.get('source')
-            shape = atype.get('shape')
-            clusterName = atype.get('deformer')
-            
-            if shape not in self.shapes.keys():
-                self.shapes[shape] = self.skinnedShape(shape=shape, skin=clusterName, joints=[jnt])
-            else:
-                s = self.shapes[shape]
-                s.joints.append(jnt)
\ No newline at end of file
+        self.fileName = self.layout.headerInfo.get('fileName')
+
+        for skinWeights in self.layout.skinArray:
+            self.shapes[skinWeights.shape] = self.skinnedShape(shape=skinWeights.shape, 
+                                                               skin=skinWeights.deformerName, 
+                                                               joints=skinWeights.influences)
\ No newline at end of file
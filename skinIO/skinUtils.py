@@ -30,8 +30,10 @@ import maya.OpenMayaUI
 import maya.cmds 
 import maya.mel
 
+import array
 import inspect
 import json
+import multiprocessing.pool
 import os
 import posixpath 
 import tempfile
@@ -41,7 +43,14 @@ import uuid
 import zipfile
 
 
+from skinIO.archive import deformerWeights
+from skinIO.core import cache
 from skinIO.core import context
+from skinIO.core import metrics
+from skinIO.core import nodes
+from skinIO.core import pointWeights
+from skinIO.core import profiling
+from skinIO.core import progress
 from skinIO.core import settings
 from skinIO.core import validation
 
@@ -117,6 +126,8 @@ class Omphallos(object):
                                              attribute='shapePaths',
                                              targetFile=targetShapeFile)
 
+        settings.loadAlembicPlugins()
+
         maya.cmds.AbcExport(verbose=True, j=exportCommand)
         maya.cmds.delete(self.repository, ch=True)
         maya.cmds.delete(self.repository)
@@ -205,6 +216,8 @@ class Omphallos(object):
                                              attribute='shapePaths',
                                              targetFile=targetShapeFile)
 
+        settings.loadAlembicPlugins()
+
         maya.cmds.AbcExport(verbose=True, j=exportCommand)
 
         maya.cmds.delete(self.repository, ch=True)
@@ -231,47 +244,271 @@ class Omphallos(object):
 
 
 class PointWeights(object):
+    """
+        Stream skin weights to and from sparse .wgt files, see core.pointWeights.
+        Weights are read and written through MFnSkinCluster by ranges of chunkPointCount points,
+        so huge shapes are processed in bounded memory.
+    """
+    FILE_EXTENSION = '.wgt'
+
+    CHUNK_POINT_COUNT = 10000
+
     def __init__(self):
-        self.timeProcessing = context.TimeProcessor()
+        self.timeProcessing = context.TimeProcessor(spanName='skinProcess')
+
+        self.chunkPointCount = self.CHUNK_POINT_COUNT
+
+    def getSkinData(self,
+                    inputMesh):
+        """
+            returns:
+                (SkinSet) or None when inputMesh is not deformed by a skinCluster.
+        """
+        validationUtils = validation.SkinValidator()
+        inputSkinNodes = validationUtils.getSkinHistory(inputMesh)
 
-    def importWeights(self, inputMesh):
-        pass
+        if len(inputSkinNodes) == 0:
+            return None
 
-    def getWeights(self, 
-                   inputMesh, 
-                   skinSettings,
-                   shapeSettings):
-        for pointIndex in xrange(shapeSettings.pointCount):
-            component = self.getComponent(pointIndex, shapeSettings)
+        skinData = settings.SkinSet(inputSkinNodes[0])
+        skinData.getShapeFullComponents()
+        skinData.getInfluenceIndices()
 
-            rawWeights = maya.cmds.skinPercent(component,
-                                               skinSettings.skinDeformer,
-                                               q=True,
-                                               value=True)
+        return skinData
 
-            return {weightIndex:weight \
-                    for weightIndex, weight \
-                    in enumerate(rawWeights) if weight > 0.0}
+    def getTargetFile(self,
+                      inputMesh,
+                      targetDirectory):
+        fileName = inputMesh.split('|')[-1].replace(':', '_')
+
+        return os.path.join(targetDirectory, 
+                            fileName + self.FILE_EXTENSION)
+
+    def getWeights(self,
+                   skinData,
+                   startIndex,
+                   endIndex):
+        """
+            args:
+                skinData(SkinSet).
+
+                startIndex(int): first point of the range.
+
+                endIndex(int): point following the last point of the range.
+
+            returns:
+                (MDoubleArray) point major weights of the range.
+        """
+        chunkComponent = skinData.getComponentRange(startIndex,
+                                                    endIndex)
+
+        chunkWeights = maya.OpenMaya.MDoubleArray()
+
+        skinData.skinFunctionUtils.getWeights(skinData.shapePath,
+                                              chunkComponent,
+                                              skinData.influenceIndices,
+                                              chunkWeights)
+
+        return chunkWeights
 
     def saveWeights(self,
                     inputMesh, 
                     targetDirectory):
-        targetFile = os.path.join(targetDirectory, '{0}.wgt'.format(inputMesh))
+        """
+            args:
+                inputMesh(string): transform or shape deformed by a skinCluster.
 
-        skinNode = maya.mel.eval('findRelatedSkinCluster {}'.format(inputMesh))
-        if skinNode is None:
-            return
+                targetDirectory(string).
+
+            returns:
+                (string) written .wgt file, None when inputMesh has no skinCluster.
+        """
+        skinData = self.getSkinData(inputMesh)
+
+        if skinData is None:
+            return None
+
+        skinDeformer = skinData.skinFunctionUtils.name()
+
+        influences = [skinData.jointPaths[influenceIndex].partialPathName() 
+                      for influenceIndex in xrange(skinData.jointPaths.length())]
+
+        targetFile = self.getTargetFile(inputMesh,
+                                        targetDirectory)
+
+        with self.timeProcessing, \
+        profiling.PROFILER.span('encode', skin=skinDeformer) as span, \
+        pointWeights.WgtWriter(targetFile) as weightWriter:
+            weightWriter.writeHeader(skinDeformer,
+                                     skinData.shapePath.fullPathName(),
+                                     skinData.pointCount,
+                                     influences)
+
+            for startIndex in xrange(0, skinData.pointCount, self.chunkPointCount):
+                endIndex = min(startIndex + self.chunkPointCount,
+                               skinData.pointCount)
+
+                weightWriter.writeChunk(startIndex,
+                                        self.getWeights(skinData,
+                                                        startIndex,
+                                                        endIndex))
+
+            span.addBytes(weightWriter.outputFile.tell())
+
+        return targetFile
+
+    def getInfluenceIndices(self,
+                            skinData,
+                            influenceArray):
+        """
+            Match the influences of a .wgt file with the skinCluster ones, 
+            by name then by name without dag path and namespace.
+
+            returns:
+                (MIntArray) or None when an influence is missing from the skinCluster.
+        """
+        skinInfluenceMap = {}
+
+        for influenceIndex in xrange(skinData.jointPaths.length()):
+            influencePath = skinData.jointPaths[influenceIndex]
+
+            skinInfluenceMap[influencePath.partialPathName()] = influenceIndex
+            skinInfluenceMap.setdefault(influencePath.partialPathName().split('|')[-1].split(':')[-1],
+                                        influenceIndex)
+
+        influenceIndices = maya.OpenMaya.MIntArray(len(influenceArray))
+
+        for arrayIndex, influence in enumerate(influenceArray):
+            influenceIndex = skinInfluenceMap.get(influence)
+
+            if influenceIndex is None:
+                influenceIndex = skinInfluenceMap.get(influence.split('|')[-1].split(':')[-1])
+
+            if influenceIndex is None:
+                maya.OpenMaya.MGlobal.displayWarning('{0} is not an influence of {1}'.format(influence,
+                                                                                             skinData.skinFunctionUtils.name()))
+                return None
+
+            influenceIndices.set(influenceIndex,
+                                 arrayIndex)
+
+        return influenceIndices
+
+    def importWeights(self, 
+                      inputMesh,
+                      sourceFile):
+        """
+            args:
+                inputMesh(string): transform or shape deformed by a skinCluster.
+
+                sourceFile(string): .wgt file written by saveWeights.
+
+            returns:
+                (bool) True when the weights were applied.
+        """
+        skinData = self.getSkinData(inputMesh)
+
+        if skinData is None:
+            return False
+
+        skinDeformer = skinData.skinFunctionUtils.name()
+
+        with self.timeProcessing, \
+        profiling.PROFILER.span('apply', skin=skinDeformer), \
+        pointWeights.WgtReader(sourceFile) as weightReader:
+            if weightReader.pointCount != skinData.pointCount:
+                maya.OpenMaya.MGlobal.displayWarning('Point count of {0} does not match {1}'.format(inputMesh,
+                                                                                                   sourceFile))
+                return False
+
+            influenceIndices = self.getInfluenceIndices(skinData,
+                                                        weightReader.influences)
+
+            if influenceIndices is None:
+                return False
+
+            with context.SkinDisabled(skinDeformer):
+                for startIndex, endIndex, values in weightReader.iterChunks(self.chunkPointCount):
+                    chunkComponent = skinData.getComponentRange(startIndex,
+                                                                endIndex)
+
+                    skinData.skinFunctionUtils.setWeights(skinData.shapePath,
+                                                          chunkComponent,
+                                                          influenceIndices,
+                                                          settings.SkinSet.toDoubleArray(values),
+                                                          False)
+
+        return True
+
+    def importDeformerWeights(self,
+                              sourceFile,
+                              layout=None):
+        """
+            Apply a deformerWeights xml file with a single setWeights per skin.
+            The xml is streamed by archive.deformerWeights, only the weights of 
+            the current skin are held in memory.
+
+            args:
+                sourceFile(string): xml file written by the deformerWeights command.
+
+                layout(deformerWeights.WeightsLayout): layout already read from sourceFile.
+
+            returns:
+                (list of string) skinClusters whose weights were applied.
+        """
+        appliedSkinArray = []
+
+        for skinWeights in deformerWeights.iterSkins(sourceFile,
+                                                     layout=layout):
+            if not maya.cmds.objExists(skinWeights.shape):
+                maya.OpenMaya.MGlobal.displayWarning('{0} does not exist'.format(skinWeights.shape))
+                continue
+
+            skinData = self.getSkinData(skinWeights.shape)
+
+            if skinData is None:
+                maya.OpenMaya.MGlobal.displayWarning('{0} is not deformed by a skinCluster'.format(skinWeights.shape))
+                continue
+
+            skinDeformer = skinData.skinFunctionUtils.name()
+
+            if skinWeights.getPointCount() > skinData.pointCount:
+                maya.OpenMaya.MGlobal.displayWarning('Point count of {0} does not match {1}'.format(skinWeights.shape,
+                                                                                                   sourceFile))
+                continue
+
+            influenceIndices = self.getInfluenceIndices(skinData,
+                                                        skinWeights.influences)
+
+            if influenceIndices is None:
+                continue
+
+            influenceCount = len(skinWeights.influences)
 
-        skinSettings = settings.SkinSettings(skinNode)
-        shapeSettings = settings.ShapeSettings(skinSettings.shape)
+            #Filled as a Python buffer, handed to Maya with a single copy
+            denseValues = array.array('d', [0.0]) * (skinData.pointCount * influenceCount)
 
-        with open(targetFile, 'w') as skinFile:
-            for pointIndex in xrange(shapeSettings.pointCount):
-                skinData = self.getWeights(inputMesh, 
-                                           skinSettings,
-                                           shapeSettings)
+            for arrayIndex, influenceWeights in enumerate(skinWeights.influenceArray):
+                for pointIndex, value in zip(influenceWeights.pointIndices,
+                                             influenceWeights.values):
+                    denseValues[pointIndex * influenceCount + arrayIndex] = value
 
-                skinFile.write(skinData)
+            weightArray = settings.SkinSet.toDoubleArray(denseValues)
+
+            denseValues = None
+
+            with self.timeProcessing, \
+            profiling.PROFILER.span('apply', skin=skinDeformer), \
+            context.SkinDisabled(skinDeformer):
+                skinData.skinFunctionUtils.setWeights(skinData.shapePath,
+                                                      skinData.fullComponentPointSet,
+                                                      influenceIndices,
+                                                      weightArray,
+                                                      False)
+
+            appliedSkinArray.append(skinDeformer)
+
+        return appliedSkinArray
 
 
 class DataInjection(object):
@@ -283,10 +520,15 @@ class DataInjection(object):
 
     WEIGHT_NAMESPACE = 'skinNamespace_weights'
 
+    MAYA_FILE_EXTENSIONS = {'mayaAscii': 'ma',
+                            'mayaBinary': 'mb'}
+
+    SHARD_MANIFEST_EXTENSION = '.shards'
+
     def __init__(self):
-        self.timeProcessing = context.TimeProcessor()
+        self.timeProcessing = context.TimeProcessor(spanName='skinProcess')
 
-        self.batchProcessing = context.TimeProcessor()
+        self.batchProcessing = context.TimeProcessor(spanName='batch')
 
         self.processingTime = 0
 
@@ -306,6 +548,59 @@ class DataInjection(object):
 
         self.mayaFileType = "mayaAscii"
 
+        #Opened on first use by getSourceArchive
+        self.sourceArchive = None
+
+        self.sourceArchiveFile = None
+
+        #Archive the current source comes from, differs from sourceArchiveFile for prefetched shards
+        self.originArchiveFile = None
+
+        #Reuse metadata and payloads decoded by previous imports of an unchanged archive,
+        #only effective once the decode cache is given a size
+        self.useDecodeCache = True
+
+        #Local directory holding uncompressed payloads across processes, defaults to $SKINIO_DISK_CACHE
+        self.diskCacheDirectory = None
+
+        #'skn' string table metadata, 'json' for archives read by older skinIO releases
+        self.metadataFormat = 'skn'
+
+        #Set of skinCluster or shape names to import, every archived skin when None
+        self.skinFilter = None
+
+        #Store shape topology fingerprints on export, only read by fan-out matching
+        self.storeTopology = False
+
+        self.weightJournal = settings.WeightJournal()
+
+        self.rollbackOnError = True
+
+        self.collectMetrics = False
+
+        #Sink file or directory, next to the archive when None
+        self.metricsSinkFile = None
+
+        self.metricsMap = {}
+
+        self.progressReporter = None
+
+        #Keep completed skins in a journal so an interrupted export can resume
+        self.checkpointExport = False
+
+        self.journalFile = None
+
+        self.exportJournal = {}
+
+        #Split skins over shard archives, by shard count or by skins/bytes per shard
+        self.shardCount = 0
+
+        self.shardMaxSkins = 0
+
+        self.shardMaxBytes = 0
+
+        self.shardWorkerCount = 4
+
         self.injectionSettings = settings.InjectionSettings(None,
                                                             False)
 
@@ -334,7 +629,8 @@ class DataInjection(object):
                      unpackDirectory,
                      outputSkinSettings):
         """
-            Save the current skin dictionary to a json file
+            Save the current skin dictionary to a metadata file,
+            compact .skn string table by default or indented .json when metadataFormat is 'json'.
 
             args:
                 targetArchiveFile(output archive zip file path(string))
@@ -346,12 +642,23 @@ class DataInjection(object):
         """
         jsonSkinFileExtention = os.path.splitext(targetArchiveFile)[1]
 
-        jsonSkinFileName = os.path.basename(targetArchiveFile).replace(jsonSkinFileExtention, '.json')
+        metadataExtension = settings.SkinMetadata.EXTENSION
+
+        if self.metadataFormat == 'json':
+            metadataExtension = settings.SkinMetadata.LEGACY_EXTENSION
+
+        jsonSkinFileName = os.path.basename(targetArchiveFile).replace(jsonSkinFileExtention, metadataExtension)
         jsonSkinFile = posixpath.join(unpackDirectory,
                                       jsonSkinFileName)
 
-        with open(jsonSkinFile, "w") as outfile:
-            json.dump(outputSkinSettings, outfile , indent=4)
+        with profiling.PROFILER.span('encode', member=jsonSkinFileName) as span:
+            with open(jsonSkinFile, "w") as outfile:
+                if self.metadataFormat == 'json':
+                    json.dump(outputSkinSettings, outfile , indent=4)
+                else:
+                    outfile.write(settings.SkinMetadata.encode(outputSkinSettings))
+
+            span.addBytes(os.path.getsize(jsonSkinFile))
 
         return jsonSkinFile, jsonSkinFileName
 
@@ -385,9 +692,11 @@ class DataInjection(object):
                                      jsonModFileName)
 
         with open(jsonModFile, "w") as outfile:
-            json.dump(json.loads(injectionData.toJson()), outfile , indent=4)
+            json.dump(injectionData.toDict(), outfile , indent=4)
+
+        temporaryArchiveFile = '{0}.tmp'.format(targetArchiveFile)
 
-        with zipfile.ZipFile(targetArchiveFile, 
+        with zipfile.ZipFile(temporaryArchiveFile, 
                              'w', 
                              compression=zipfile.ZIP_DEFLATED) as outputZip:
             outputZip.write(jsonModFile, r'{0}'.format(jsonModFileName))
@@ -396,7 +705,17 @@ class DataInjection(object):
 
             for component in sceneWeights:
                 zipName = os.path.basename(component.abcWeightsFile)
-                outputZip.write(component.abcWeightsFile, r'%s'%zipName)
+
+                with profiling.PROFILER.span('compress', skin=component.deformerName) as span:
+                    outputZip.write(component.abcWeightsFile, r'%s'%zipName)
+
+                    span.addBytes(outputZip.getinfo(zipName).compress_size)
+
+                if component.deformerName in self.metricsMap:
+                    self.metricsMap[component.deformerName].compressedBytes = outputZip.getinfo(zipName).compress_size
+
+        self.finalizeArchive(temporaryArchiveFile,
+                             targetArchiveFile)
 
     def transferToDisk(self, 
                        skin, 
@@ -411,7 +730,9 @@ class DataInjection(object):
         """
         self.timeProcessing.displayReport = False
 
-        with self.timeProcessing:
+        self.timeProcessing.skin = skin
+
+        with self.timeProcessing, profiling.PROFILER.span('write') as span:
             maya.cmds.select(skin, r=True)
             maya.cmds.file(targetSkinFile,
                            force=True, 
@@ -423,6 +744,8 @@ class DataInjection(object):
                            exp=False,
                            sh=False)
 
+            span.addBytes(os.path.getsize(targetSkinFile))
+
     def saveWeights(self,
                     skin,
                     targetSkinDirectory):
@@ -437,7 +760,8 @@ class DataInjection(object):
         maya.cmds.select(skin, 
                          r=True)
 
-        targetSkinFileName = '{0}_skinWeights.ma'.format(skin)
+        targetSkinFileName = '{0}_skinWeights.{1}'.format(skin,
+                                                          self.MAYA_FILE_EXTENSIONS[self.mayaFileType])
 
         targetSkinFile = posixpath.join(targetSkinDirectory,
                                         targetSkinFileName)
@@ -483,8 +807,74 @@ class DataInjection(object):
                                                      s=True,
                                                      fullPath=True)[0]
 
+        if self.storeTopology is True:
+            skinSettings.topology = settings.ShapeSettings.fromShape(skinSettings.shape).getTopologyFingerprint()
+
+        self.recordSkinMetrics('export',
+                               skinSettings)
+
         return skinSettings
 
+    def recordSkinMetrics(self,
+                          operation,
+                          skinSettings):
+        """
+            Start the metrics record of a skinCluster when metrics are collected.
+
+            args:
+                operation(string): export or import.
+
+                skinSettings(SkinSettings).
+
+            returns:
+                (SkinMetrics) or None
+        """
+        if self.collectMetrics is False:
+            return None
+
+        skinMetrics = metrics.SkinMetrics(operation,
+                                          self.mayaFileType,
+                                          skinSettings.deformerName)
+
+        skinMetrics.shape = skinSettings.shape
+        skinMetrics.influences = len(skinSettings.influences)
+
+        if maya.cmds.objExists(skinSettings.shape):
+            skinMetrics.points = settings.ShapeSettings.fromShape(skinSettings.shape).pointCount
+
+        skinMetrics.rawBytes = skinMetrics.points * skinMetrics.influences * settings.SkinSet.DOUBLE_SIZE
+
+        self.metricsMap[skinSettings.deformerName] = skinMetrics
+
+        return skinMetrics
+
+    def publishMetrics(self,
+                       archiveFile):
+        """
+            Complete metrics records with profiling stages and write them to the sink.
+
+            args:
+                archiveFile(string): processed archive file path.
+        """
+        if self.collectMetrics is False:
+            return
+
+        metricsArray = []
+
+        for deformerName in sorted(self.metricsMap):
+            skinMetrics = self.metricsMap[deformerName]
+
+            skinMetrics.archive = archiveFile
+            skinMetrics.stages = profiling.PROFILER.getStageTimes(deformerName)
+
+            metricsArray.append(skinMetrics)
+
+        metricsSink = metrics.MetricsSink.fromArchive(archiveFile,
+                                                      targetFile=self.metricsSinkFile)
+        metricsSink.write(metricsArray)
+
+        self.metricsMap = {}
+
     def collectSkinSettings(self,
                             objectArray,
                             unpackDirectory,
@@ -499,9 +889,14 @@ class DataInjection(object):
                 unpackDirectory(string):directory path for the exported data.
         """
         for component in objectArray:
-            targetSkinSettings = self.export(component,
-                                             unpackDirectory,
-                                             displayReport=False)
+            self.batchProcessing.checkCancelled()
+
+            targetSkinSettings = self.resumeFromJournal(component)
+
+            if targetSkinSettings is None:
+                targetSkinSettings = self.export(component,
+                                                 unpackDirectory,
+                                                 displayReport=False)
 
             if targetSkinSettings is None:
                 continue
@@ -510,20 +905,128 @@ class DataInjection(object):
 
             self.processingTime += targetSkinSettings.processingTime
 
-            if self.batchProcessing.displayProgressbar is True:
-                self.batchProcessing.progressbar.advanceProgress(1)
+            payloadSize = 0
+            if targetSkinSettings.abcWeightsFile and os.path.exists(targetSkinSettings.abcWeightsFile):
+                payloadSize = os.path.getsize(targetSkinSettings.abcWeightsFile)
 
-            if exposeWeightDetails is True:
-                if len(targetSkinSettings.report) ==0:
-                    continue
+            self.batchProcessing.advanceProgress(1,
+                                                 byteCount=payloadSize,
+                                                 label=targetSkinSettings.deformerName)
 
+            if exposeWeightDetails is True and len(targetSkinSettings.report) > 0:
                 self.batchProcessing.report += targetSkinSettings.report.replace('\n', '\n\t\t')
 
                 self.batchProcessing.report += '\n'
 
             targetSkinSettings.report = ''
 
-            self.skinMetadata[targetSkinSettings.deformerName] = json.loads(targetSkinSettings.toJson())
+            self.skinMetadata[targetSkinSettings.deformerName] = targetSkinSettings.toDict()
+
+            self.writeJournalEntry(component,
+                                   self.skinMetadata[targetSkinSettings.deformerName])
+
+    def getJournalFile(self,
+                       targetSkinFile):
+        return '{0}.journal'.format(targetSkinFile)
+
+    def getCheckpointFolder(self,
+                            targetSkinFile):
+        return '{0}.parts'.format(targetSkinFile)
+
+    def readExportJournal(self,
+                          journalFile):
+        """
+            Read skins completed by a previous checkpointed export.
+
+            args:
+                journalFile(string): journal file path.
+
+            returns:
+                (dict) transform name: skin settings dict
+        """
+        exportJournal = {}
+
+        if not os.path.exists(journalFile):
+            return exportJournal
+
+        with open(journalFile, 'r') as journalStream:
+            for line in journalStream:
+                try:
+                    journalEntry = json.loads(line)
+                except ValueError:
+                    #Last line may be truncated by a crash
+                    continue
+
+                exportJournal[journalEntry['transform']] = journalEntry['skinSettings']
+
+        return exportJournal
+
+    def writeJournalEntry(self,
+                          component,
+                          skinData):
+        """
+            Record a completed skin in the export journal.
+
+            args:
+                component(string): exported transform name.
+
+                skinData(dict): json data of its SkinSettings.
+        """
+        if self.journalFile is None:
+            return
+
+        if component in self.exportJournal:
+            return
+
+        journalEntry = json.dumps({'transform': component,
+                                   'skinSettings': skinData})
+
+        with open(self.journalFile, 'a') as journalStream:
+            journalStream.write(journalEntry + '\n')
+            journalStream.flush()
+            os.fsync(journalStream.fileno())
+
+    def resumeFromJournal(self,
+                          component):
+        """
+            Reuse the payload exported by a previous run for this transform.
+
+            args:
+                component(string): transform name.
+
+            returns:
+                (SkinSettings) or None when the transform still has to be exported.
+        """
+        if component not in self.exportJournal:
+            return None
+
+        skinData = self.exportJournal[component]
+
+        if not skinData.get('abcWeightsFile') or not os.path.exists(skinData['abcWeightsFile']):
+            return None
+
+        skinSettings = settings.SkinSettings(None,
+                                             collectData=False)
+        skinSettings.fromJson(skinData)
+
+        return skinSettings
+
+    def finalizeArchive(self,
+                        temporaryArchiveFile,
+                        targetArchiveFile):
+        """
+            Move a completed archive to its final path in one rename.
+        """
+        if hasattr(os, 'replace'):
+            os.replace(temporaryArchiveFile,
+                       targetArchiveFile)
+            return
+
+        if os.name == 'nt' and os.path.exists(targetArchiveFile):
+            os.remove(targetArchiveFile)
+
+        os.rename(temporaryArchiveFile,
+                  targetArchiveFile)
 
     def packageDistribution(self,
                             targetSkinFile,
@@ -536,6 +1039,11 @@ class DataInjection(object):
 
                 unpackDirectory(string):directory path for the exported data.
         """
+        if self.shardCount > 0 or self.shardMaxSkins > 0 or self.shardMaxBytes > 0:
+            self.packageShards(targetSkinFile,
+                               unpackDirectory)
+            return
+
         jsonSkinFile, jsonSkinFileName = self.saveSettings(targetSkinFile, 
                                                            unpackDirectory,
                                                            self.skinMetadata)
@@ -546,67 +1054,197 @@ class DataInjection(object):
                                                targetSkinFile,
                                                unpackDirectory)
 
-    def resetManager(self,
-                     showProgressbar,
-                     objectCount,
-                     exposeWeightDetails):
+    def getShardGroups(self,
+                       sceneWeights):
         """
-            Reset Instance properties and utilities functions.
+            Split skins over shards, either balancing payload sizes over shardCount shards
+            or filling shards up to shardMaxSkins/shardMaxBytes.
 
             args:
-                showProgressbar(bool).
-
-                objectCount(int): (used to defined progressbar range)
+                sceneWeights(list of SkinSettings).
 
-                exposeWeightDetails(bool): allows time and additional report at the and of computation.
+            returns:
+                (list of list of SkinSettings)
         """
-        self.batchProcessing = context.TimeProcessor()
-        self.batchProcessing.displayProgressbar = showProgressbar
+        payloadSizes = dict((component.deformerName, os.path.getsize(component.abcWeightsFile))
+                            for component in sceneWeights)
 
-        self.batchProcessing.progressbarRange = objectCount
-        self.batchProcessing.displayReport = exposeWeightDetails
+        if self.shardCount > 0:
+            shardGroups = [[] for shardIndex in xrange(min(self.shardCount, len(sceneWeights)))]
+            shardSizes = [0] * len(shardGroups)
 
-        self.batchProcessing.report = '\n<@{0}: Batch Processing report :>'.format(self.__class__.__name__) 
+            for component in sorted(sceneWeights, 
+                                    key=lambda component: payloadSizes[component.deformerName],
+                                    reverse=True):
+                shardIndex = shardSizes.index(min(shardSizes))
 
-        self.sceneWeights = []
+                shardGroups[shardIndex].append(component)
+                shardSizes[shardIndex] += payloadSizes[component.deformerName]
 
-        self.skinMetadata = {}
+            return shardGroups
 
-    def collectAdditionalData(self, *args):
-        """
-            Utility function used in instance.
-        """
-        self.batchProcessing.report += '\n\t Saving {} elements took {} seconds\n'.format(len(self.sceneWeights),
-                                                                                          self.processingTime)
+        shardGroups = [[]]
+        shardSize = 0
 
-    def validateObjectArray(self,
-                            inputObjectArray):
-        objectArray = []
+        for component in sceneWeights:
+            payloadSize = payloadSizes[component.deformerName]
 
-        for node in inputObjectArray:
-            shapeData = settings.ShapeSettings.getShapeFromTransform(node)
+            isFull = self.shardMaxSkins > 0 and len(shardGroups[-1]) >= self.shardMaxSkins
+            isFull = isFull or (self.shardMaxBytes > 0 and shardSize + payloadSize > self.shardMaxBytes)
 
-            if shapeData is None:
-                continue
+            if isFull and len(shardGroups[-1]) > 0:
+                shardGroups.append([])
+                shardSize = 0
 
-            objectArray.append(node)
+            shardGroups[-1].append(component)
+            shardSize += payloadSize
 
-        return objectArray
+        return shardGroups
 
-    def exportAssetWeights(self,
-                           inputObjectArray,
-                           targetSkinFile,
-                           exposeWeightDetails=True,
-                           showProgressbar=True):
-        """
-            Entry function to save skiweights of provided object list.
+    def getShardFile(self,
+                     targetSkinFile,
+                     shardIndex):
+        archiveName, archiveExtension = os.path.splitext(targetSkinFile)
 
-            objectArray(list of transform names influenced by a skincluster).
+        return '{0}.shard{1:03d}{2}'.format(archiveName,
+                                             shardIndex,
+                                             archiveExtension)
 
-            targetSkinFile(string):file path for the exported data.
+    def packageShards(self,
+                      targetSkinFile,
+                      unpackDirectory):
+        """
+            Store skins in several self-contained shard archives next to targetSkinFile,
+            targetSkinFile only holds the injection settings and the shard manifest.
+
+            args:
+                targetSkinFile(string):Archive file path.
+
+                unpackDirectory(string):directory path for the exported data.
+        """
+        shardManifest = {'shards': []}
+
+        for shardIndex, shardWeights in enumerate(self.getShardGroups(self.sceneWeights)):
+            shardFile = self.getShardFile(targetSkinFile,
+                                          shardIndex)
+
+            shardMetadata = dict((component.deformerName, self.skinMetadata[component.deformerName])
+                                 for component in shardWeights)
+
+            jsonSkinFile, jsonSkinFileName = self.saveSettings(shardFile, 
+                                                               unpackDirectory,
+                                                               shardMetadata)
+
+            self.bundleSkinComponentsInArchiveFile(shardWeights,
+                                                   jsonSkinFile,
+                                                   jsonSkinFileName,
+                                                   shardFile,
+                                                   unpackDirectory)
+
+            shardManifest['shards'].append({'file': os.path.basename(shardFile),
+                                            'bytes': os.path.getsize(shardFile),
+                                            'skins': dict((component.deformerName, component.shape)
+                                                          for component in shardWeights)})
+
+        archiveExtension = os.path.splitext(targetSkinFile)[1]
+        archiveName = os.path.basename(targetSkinFile).replace(archiveExtension, '')
+
+        injectionData = settings.InjectionSettings(self.mayaFileType)
+
+        temporaryArchiveFile = '{0}.tmp'.format(targetSkinFile)
+
+        with zipfile.ZipFile(temporaryArchiveFile, 
+                             'w', 
+                             compression=zipfile.ZIP_DEFLATED) as outputZip:
+            outputZip.writestr(archiveName + '.mod',
+                               injectionData.toJson())
+
+            outputZip.writestr(archiveName + self.SHARD_MANIFEST_EXTENSION,
+                               json.dumps(shardManifest, indent=4))
+
+        self.finalizeArchive(temporaryArchiveFile,
+                             targetSkinFile)
+
+    def resetManager(self,
+                     showProgressbar,
+                     objectCount,
+                     exposeWeightDetails):
+        """
+            Reset Instance properties and utilities functions.
+
+            args:
+                showProgressbar(bool).
+
+                objectCount(int): (used to defined progressbar range)
+
+                exposeWeightDetails(bool): allows time and additional report at the and of computation.
+        """
+        self.batchProcessing = context.TimeProcessor(spanName='batch')
+        self.batchProcessing.displayProgressbar = showProgressbar
+        self.batchProcessing.progressReporter = self.progressReporter
+
+        self.batchProcessing.progressbarRange = objectCount
+        self.batchProcessing.displayReport = exposeWeightDetails
+
+        self.batchProcessing.report = '\n<@{0}: Batch Processing report :>'.format(self.__class__.__name__) 
+
+        self.sceneWeights = []
+
+        self.skinMetadata = {}
+
+        self.metricsMap = {}
+
+    def collectAdditionalData(self, *args):
+        """
+            Utility function used in instance.
+        """
+        self.batchProcessing.report += '\n\t Saving {} elements took {} seconds\n'.format(len(self.sceneWeights),
+                                                                                          self.processingTime)
+
+    def validateObjectArray(self,
+                            inputObjectArray):
+        """
+            Expand transforms, hierarchy roots, objectSets and namespaces 
+            to the transforms of their skinnable shapes.
+
+            args:
+                inputObjectArray(list of string).
+
+            returns:
+                (list of string) transform full paths.
+        """
+        return validation.SkinValidator().expandObjectArray(inputObjectArray)
+
+    def exportAssetWeights(self,
+                           inputObjectArray,
+                           targetSkinFile,
+                           exposeWeightDetails=True,
+                           showProgressbar=True):
+        """
+            Entry function to save skiweights of provided object list.
+
+            objectArray(list of transforms, hierarchy roots, objectSets or namespaces).
+
+            targetSkinFile(string):file path for the exported data.
 
             showProgressbar(bool).
         """
+        profiling.PROFILER.reset()
+
+        with nodes.NODE_CACHE:
+            return self.exportObjectArray(inputObjectArray,
+                                          targetSkinFile,
+                                          exposeWeightDetails,
+                                          showProgressbar)
+
+    def exportObjectArray(self,
+                          inputObjectArray,
+                          targetSkinFile,
+                          exposeWeightDetails,
+                          showProgressbar):
+        """
+            Export body of exportAssetWeights, run while the node cache batch is open.
+        """
         if len(inputObjectArray) == 0:
             return 'Object array is empty'
 
@@ -630,10 +1268,21 @@ class DataInjection(object):
         neighbourFolder = posixpath.join(targetDirectory, 
                                          pathSuffix[0:len(pathSuffix)/4])
 
+        self.journalFile = None
+        self.exportJournal = {}
+
+        if self.checkpointExport is True:
+            neighbourFolder = self.getCheckpointFolder(targetSkinFile)
+
+            self.journalFile = self.getJournalFile(targetSkinFile)
+            self.exportJournal = self.readExportJournal(self.journalFile)
+
         if len(self.skinNodeArray) == 0:
             return 0.0
 
-        with context.SelectionSaved(), context.TemporaryDirectory(dir=neighbourFolder) as unpackDirectory:
+        with context.SelectionSaved(), \
+        context.TemporaryDirectory(dir=neighbourFolder,
+                                   keepOnError=self.checkpointExport) as unpackDirectory:
             with self.batchProcessing:
                 self.collectSkinSettings(objectArray,
                                          unpackDirectory,
@@ -644,480 +1293,1587 @@ class DataInjection(object):
             self.packageDistribution(targetSkinFile,
                                      unpackDirectory)
 
+        if self.journalFile is not None and os.path.exists(self.journalFile):
+            os.remove(self.journalFile)
+
+        self.journalFile = None
+
+        self.publishMetrics(targetSkinFile)
+
         return float(self.batchProcessing.timeRange)
 
     def parseJsonFromArchive(self,
                              sourceArchiveFile):
+        """
+            Read the skin metadata of an archive, preferring the compact .skn member 
+            over the legacy .json member.
+            Only skins matching skinFilter are turned into SkinSettings.
+
+            returns:
+                (bool) False when sourceArchiveFile does not exist.
+        """
         if not os.path.exists(sourceArchiveFile):
             return False
 
-        with zipfile.ZipFile(sourceArchiveFile, 'r') as archive:
-            jsonList = [info.filename for info in archive.infolist() 
-                        if info.filename.endswith('.json')]
-
-            jsonInput = [json.loads(archive.read(jsonElement)) for jsonElement in jsonList][0]
+        cacheKey = self.getDecodeCacheKey(self.originArchiveFile or sourceArchiveFile,
+                                          'metadata')
 
-        self.jsonArray = []
+        skinMetadata = None
 
-        for jsonData in jsonInput:
-            skinData = settings.SkinSettings(None,
-                                             collectData=False)
+        if cacheKey is not None:
+            skinMetadata = cache.DECODE_CACHE.get(cacheKey)
 
-            skinData.fromJson(jsonInput[jsonData])
+        diskCache = None
 
-            self.jsonArray.append(skinData)
+        if skinMetadata is None:
+            diskCache = self.getDiskCache()
 
-        return True
+        if diskCache is not None:
+            archiveHash = diskCache.getArchiveHash(sourceArchiveFile)
 
-    def processArchive(self, 
-                       sourceArchiveFile):
-        if not self.injectionSettings.parseJsonFromArchive(sourceArchiveFile):
-            return False
+            for extension in ('skn', 'json'):
+                metadataBytes = diskCache.readBytes(archiveHash,
+                                                    'metadata',
+                                                    extension=extension)
 
-        return True
+                if metadataBytes is not None:
+                    skinMetadata = settings.SkinMetadata.fromMember('.' + extension, 
+                                                                    metadataBytes)
+                    break
 
-    def importAssetWeights(self, 
-                           sourceArchiveFile,
-                           exposeWeightDetails=True,
-                           showProgressbar=True):
-        if not self.parseJsonFromArchive(sourceArchiveFile):
-            return False
+        if skinMetadata is None:
+            with zipfile.ZipFile(sourceArchiveFile, 'r') as archive, \
+            profiling.PROFILER.span('read', member='metadata') as span:
+                memberList = [info.filename for info in archive.infolist() 
+                              if info.filename.endswith(settings.SkinMetadata.EXTENSION)]
 
-        self.batchProcessing.displayProgressbar = showProgressbar
-        self.batchProcessing.displayReport = exposeWeightDetails
-        self.batchProcessing.progressbarRange = len(self.jsonArray)
+                if len(memberList) == 0:
+                    memberList = [info.filename for info in archive.infolist() 
+                                  if info.filename.endswith(settings.SkinMetadata.LEGACY_EXTENSION)]
 
-        with self.batchProcessing:
-            with context.TemporaryDirectory() as unpackDirectory, \
-            zipfile.ZipFile(sourceArchiveFile, 'r') as archive:
-                archive.extractall(unpackDirectory)
-                self.batchProcessing.report = '\n<Batch Processing report :>' 
+                metadataBytes = archive.read(memberList[0])
+                skinMetadata = settings.SkinMetadata.fromMember(memberList[0],
+                                                                metadataBytes)
 
-                self.processWeights(unpackDirectory)
+                span.addBytes(len(metadataBytes))
 
-                self.batchProcessing.report += self.timeProcessing.report.replace('\n', '\n\t')
+            if diskCache is not None:
+                diskCache.writeBytes(archiveHash,
+                                     'metadata',
+                                     metadataBytes,
+                                     extension=os.path.splitext(memberList[0])[1][1:])
 
-                self.batchProcessing.report += '\n\t<Successfully processed {} components>'.format(self.batchProcessing.processObjectCount) 
+        if cacheKey is not None and cacheKey not in cache.DECODE_CACHE:
+            cache.DECODE_CACHE.put(cacheKey,
+                                   skinMetadata,
+                                   len(metadataBytes))
 
-        return float(self.batchProcessing.timeRange)
+        self.jsonArray = []
 
-    def processWeights(self,
-                       unpackDirectory):
-        self.validationUtils = validation.SkinValidator()
+        for deformerName in skinMetadata.keys():
+            if not self.matchSkinFilter(deformerName,
+                                        skinMetadata.getShape(deformerName)):
+                continue
 
-        self.validationUtils.rootNameSpace = maya.cmds.namespaceInfo(currentNamespace=True)
+            self.jsonArray.append(skinMetadata.getSkinSettings(deformerName))
 
-        self.validationUtils.namespacePrefix = self.WEIGHT_NAMESPACE
+        return True
 
-        self.skinNodeArray = []
+    def matchSkinFilter(self,
+                        deformerName,
+                        shape):
+        """
+            args:
+                deformerName(string): archived skinCluster name.
 
-        for skinSettings in self.jsonArray:
-            self.validationUtils.processInputSetting(skinSettings)
+                shape(string): archived shape path.
 
-            if self.validationUtils.isInvalid:
-                continue
+            returns:
+                (bool) True when no skinFilter is set or when the skin or its shape is part of it.
+        """
+        if self.skinFilter is None:
+            return True
 
-            self.batchProcessing.processObjectCount += 1
+        if deformerName in self.skinFilter:
+            return True
 
-            self.skinNodeArray.append(skinSettings.deformerName)
+        if shape is None:
+            return False
 
+        return shape in self.skinFilter or shape.split('|')[-1] in self.skinFilter
 
-class AsciiInjection(DataInjection):
-    def __init__(self):
-        super(AsciiInjection, self).__init__()
+    def processArchive(self, 
+                       sourceArchiveFile):
+        """
+            Read the injection settings (.mod) of an archive, 
+            served by the decode cache when the archive is unchanged.
 
-        self.mayaFileType = "mayaAscii"
+            returns:
+                (bool) False when sourceArchiveFile does not exist.
+        """
+        if not os.path.exists(sourceArchiveFile):
+            return False
 
-    def export(self,
-               inputTransform,
-               targetDirectory,
-               displayReport=False):
-        skinSettings = super(AsciiInjection,
-                             self).export(inputTransform,
-                                          targetDirectory,
-                                          displayReport=False)
+        cacheKey = self.getDecodeCacheKey(sourceArchiveFile,
+                                          'settings')
 
-        if skinSettings is None:
-            return None
+        settingsData = None
 
-        skinSettings.abcWeightsFile = self.saveWeights(skinSettings.skinDeformer,
-                                                       targetDirectory)
+        if cacheKey is not None:
+            settingsData = cache.DECODE_CACHE.get(cacheKey)
 
-        skinSettings.processingTime = float(self.timeProcessing.timeRange)
+        if settingsData is not None:
+            self.injectionSettings.fromJson(settingsData)
+            return True
 
-        skinSettings.report = self.reporter.publishReport(skinSettings.skinDeformer, 
-                                                          skinSettings.abcWeightsFile,
-                                                          None)
+        if not self.injectionSettings.parseJsonFromArchive(sourceArchiveFile):
+            return False
 
-        return skinSettings
+        if cacheKey is not None:
+            settingsData = self.injectionSettings.toDict()
 
-    def processWeights(self,
-                       unpackDirectory):
-        super(AsciiInjection, self).processWeights(unpackDirectory)
+            cache.DECODE_CACHE.put(cacheKey,
+                                   settingsData,
+                                   len(json.dumps(settingsData)))
 
-        self.importWeights(unpackDirectory)
+        return True
 
-    def importWeights(self,
-                      unpackDirectory,
-                      sourceFile=False):
-        for skinSettings in self.jsonArray:
-            if skinSettings.deformerName not in self.skinNodeArray:
-                continue
+    def readShardManifest(self,
+                          sourceArchiveFile):
+        """
+            returns:
+                (dict) shard manifest, None when sourceArchiveFile holds skins itself.
+        """
+        if not os.path.exists(sourceArchiveFile):
+            return None
 
-            skinSettings.abcWeightsFile = os.path.basename(skinSettings.abcWeightsFile)
+        cacheKey = self.getDecodeCacheKey(sourceArchiveFile,
+                                          'shards')
 
-            skinSettings.abcWeightsFile = os.path.join(unpackDirectory,
-                                                       skinSettings.abcWeightsFile)
+        #Archives without manifest are cached as [None]
+        cachedManifest = None
 
-            skinSettings.abcWeightsFile = skinSettings.abcWeightsFile.replace('\\', '/')
+        if cacheKey is not None:
+            cachedManifest = cache.DECODE_CACHE.get(cacheKey)
 
-            targetFile = self.consolidateFile(skinSettings.abcWeightsFile)
+        if cachedManifest is not None:
+            return cachedManifest[0]
 
-            with context.SkinDisabled(skinSettings.deformerName):
-                maya.cmds.select(skinSettings.deformerName, 
-                                 r=True)
+        shardManifest = None
+        manifestBytes = b''
 
-                maya.cmds.skinPercent(skinSettings.deformerName,
-                                      '{}.vtx[*]'.format(skinSettings.shape), 
-                                      transformValue=[(skinSettings.influences[0], 0.0)])
+        with zipfile.ZipFile(sourceArchiveFile, 'r') as archive:
+            manifestList = [info.filename for info in archive.infolist() 
+                            if info.filename.endswith(self.SHARD_MANIFEST_EXTENSION)]
 
-                if sourceFile is True:
-                    maya.mel.eval('source "{0}";'.format(targetFile))
-                else:
-                    maya.cmds.file(targetFile,
-                                   i=True, 
-                                   type=self.mayaFileType)
+            if len(manifestList) > 0:
+                manifestBytes = archive.read(manifestList[0])
+                shardManifest = json.loads(manifestBytes)
 
+        if cacheKey is not None:
+            cache.DECODE_CACHE.put(cacheKey,
+                                   [shardManifest],
+                                   max(len(manifestBytes), 1))
 
-            self.reportArray.append(self.reporter.publishImportReport(skinSettings.shape, 
-                                                                      self.timeProcessing.report,
-                                                                      skinSettings.abcWeightsFile,
-                                                                      self.validationUtils.rebuildTime,
-                                                                      self.validationUtils.skinWasrebuilt))
+        return shardManifest
 
-            if self.batchProcessing.displayProgressbar is True:
-                self.batchProcessing.progressbar.advanceProgress(1)
+    def getRequiredShards(self,
+                          sourceArchiveFile,
+                          shardManifest):
+        """
+            Shard files holding at least one skin whose shape is in the scene.
+        """
+        shardDirectory = os.path.dirname(sourceArchiveFile)
 
-        self.timeProcessing.report = ''
+        shardFileArray = []
 
-        for report in self.reportArray:
-            self.timeProcessing.report += report.replace('\n', '\n\t')
+        for shardData in shardManifest['shards']:
+            skinArray = [(deformerName, shape) for deformerName, shape in shardData['skins'].items()
+                         if self.matchSkinFilter(deformerName, shape)]
 
-            self.timeProcessing.report += '\n'
+            if not any(maya.cmds.objExists(shape) for deformerName, shape in skinArray):
+                continue
 
-    def consolidateFile(self, 
-                        weightsFile):
-        tempDirectory = os.path.dirname(weightsFile)
-        targetFile = "{0}/{1}.temp".format(tempDirectory,
-                                           os.path.basename(weightsFile))
-        
-        with open(targetFile, 'w') as asciiFile:
-            asciiFile.write('requires maya "2015";')
-            for line in self.filterAscii(weightsFile):
-                asciiFile.write(line)
+            shardFileArray.append(posixpath.join(shardDirectory,
+                                                 shardData['file']))
 
-        return targetFile
+        return shardFileArray
 
-    def filterAscii(self,
-                    weightsFile):
-        startCollect = False
-        with open(weightsFile, 'r') as asciiFile:
-            for line in asciiFile:
-                if 'createNode skinCluster -n' in line:
-                    startCollect = True
+    def prefetchShard(self,
+                      shardFile):
+        """
+            Copy a shard archive to local temporary storage.
+        """
+        localHandle, localShardFile = tempfile.mkstemp(suffix=os.path.basename(shardFile))
+        os.close(localHandle)
 
-                if startCollect is True and 'createNode' not in line:
-                    if 'rename -uid' not in line:
-                        yield line
+        with profiling.PROFILER.span('read', member=os.path.basename(shardFile)) as span:
+            shutil.copyfile(shardFile,
+                            localShardFile)
 
-                if startCollect is True and line.endswith('".pm";'):
-                    startCollect = False
+            span.addBytes(os.path.getsize(localShardFile))
 
-                if startCollect is True and 'createNode' in line and \
-                    'createNode skinCluster -n' not in line:
-                    startCollect = False
+        return localShardFile
 
+    def importShardedArchive(self,
+                             sourceArchiveFile,
+                             shardManifest,
+                             exposeWeightDetails,
+                             showProgressbar):
+        """
+            Import the shards needed by the current scene, shard archives are fetched
+            in parallel while weights are applied one shard at a time.
 
-class BinaryInjection(DataInjection):
-    def __init__(self):
-        super(BinaryInjection, self).__init__()
+            returns:
+                (float) processing time of all shards, False when a shard can't be read.
+        """
+        shardFileArray = self.getRequiredShards(sourceArchiveFile,
+                                                shardManifest)
 
-        self.mayaFileType = "mayaBinary"
+        if len(shardFileArray) == 0:
+            return 0.0
 
-    def export(self,
-               inputTransform,
-               targetDirectory,
-               displayReport=False):
-        skinSettings = super(BinaryInjection, self).export(inputTransform,
-                                                           targetDirectory,
-                                                           displayReport=False)
+        workerPool = multiprocessing.pool.ThreadPool(max(min(self.shardWorkerCount, len(shardFileArray)), 1))
 
-        if skinSettings is None:
-            return None
+        try:
+            localShardArray = workerPool.map(self.prefetchShard, shardFileArray)
+        finally:
+            workerPool.close()
+            workerPool.join()
 
-        skinSettings.abcWeightsFile = ''
+        processingTime = 0.0
 
-        skinSettings.processingTime = float(self.timeProcessing.timeRange)
+        failedShardArray = []
 
-        skinSettings.report = self.timeProcessing.report
+        shardReport = '\n<Sharded archive report: {0}/{1} shards>'.format(len(shardFileArray),
+                                                                           len(shardManifest['shards']))
 
-        return skinSettings
+        try:
+            for shardFile, localShardFile in zip(shardFileArray, localShardArray):
+                shardTime = self.importArchive(localShardFile,
+                                               exposeWeightDetails,
+                                               showProgressbar,
+                                               originArchiveFile=shardFile)
 
-    def collectAdditionalData(self,
-                              unpackDirectory):
-        skinSettings = settings.SkinSettings(None,
-                                    collectData=False)
+                if shardTime is False:
+                    failedShardArray.append(shardFile)
+                    continue
 
-        skinSettings.abcWeightsFile = posixpath.join(unpackDirectory,
-                                                     'BinaryInjection_skinweight.mb')
+                processingTime += shardTime
 
-        self.transferToDisk(self.skinNodeArray, 
-                            skinSettings.abcWeightsFile)
+                shardReport += self.batchProcessing.report.replace('\n', '\n\t')
+        finally:
+            for localShardFile in localShardArray:
+                if os.path.exists(localShardFile):
+                    os.remove(localShardFile)
 
-        self.sceneWeights = [skinSettings]
+        for shardFile in failedShardArray:
+            shardReport += '\n\tUnable to read shard {0}'.format(shardFile)
 
-        report = self.timeProcessing.report.replace('\n', '\n\t')
+        self.batchProcessing.report = shardReport
 
-        report += '\n'
-        report += "\n\t<End of BinaryExtraction>"
+        if len(failedShardArray) > 0:
+            maya.OpenMaya.MGlobal.displayWarning('Unable to read shards {0}'.format(', '.join(failedShardArray)))
 
-        self.batchProcessing.report += report
-        self.batchProcessing.report += '\n\t Saving {} elements took {} seconds\n'.format(len(self.skinNodeArray),
-                                                                                          float(self.timeProcessing.timeRange))
+            return False
 
-    def importWeights(self, 
-                      targetSkinFile,
-                      skinNodeArray=None,
-                      namespacePrefix="skinNamespace_weights"):
-        self.timeProcessing.displayProgressbar = True
-        self.timeProcessing.progressbarRange = len(self.skinNodeArray)
-        self.timeProcessing.displayReport = False
+        return processingTime
 
-        with self.timeProcessing:
-            with context.TemporaryNamespace(None,
-                                            namespacePrefix,
-                                            targetSkinFile=targetSkinFile,
-                                            fileType="mayaBinary"):
-                importSkinNodeArray = maya.cmds.namespaceInfo(namespacePrefix, 
-                                                              listOnlyDependencyNodes=True)
+    def importAssetWeights(self, 
+                           sourceArchiveFile,
+                           exposeWeightDetails=True,
+                           showProgressbar=True):
+        self.weightJournal.clear()
 
-                if skinNodeArray is None:
-                    skinNodeArray = [skin.replace(namespacePrefix+':', '')
-                                     for skin in importSkinNodeArray 
-                                     if maya.cmds.objExists(skin.replace(namespacePrefix+':', '')) is True \
-                                     and maya.cmds.nodeType(skin) == 'skinCluster']
+        profiling.PROFILER.reset()
 
-                for skin in skinNodeArray:
-                    maya.cmds.nodeCast(skin, 
-                                       namespacePrefix+':' + skin, 
-                                       disconnectUnmatchedAttrs=True,
-                                       swapNames=True )
-                    if self.timeProcessing.displayProgressbar is True:
-                        self.timeProcessing.progressbar.advanceProgress(1)
+        shardManifest = self.readShardManifest(sourceArchiveFile)
 
-                self.timeProcessing.report = "\n<BinaryInjection Report"
+        with nodes.NODE_CACHE:
+            if shardManifest is not None:
+                return self.importShardedArchive(sourceArchiveFile,
+                                                 shardManifest,
+                                                 exposeWeightDetails,
+                                                 showProgressbar)
+
+            return self.importArchive(sourceArchiveFile,
+                                      exposeWeightDetails,
+                                      showProgressbar)
+
+    def importArchive(self, 
+                      sourceArchiveFile,
+                      exposeWeightDetails,
+                      showProgressbar,
+                      originArchiveFile=None):
+        """
+            Import all skins stored in a single archive.
+
+            args:
+                originArchiveFile(string): archive sourceArchiveFile was copied from,
+                used for metrics records and decode cache keys.
+
+            returns:
+                (float) processing time or False when the archive can't be read.
+        """
+        self.originArchiveFile = originArchiveFile or sourceArchiveFile
+
+        if not self.parseJsonFromArchive(sourceArchiveFile):
+            return False
+
+        self.batchProcessing.displayProgressbar = showProgressbar
+        self.batchProcessing.progressReporter = self.progressReporter
+        self.batchProcessing.displayReport = exposeWeightDetails
+        self.batchProcessing.progressbarRange = len(self.jsonArray)
+
+        self.reportArray = []
+
+        self.metricsMap = {}
+
+        with self.batchProcessing:
+            with context.TemporaryDirectory() as unpackDirectory:
+                self.sourceArchiveFile = sourceArchiveFile
+
+                try:
+                    self.extractArchive(unpackDirectory)
+                    self.batchProcessing.report = '\n<Batch Processing report :>' 
+
+                    self.processWeights(unpackDirectory)
+                except:
+                    if self.rollbackOnError is True:
+                        self.rollback()
+
+                    raise
+                finally:
+                    self.closeSourceArchive()
+
+                    nodes.NODE_CACHE.clear()
+
+                    diskCache = self.getDiskCache()
+
+                    if diskCache is not None and diskCache.pendingBytes > 0:
+                        diskCache.evict()
+
+                self.batchProcessing.report += self.timeProcessing.report.replace('\n', '\n\t')
+
+                self.batchProcessing.report += '\n\t<Successfully processed {} components>'.format(self.batchProcessing.processObjectCount) 
+
+        self.publishMetrics(self.originArchiveFile)
+
+        return float(self.batchProcessing.timeRange)
+
+    def rollback(self):
+        """
+            Restore the weights overwritten by the last import batch.
+
+            returns:
+                (list of string) names of the restored skinClusters.
+        """
+        restoredSkinArray = self.weightJournal.rollback()
+
+        for skin in restoredSkinArray:
+            maya.OpenMaya.MGlobal.displayInfo('Restored previous weights of {}'.format(skin))
+
+        return restoredSkinArray
+
+    def getSourceArchive(self):
+        """
+            Open the current source archive on first access, 
+            imports served by the decode cache never read it.
+
+            returns:
+                (ZipFile)
+        """
+        if self.sourceArchive is None:
+            self.sourceArchive = zipfile.ZipFile(self.sourceArchiveFile, 'r')
+
+        return self.sourceArchive
+
+    def closeSourceArchive(self):
+        if self.sourceArchive is not None:
+            self.sourceArchive.close()
+
+        self.sourceArchive = None
+
+    def getDecodeCacheKey(self,
+                          archiveFile,
+                          memberName):
+        """
+            returns:
+                (tuple) decode cache key or None when the cache is disabled.
+        """
+        if self.useDecodeCache is False or not cache.DECODE_CACHE.isEnabled():
+            return None
+
+        return cache.DECODE_CACHE.getKey(archiveFile,
+                                         memberName)
+
+    def getDiskCache(self):
+        """
+            returns:
+                (DiskDecodeCache) or None when no disk cache is configured.
+        """
+        if self.useDecodeCache is False:
+            return None
+
+        directory = self.diskCacheDirectory or os.environ.get(cache.DiskDecodeCache.ENVIRONMENT_VARIABLE)
+
+        if not directory:
+            return None
+
+        return cache.getDiskCache(directory)
+
+    def extractArchive(self,
+                       unpackDirectory):
+        """
+            Unpack the content of the current source archive before processing.
+
+            args:
+                unpackDirectory(string):directory path receiving the archive content.
+        """
+        with profiling.PROFILER.span('read', member='*') as span:
+            self.getSourceArchive().extractall(unpackDirectory)
+
+            span.addBytes(sum(info.file_size for info in self.getSourceArchive().infolist()))
+
+    def extractMember(self,
+                      memberName,
+                      unpackDirectory,
+                      skin=None):
+        """
+            Unpack a single element of the current source archive.
+
+            args:
+                memberName(string): name of the element inside the archive.
+
+                unpackDirectory(string):directory path receiving the element.
+
+            kwargs:
+                skin(string): skinCluster stored in this element (profiling only).
+
+            returns:
+                (file path(string))
+        """
+        targetFile = posixpath.join(unpackDirectory,
+                                    memberName)
+
+        if os.path.exists(targetFile):
+            return targetFile
+
+        with profiling.PROFILER.span('read', skin=skin, member=memberName) as span:
+            self.getSourceArchive().extract(memberName,
+                                            unpackDirectory)
+
+            span.addBytes(self.getSourceArchive().getinfo(memberName).file_size)
+
+        return targetFile
 
     def processWeights(self,
-                      unpackDirectory):
-        super(BinaryInjection, self).processWeights(unpackDirectory)
+                       unpackDirectory):
+        self.validationUtils = validation.SkinValidator()
 
-        targetSkinFileArray = [file 
-                               for file in os.listdir(unpackDirectory) 
-                               if file.endswith('_skinweight.mb')]
+        self.validationUtils.rootNameSpace = maya.cmds.namespaceInfo(currentNamespace=True)
 
-        if len(targetSkinFileArray) ==0:
-            return
+        self.validationUtils.namespacePrefix = self.WEIGHT_NAMESPACE
+
+        self.validationUtils.deferRebuild = True
+
+        self.skinNodeArray = []
+
+        validSkinSettingsArray = []
+
+        for skinSettings in self.jsonArray:
+            with profiling.PROFILER.span('validate', skin=skinSettings.deformerName):
+                self.validationUtils.processInputSetting(skinSettings)
+
+            if self.validationUtils.isInvalid:
+                continue
+
+            validSkinSettingsArray.append(skinSettings)
+
+        rebuiltSkinArray = self.validationUtils.rebuildPendingSkinClusters()
+
+        if len(rebuiltSkinArray) > 0:
+            self.batchProcessing.report += '\n\t Rebuilding {} skinClusters took {} seconds'.format(len(rebuiltSkinArray),
+                                                                                                 self.validationUtils.bulkRebuildTime)
+
+        for skinSettings in validSkinSettingsArray:
+            self.batchProcessing.processObjectCount += 1
+
+            self.skinNodeArray.append(skinSettings.deformerName)
+
+            skinMetrics = self.recordSkinMetrics('import',
+                                                 skinSettings)
+
+            if skinMetrics is None or not skinSettings.abcWeightsFile:
+                continue
+
+            memberName = os.path.basename(skinSettings.abcWeightsFile)
+
+            if memberName in self.getSourceArchive().namelist():
+                skinMetrics.compressedBytes = self.getSourceArchive().getinfo(memberName).compress_size
+
+
+class AsciiInjection(DataInjection):
+    def __init__(self):
+        super(AsciiInjection, self).__init__()
+
+        self.mayaFileType = "mayaAscii"
+
+    def export(self,
+               inputTransform,
+               targetDirectory,
+               displayReport=False):
+        skinSettings = super(AsciiInjection,
+                             self).export(inputTransform,
+                                          targetDirectory,
+                                          displayReport=False)
+
+        if skinSettings is None:
+            return None
+
+        skinSettings.abcWeightsFile = self.saveWeights(skinSettings.skinDeformer,
+                                                       targetDirectory)
+
+        skinSettings.processingTime = float(self.timeProcessing.timeRange)
+
+        skinSettings.report = self.reporter.publishReport(skinSettings.skinDeformer, 
+                                                          skinSettings.abcWeightsFile,
+                                                          None)
+
+        return skinSettings
+
+    def processWeights(self,
+                       unpackDirectory):
+        super(AsciiInjection, self).processWeights(unpackDirectory)
+
+        with context.BatchSkinDisabled(self.skinNodeArray):
+            self.importWeights(unpackDirectory)
+
+    def importWeights(self,
+                      unpackDirectory,
+                      sourceFile=False):
+        for skinSettings in self.jsonArray:
+            if skinSettings.deformerName not in self.skinNodeArray:
+                continue
+
+            self.batchProcessing.checkCancelled()
+
+            skinSettings.abcWeightsFile = os.path.basename(skinSettings.abcWeightsFile)
+
+            skinSettings.abcWeightsFile = os.path.join(unpackDirectory,
+                                                       skinSettings.abcWeightsFile)
+
+            skinSettings.abcWeightsFile = skinSettings.abcWeightsFile.replace('\\', '/')
+
+            with profiling.PROFILER.span('decode', skin=skinSettings.deformerName):
+                targetFile = self.consolidateFile(skinSettings.abcWeightsFile)
+
+            with context.SkinDisabled(skinSettings.deformerName), \
+            profiling.PROFILER.span('apply', skin=skinSettings.deformerName):
+                maya.cmds.select(skinSettings.deformerName, 
+                                 r=True)
+
+                maya.cmds.skinPercent(skinSettings.deformerName,
+                                      '{}.vtx[*]'.format(skinSettings.shape), 
+                                      transformValue=[(skinSettings.influences[0], 0.0)])
+
+                if sourceFile is True:
+                    maya.mel.eval('source "{0}";'.format(targetFile))
+                else:
+                    maya.cmds.file(targetFile,
+                                   i=True, 
+                                   type=self.mayaFileType)
+
+
+            self.reportArray.append(self.reporter.publishImportReport(skinSettings.shape, 
+                                                                      self.timeProcessing.report,
+                                                                      skinSettings.abcWeightsFile,
+                                                                      self.validationUtils.getRebuildTime(skinSettings.deformerName),
+                                                                      self.validationUtils.wasRebuilt(skinSettings.deformerName),
+                                                                      self.validationUtils.getRebuildGroupSize(skinSettings.deformerName)))
+
+            self.batchProcessing.advanceProgress(1,
+                                                 byteCount=os.path.getsize(skinSettings.abcWeightsFile),
+                                                 label=skinSettings.deformerName)
+
+        self.timeProcessing.report = ''
+
+        for report in self.reportArray:
+            self.timeProcessing.report += report.replace('\n', '\n\t')
+
+            self.timeProcessing.report += '\n'
+
+    def consolidateFile(self, 
+                        weightsFile):
+        tempDirectory = os.path.dirname(weightsFile)
+        targetFile = "{0}/{1}.temp".format(tempDirectory,
+                                           os.path.basename(weightsFile))
+        
+        with open(targetFile, 'w') as asciiFile:
+            asciiFile.write('requires maya "2015";')
+            for line in self.filterAscii(weightsFile):
+                asciiFile.write(line)
+
+        return targetFile
+
+    def filterAscii(self,
+                    weightsFile):
+        startCollect = False
+        with open(weightsFile, 'r') as asciiFile:
+            for line in asciiFile:
+                if 'createNode skinCluster -n' in line:
+                    startCollect = True
+
+                if startCollect is True and 'createNode' not in line:
+                    if 'rename -uid' not in line:
+                        yield line
+
+                if startCollect is True and line.endswith('".pm";'):
+                    startCollect = False
+
+                if startCollect is True and 'createNode' in line and \
+                    'createNode skinCluster -n' not in line:
+                    startCollect = False
+
+
+class BinaryInjection(DataInjection):
+    LEGACY_SKIN_FILE = 'BinaryInjection_skinweight.mb'
+
+    def __init__(self):
+        super(BinaryInjection, self).__init__()
+
+        self.mayaFileType = "mayaBinary"
+
+    def export(self,
+               inputTransform,
+               targetDirectory,
+               displayReport=False):
+        """
+            Each skinCluster is saved to its own binary chunk, the archive json
+            (abcWeightsFile entry of each skin) acts as the chunk index.
+        """
+        skinSettings = super(BinaryInjection, self).export(inputTransform,
+                                                           targetDirectory,
+                                                           displayReport=False)
+
+        if skinSettings is None:
+            return None
+
+        skinSettings.abcWeightsFile = self.saveWeights(skinSettings.skinDeformer,
+                                                       targetDirectory)
+
+        skinSettings.processingTime = float(self.timeProcessing.timeRange)
+
+        skinSettings.report = self.reporter.publishReport(skinSettings.skinDeformer, 
+                                                          skinSettings.abcWeightsFile,
+                                                          None)
+
+        return skinSettings
+
+    def importWeights(self, 
+                      targetSkinFileArray,
+                      skinNodeArray=None,
+                      namespacePrefix="skinNamespace_weights"):
+        """
+            Swap scene skinClusters with the ones stored in the provided binary files.
+
+            args:
+                targetSkinFileArray(list of file path(string)): binary chunks to import.
+
+            kwargs:
+                skinNodeArray(list of string): skinClusters to restore.
+                (all matching skinClusters when None)
+
+                namespacePrefix(string): namespace isolating the imported nodes.
+        """
+        self.timeProcessing.displayReport = False
+
+        with self.timeProcessing:
+            with context.TemporaryNamespace(None,
+                                            namespacePrefix,
+                                            targetSkinFile=targetSkinFileArray,
+                                            fileType="mayaBinary"):
+                importSkinNodeArray = maya.cmds.namespaceInfo(namespacePrefix, 
+                                                              listOnlyDependencyNodes=True)
+
+                if skinNodeArray is None:
+                    skinNodeArray = [skin.replace(namespacePrefix+':', '')
+                                     for skin in importSkinNodeArray 
+                                     if maya.cmds.objExists(skin.replace(namespacePrefix+':', '')) is True \
+                                     and maya.cmds.nodeType(skin) == 'skinCluster']
+
+                for skin in skinNodeArray:
+                    self.batchProcessing.checkCancelled()
+
+                    with profiling.PROFILER.span('apply', skin=skin):
+                        maya.cmds.nodeCast(skin, 
+                                           namespacePrefix+':' + skin, 
+                                           disconnectUnmatchedAttrs=True,
+                                           swapNames=True )
+
+                    self.batchProcessing.advanceProgress(1,
+                                                         label=skin)
+
+                self.timeProcessing.report = "\n<BinaryInjection Report"
+
+    def extractArchive(self,
+                       unpackDirectory):
+        """
+            Binary chunks are extracted on demand once skins have been validated.
+        """
+        return
+
+    def getSkinChunkArray(self,
+                          unpackDirectory):
+        """
+            Extract the binary chunks matching the validated skinNodeArray.
+
+            args:
+                unpackDirectory(string):directory path receiving the chunks.
+
+            returns:
+                (list of file path(string))
+        """
+        archiveMembers = self.getSourceArchive().namelist()
+
+        chunkArray = []
+
+        for skinSettings in self.jsonArray:
+            if skinSettings.deformerName not in self.skinNodeArray:
+                continue
+
+            if not skinSettings.abcWeightsFile:
+                continue
+
+            chunkName = os.path.basename(skinSettings.abcWeightsFile)
+
+            if chunkName not in archiveMembers:
+                continue
+
+            chunkArray.append(self.extractMember(chunkName,
+                                                 unpackDirectory,
+                                                 skin=skinSettings.deformerName))
+
+        if len(chunkArray) > 0:
+            return chunkArray
+
+        #Archive saved before per skin chunks: one file holds every skinCluster
+        if self.LEGACY_SKIN_FILE in archiveMembers:
+            return [self.extractMember(self.LEGACY_SKIN_FILE,
+                                       unpackDirectory)]
+
+        return []
+
+    def processWeights(self,
+                      unpackDirectory):
+        super(BinaryInjection, self).processWeights(unpackDirectory)
+
+        if len(self.skinNodeArray) == 0:
+            return
+
+        targetSkinFileArray = self.getSkinChunkArray(unpackDirectory)
+
+        if len(targetSkinFileArray) ==0:
+            return
+
+        self.importWeights(targetSkinFileArray,
+                           skinNodeArray=self.skinNodeArray)
+
+
+class AlembicInjection(DataInjection):
+    def __init__(self):
+        self.weightFunctionUtils = maya.OpenMaya.MFnDoubleArrayData()
+
+        self.sourceAlembic = None
+
+        #Points applied per setWeights call, 0 applies the whole shape at once
+        self.chunkPointCount = 0
+
+        #Bytes allowed per chunk buffers, used when chunkPointCount is 0
+        self.weightMemoryBudget = 0
+
+        #{archived skinCluster: [target shape or skinCluster]} receiving the same payload
+        self.fanOutMap = {}
+
+        #Also apply payloads to scene skins with the same topology and influence names
+        self.fanOutMatching = False
+
+        #Bytes read from disk for the current payload, 0 when served by the decode cache
+        self.sourceByteCount = 0
+
+        super(AlembicInjection, self).__init__()
+
+        self.mayaFileType = "alembicIO"
+
+    def getMObject(self, nodeName):
+        return nodes.getMObject(nodeName)
+
+    def collectSkinWeights(self, 
+                           inputSkinCluster):
+        skinInput = settings.SkinSet(inputSkinCluster)
+        skinInput.getShapeFullComponents()
+
+        skinData = settings.ClusterIO()
+        skinData.setType = 'All'
+        skinData.joint = self.TARGET_WEIGHT_PROPERTY
+
+        intptrUtil = maya.OpenMaya.MScriptUtil() 
+        intptrUtil.createFromInt(0)
+        intPtr = intptrUtil.asUintPtr()
+
+        skinInput.skinFunctionUtils.getWeights(skinInput.shapePath,
+                                               skinInput.fullComponentPointSet,
+                                               skinData.weights,
+                                               intPtr)
+
+        return skinData
+
+    def tranferWeightToAttribute(self, 
+                                 skinWeightsHolder,
+                                 inputSkinData):
+        weightWriter = maya.OpenMaya.MDGModifier()
+
+        targetAttribute = '{}_weights'.format(inputSkinData.joint)
+        maya.cmds.addAttr(skinWeightsHolder, 
+                          ln=targetAttribute,
+                          dt=self.WEIGHT_PROPERTY_TYPE)
+
+        skinWeightsHolderApiObject = self.getMObject(skinWeightsHolder)
+        nodeFunctionUtils = maya.OpenMaya.MFnDependencyNode(skinWeightsHolderApiObject)
+
+        skinWeightsApiPlug = nodeFunctionUtils.findPlug(targetAttribute,
+                                                        False)
+
+        skinDataApiObject = self.weightFunctionUtils.create(inputSkinData.weights)
+
+        weightWriter.newPlugValue(skinWeightsApiPlug,
+                                  skinDataApiObject)
+  
+        weightWriter.doIt()
+
+        return targetAttribute
+
+    def saveToDisk(self,
+                   skinWeightsHolder,
+                   skinWeight,
+                   targetSkinFile):
+        with profiling.PROFILER.span('encode') as span:
+            targetAttribute = self.tranferWeightToAttribute(skinWeightsHolder,
+                                                            skinWeight)
+
+            span.addBytes(skinWeight.weights.length() * settings.SkinSet.DOUBLE_SIZE)
+
+        exportCommand = " -root |{node} -u {attribute} -file {targetFile}"
+        exportCommand = exportCommand.format(node=skinWeightsHolder,
+                                             attribute=targetAttribute,
+                                             targetFile=targetSkinFile)
+
+        settings.loadAlembicPlugins()
+
+        with profiling.PROFILER.span('write') as span:
+            maya.cmds.AbcExport(j=exportCommand)
+
+            span.addBytes(os.path.getsize(targetSkinFile))
+
+    def saveWeights(self, 
+                    inputSkinNode,
+                    targetSkinDirectory,
+                    displayReport=False):
+        targetSkinFile = posixpath.join(targetSkinDirectory,
+                                        '{0}.abc'.format(inputSkinNode))
+
+        self.timeProcessing.displayReport = displayReport
+        self.timeProcessing.report = ''
+
+        self.timeProcessing.skin = inputSkinNode
+
+        with self.timeProcessing:
+            skinWeightsHolder = maya.cmds.createNode(self.WEIGHT_HOLDER_TYPE)
+            self.timeProcessing.cleanupNodes.append(skinWeightsHolder)
+
+            with profiling.PROFILER.span('collect') as span:
+                skinWeight = self.collectSkinWeights(inputSkinNode)
+
+                span.addBytes(skinWeight.weights.length() * settings.SkinSet.DOUBLE_SIZE)
+
+            if inputSkinNode in self.metricsMap:
+                skinMetrics = self.metricsMap[inputSkinNode]
+
+                skinMetrics.rawBytes = skinWeight.weights.length() * settings.SkinSet.DOUBLE_SIZE
+                skinMetrics.nonZeroCount = metrics.countNonZero(settings.SkinSet.toValues(skinWeight.weights))
+
+            self.saveToDisk(skinWeightsHolder, 
+                            skinWeight, 
+                            targetSkinFile)
+
+            self.timeProcessing.report = self.reporter.publishReport(inputSkinNode, 
+                                                                     targetSkinFile,
+                                                                     skinWeight.weights.length())
+
+        return targetSkinFile
+
+    def export(self,
+               inputTransform,
+               targetDirectory,
+               displayReport=True):
+        skinSettings = super(AlembicInjection, self).export(inputTransform,
+                                                            targetDirectory)
+
+        if skinSettings is None:
+            return None
+
+        skinSettings.abcWeightsFile = self.saveWeights(skinSettings.skinDeformer,
+                                                       targetDirectory)
+
+        skinSettings.processingTime = float(self.timeProcessing.timeRange)
+
+        skinSettings.report = self.timeProcessing.report
+
+        return skinSettings
+
+    def extractArchive(self,
+                       unpackDirectory):
+        """
+            Alembic payloads are extracted on demand when the decode cache misses.
+        """
+        return
+
+    def importWeights(self,
+                      skinSettings,
+                      unpackDirectory,
+                      fanOutSkinArray=()):
+        self.sourceAlembic = os.path.join(unpackDirectory,
+                                          os.path.basename(skinSettings.abcWeightsFile))
+
+        self.sourceAlembic = self.sourceAlembic.replace("\\", "/")
+
+        self.sourceByteCount = 0
+
+        self.timeProcessing.displayReport = False
+        self.timeProcessing.report = ''
+
+        self.timeProcessing.skin = skinSettings.deformerName
+
+        with self.timeProcessing:
+            skinData = None
+
+            if skinSettings.deformerName in self.skinNodeArray:
+                skinData = self.loadFromDisk(skinSettings.deformerName,
+                                             self.sourceAlembic)
+
+            if len(fanOutSkinArray) > 0:
+                self.applyFanOut(skinSettings,
+                                 skinData,
+                                 fanOutSkinArray)
+
+    def decodeWeights(self,
+                      currentSkinCluster,
+                      skinData,
+                      sourceAlembic):
+        """
+            Fill skinData.weightUtils from the decode cache or from the archived alembic payload.
+            When the skin is applied by chunks the weights are only kept in skinData.weightStorage, 
+            and the in-memory decode cache is bypassed so a single copy of the payload exists.
+        """
+        memberName = os.path.basename(sourceAlembic)
+
+        chunkedMode = self.getChunkPointCount(skinData) > 0
+
+        cacheKey = None
+
+        if chunkedMode is False:
+            cacheKey = self.getDecodeCacheKey(self.originArchiveFile,
+                                              memberName)
+
+        cachedWeights = None
+
+        if cacheKey is not None:
+            cachedWeights = cache.DECODE_CACHE.get(cacheKey)
+
+        diskCache = None
+
+        if cachedWeights is None:
+            diskCache = self.getDiskCache()
+
+        with profiling.PROFILER.span('decode', skin=currentSkinCluster, cached=cachedWeights is not None) as span:
+            if cachedWeights is None and diskCache is not None:
+                archiveHash = diskCache.getArchiveHash(self.sourceArchiveFile)
+
+                #Read straight into C storage, no Python float is built
+                cachedBuffer = diskCache.readInto(archiveHash,
+                                                  memberName,
+                                                  settings.SkinSet.allocateDoubleStorage)
+
+                if cachedBuffer is not None:
+                    skinData.weightStorage = cachedBuffer.storage
+
+                    diskCache = None
+
+            if skinData.weightStorage is not None:
+                if chunkedMode is False:
+                    skinData.weightUtils = maya.OpenMaya.MFnDoubleArrayData()
+                    skinData.weightUtils.create(skinData.weightStorage.toDoubleArray())
+
+                    skinData.weightStorage = None
+
+            elif cachedWeights is not None:
+                skinData.weightUtils = maya.OpenMaya.MFnDoubleArrayData()
+                skinData.weightUtils.create(cachedWeights)
+
+            else:
+                self.extractMember(memberName,
+                                   os.path.dirname(sourceAlembic),
+                                   skin=currentSkinCluster)
+
+                self.sourceByteCount = os.path.getsize(sourceAlembic)
+
+                skinData.extractFromAlembic(sourceAlembic,
+                                            "skinNamespace_weights")
+
+                if chunkedMode is True:
+                    skinData.keepWeightStorage()
+
+            span.addBytes(skinData.getWeightCount() * skinData.DOUBLE_SIZE)
+
+        if diskCache is not None:
+            if skinData.weightStorage is not None:
+                weightBytes = skinData.weightStorage.buffer
+            else:
+                weightBytes = settings.SkinSet.toBytes(skinData.weightUtils.array())
+
+            diskCache.writeBytes(archiveHash,
+                                 memberName,
+                                 weightBytes,
+                                 extension='f64')
+
+        if cacheKey is not None and cacheKey not in cache.DECODE_CACHE:
+            cache.DECODE_CACHE.put(cacheKey,
+                                   maya.OpenMaya.MDoubleArray(skinData.weightUtils.array()),
+                                   skinData.weightUtils.length() * skinData.DOUBLE_SIZE)
+
+    def loadFromDisk(self,
+                     currentSkinCluster,
+                     sourceAlembic):
+        skinData = settings.SkinSet(currentSkinCluster)
+
+        skinData.getShapeFullComponents()
+
+        skinData.getInfluenceIndices()
+
+        self.decodeWeights(currentSkinCluster,
+                           skinData,
+                           sourceAlembic)
+
+        if currentSkinCluster in self.metricsMap:
+            skinMetrics = self.metricsMap[currentSkinCluster]
+
+            skinMetrics.rawBytes = skinData.getWeightCount() * skinData.DOUBLE_SIZE
+            skinMetrics.nonZeroCount = sum(metrics.countNonZero(values)
+                                           for values in skinData.iterWeightBlocks())
+
+        self.applyWeights(currentSkinCluster,
+                          skinData)
+
+        return skinData
+
+    def applyWeights(self,
+                     currentSkinCluster,
+                     skinData):
+        """
+            Write decoded weights on the provided skin, by chunks when requested.
+
+            args:
+                currentSkinCluster(string): name of the skinCluster to modify.
+
+                skinData(SkinSet): skin with decoded weights and influence indices.
+        """
+        chunkPointCount = self.getChunkPointCount(skinData)
+
+        with context.SkinDisabled(currentSkinCluster), \
+        profiling.PROFILER.span('apply', skin=currentSkinCluster):
+            if chunkPointCount > 0:
+                self.applyWeightChunks(currentSkinCluster,
+                                       skinData,
+                                       chunkPointCount)
+                return
+
+            skinData.skinFunctionUtils.setWeights(skinData.shapePath,
+                                                  skinData.fullComponentPointSet,
+                                                  skinData.influenceIndices,
+                                                  skinData.getWeightArray(),
+                                                  False,
+                                                  skinData.oldValues) 
+
+            self.weightJournal.record(currentSkinCluster,
+                                      skinData.fullComponentPointSet,
+                                      skinData.influenceIndices,
+                                      skinData.oldValues)
+
+    def getChunkPointCount(self,
+                           skinData):
+        """
+            Resolve the chunk size used to apply weights on the provided skin.
+
+            args:
+                skinData(SkinSet).
+
+            returns:
+                (int) 0 when the whole shape should be applied at once.
+        """
+        chunkPointCount = self.chunkPointCount
+
+        if chunkPointCount <= 0 and self.weightMemoryBudget > 0:
+            chunkPointCount = skinData.getChunkPointCount(self.weightMemoryBudget)
+
+        if chunkPointCount <= 0 or chunkPointCount >= skinData.pointCount:
+            return 0
+
+        if skinData.shapeType not in skinData.RANGE_SHAPE_TYPES:
+            return 0
+
+        return chunkPointCount
+
+    def applyWeightChunks(self,
+                          currentSkinCluster,
+                          skinData,
+                          chunkPointCount):
+        """
+            Apply decoded weights by vertex ranges so Maya only holds
+            one chunk of new and old values at a time.
+
+            args:
+                currentSkinCluster(string): name of the skinCluster to modify.
+
+                skinData(SkinSet): skin with decoded weights.
+
+                chunkPointCount(int): number of points per setWeights call.
+        """
+        influenceCount = skinData.jointPaths.length()
+
+        #Chunks are sliced from the single decoded C storage by address, 
+        #no value goes through Python, see decodeWeights
+        skinData.keepWeightStorage()
+
+        sourceStorage = skinData.weightStorage
+
+        chunkStorage = settings.SkinSet.DoubleStorage(chunkPointCount * influenceCount)
+
+        for startIndex in xrange(0, skinData.pointCount, chunkPointCount):
+            endIndex = min(startIndex + chunkPointCount,
+                           skinData.pointCount)
+
+            chunkComponent = skinData.getComponentRange(startIndex,
+                                                        endIndex)
+
+            chunkValueCount = (endIndex - startIndex) * influenceCount
+
+            chunkStorage.copyFrom(sourceStorage,
+                                  startIndex * influenceCount,
+                                  chunkValueCount)
+
+            skinData.oldValues = maya.OpenMaya.MDoubleArray()
+
+            skinData.skinFunctionUtils.setWeights(skinData.shapePath,
+                                                  chunkComponent,
+                                                  skinData.influenceIndices,
+                                                  chunkStorage.toDoubleArray(chunkValueCount),
+                                                  False,
+                                                  skinData.oldValues)
+
+            self.weightJournal.record(currentSkinCluster,
+                                      chunkComponent,
+                                      skinData.influenceIndices,
+                                      skinData.oldValues)
+
+    @staticmethod
+    def getInfluenceKey(influenceArray):
+        """
+            Influence names without dag path and namespace,
+            so duplicated rigs share the same key.
+        """
+        return tuple(sorted(influence.split('|')[-1].split(':')[-1] 
+                            for influence in influenceArray))
+
+    def getInfluenceRemap(self,
+                          influenceArray,
+                          targetSkinData):
+        """
+            Target influence indices following the archived influence order.
+
+            args:
+                influenceArray(list of string): archived influences.
+
+                targetSkinData(SkinSet): skin receiving the weights.
+
+            returns:
+                (MIntArray) or None when the influence names differ.
+        """
+        targetIndexMap = {}
+
+        for jointIndex in xrange(targetSkinData.jointPaths.length()):
+            jointName = targetSkinData.jointPaths[jointIndex].partialPathName()
+
+            targetIndexMap[jointName.split('|')[-1].split(':')[-1]] = jointIndex
+
+        if len(targetIndexMap) != len(influenceArray):
+            return None
+
+        influenceIndices = maya.OpenMaya.MIntArray(len(influenceArray))
+
+        for influenceIndex, influence in enumerate(influenceArray):
+            jointIndex = targetIndexMap.get(influence.split('|')[-1].split(':')[-1])
+
+            if jointIndex is None:
+                return None
+
+            influenceIndices.set(jointIndex,
+                                 influenceIndex)
+
+        return influenceIndices
+
+    def getFanOutTargets(self):
+        """
+            Collect the scene skinClusters receiving a copy of each archived payload,
+            from fanOutMap and, when fanOutMatching is enabled, from scene skins whose
+            shape topology and influence names match the archived skin.
+
+            returns:
+                (dict) {archived skinCluster: [target skinCluster]}
+        """
+        fanOutTargets = {}
+
+        assignedSkinSet = set(self.skinNodeArray)
+
+        for deformerName in self.fanOutMap:
+            targetSkinArray = []
+
+            for target in self.fanOutMap[deformerName]:
+                if not maya.cmds.objExists(target):
+                    maya.OpenMaya.MGlobal.displayWarning('Fan-out target {} does not exist'.format(target))
+                    continue
+
+                if maya.cmds.nodeType(target) == 'skinCluster':
+                    targetSkinArray.append(target)
+                else:
+                    targetSkinArray.extend(self.validationUtils.getSkinHistory(target))
+
+            targetSkinArray = [skin for skin in targetSkinArray if skin not in assignedSkinSet]
+
+            assignedSkinSet.update(targetSkinArray)
+
+            fanOutTargets[deformerName] = targetSkinArray
+
+        if self.fanOutMatching is False:
+            return fanOutTargets
+
+        sourceKeyMap = {}
+
+        for skinSettings in self.jsonArray:
+            topology = skinSettings.topology
+
+            if topology is None and maya.cmds.objExists(skinSettings.shape):
+                topology = settings.ShapeSettings.fromShape(skinSettings.shape).getTopologyFingerprint()
+
+            if topology is None:
+                continue
+
+            sourceKey = (topology, self.getInfluenceKey(skinSettings.influences))
+            sourceKeyMap.setdefault(sourceKey, skinSettings.deformerName)
+
+        if len(sourceKeyMap) == 0:
+            return fanOutTargets
+
+        for skin in maya.cmds.ls(type='skinCluster') or []:
+            if skin in assignedSkinSet:
+                continue
+
+            shapeArray = maya.cmds.skinCluster(skin,
+                                               q=True,
+                                               geometry=True)
+
+            if not shapeArray:
+                continue
+
+            targetKey = (settings.ShapeSettings.fromShape(shapeArray[0]).getTopologyFingerprint(),
+                         self.getInfluenceKey(maya.cmds.skinCluster(skin,
+                                                                    q=True,
+                                                                    inf=True)))
+
+            if targetKey not in sourceKeyMap:
+                continue
+
+            assignedSkinSet.add(skin)
+
+            fanOutTargets.setdefault(sourceKeyMap[targetKey], []).append(skin)
+
+        return fanOutTargets
+
+    def applyFanOut(self,
+                    skinSettings,
+                    skinData,
+                    fanOutSkinArray):
+        """
+            Apply one decoded payload to every skin of fanOutSkinArray,
+            the payload is decoded once, on the first target, when its own skin isn't in the scene.
 
-        targetSkinFile = posixpath.join(unpackDirectory,
-                                        targetSkinFileArray[0]).replace('\\', '/')
+            args:
+                skinSettings(SkinSettings): archived skin.
 
-        self.importWeights(targetSkinFile,
-                           skinNodeArray=self.skinNodeArray)
+                skinData(SkinSet): skin with decoded weights or None.
 
+                fanOutSkinArray(list of string): skinClusters receiving the weights.
+        """
+        for targetSkin in fanOutSkinArray:
+            self.batchProcessing.checkCancelled()
 
-class AlembicInjection(DataInjection):
-    def __init__(self):
-        self.weightFunctionUtils = maya.OpenMaya.MFnDoubleArrayData()
+            targetData = settings.SkinSet(targetSkin)
 
-        self.sourceAlembic = None
+            targetData.getShapeFullComponents()
 
-        super(AlembicInjection, self).__init__()
+            targetData.oldValues = maya.OpenMaya.MDoubleArray()
+            targetData.influenceIndices = self.getInfluenceRemap(skinSettings.influences,
+                                                                 targetData)
 
-        self.mayaFileType = "alembicIO"
+            if targetData.influenceIndices is None:
+                maya.OpenMaya.MGlobal.displayWarning('Influences of {0} do not match {1}'.format(targetSkin,
+                                                                                                 skinSettings.deformerName))
+                continue
 
-    def getMObject(self, nodeName):
-        selList = maya.OpenMaya.MSelectionList()
-        maya.OpenMaya.MGlobal.getSelectionListByName(nodeName, 
-                                                     selList)
-        depNode = maya.OpenMaya.MObject()
-        selList.getDependNode(0, depNode) 
+            if skinData is None:
+                self.decodeWeights(targetSkin,
+                                   targetData,
+                                   self.sourceAlembic)
 
-        return depNode
+                skinData = targetData
 
-    def collectSkinWeights(self, 
-                           inputSkinCluster):
-        skinInput = settings.SkinSet(inputSkinCluster)
-        skinInput.getShapeFullComponents()
+            if skinData.getWeightCount() != targetData.pointCount * len(skinSettings.influences):
+                maya.OpenMaya.MGlobal.displayWarning('Point count of {0} does not match {1}'.format(targetSkin,
+                                                                                                    skinSettings.deformerName))
+                continue
 
-        skinData = settings.ClusterIO()
-        skinData.setType = 'All'
-        skinData.joint = self.TARGET_WEIGHT_PROPERTY
+            targetData.weightUtils = skinData.weightUtils
+            targetData.weightStorage = skinData.weightStorage
 
-        intptrUtil = maya.OpenMaya.MScriptUtil() 
-        intptrUtil.createFromInt(0)
-        intPtr = intptrUtil.asUintPtr()
+            self.applyWeights(targetSkin,
+                              targetData)
 
-        skinInput.skinFunctionUtils.getWeights(skinInput.shapePath,
-                                               skinInput.fullComponentPointSet,
-                                               skinData.weights,
-                                               intPtr)
+            #Chunked targets move the payload to a DoubleStorage, later targets share it
+            skinData.weightUtils = targetData.weightUtils
+            skinData.weightStorage = targetData.weightStorage
 
-        return skinData
+            self.batchProcessing.processObjectCount += 1
 
-    def tranferWeightToAttribute(self, 
-                                 skinWeightsHolder,
-                                 inputSkinData):
-        weightWriter = maya.OpenMaya.MDGModifier()
+    def processWeights(self,
+                      unpackDirectory):
+        super(AlembicInjection, self).processWeights(unpackDirectory)
 
-        targetAttribute = '{}_weights'.format(inputSkinData.joint)
-        maya.cmds.addAttr(skinWeightsHolder, 
-                          ln=targetAttribute,
-                          dt=self.WEIGHT_PROPERTY_TYPE)
+        fanOutTargets = self.getFanOutTargets()
 
-        skinWeightsHolderApiObject = self.getMObject(skinWeightsHolder)
-        nodeFunctionUtils = maya.OpenMaya.MFnDependencyNode(skinWeightsHolderApiObject)
+        fanOutSkinArray = [skin for skinArray in fanOutTargets.values() for skin in skinArray]
 
-        skinWeightsApiPlug = nodeFunctionUtils.findPlug(targetAttribute,
-                                                        False)
+        with context.BatchSkinDisabled(self.skinNodeArray + fanOutSkinArray), \
+        context.TemporaryNamespace(self.validationUtils.rootNameSpace,
+                                   self.validationUtils.namespacePrefix):
+            for skinSettings in self.jsonArray:
+                targetSkinArray = fanOutTargets.get(skinSettings.deformerName, [])
 
-        skinDataApiObject = self.weightFunctionUtils.create(inputSkinData.weights)
+                if skinSettings.deformerName not in self.skinNodeArray and len(targetSkinArray) == 0:
+                    continue
 
-        weightWriter.newPlugValue(skinWeightsApiPlug,
-                                  skinDataApiObject)
-  
-        weightWriter.doIt()
+                self.batchProcessing.checkCancelled()
 
-        return targetAttribute
+                self.importWeights(skinSettings,
+                                   unpackDirectory,
+                                   fanOutSkinArray=targetSkinArray)
 
-    def saveToDisk(self,
-                   skinWeightsHolder,
-                   skinWeight,
-                   targetSkinFile):
-        targetAttribute = self.tranferWeightToAttribute(skinWeightsHolder,
-                                                        skinWeight)
+                if len(targetSkinArray) > 0:
+                    self.reportArray.append('\n{0} weights applied to {1} matching skins'.format(skinSettings.deformerName,
+                                                                                                len(targetSkinArray)))
 
-        exportCommand = " -root |{node} -u {attribute} -file {targetFile}"
-        exportCommand = exportCommand.format(node=skinWeightsHolder,
-                                             attribute=targetAttribute,
-                                             targetFile=targetSkinFile)
+                if skinSettings.deformerName not in self.skinNodeArray:
+                    self.batchProcessing.advanceProgress(1,
+                                                         byteCount=self.sourceByteCount,
+                                                         label=skinSettings.deformerName)
+                    continue
 
-        maya.cmds.AbcExport(j=exportCommand)
+                self.reportArray.append(self.reporter.publishImportReport(skinSettings.shape, 
+                                                                          self.timeProcessing.report,
+                                                                          self.sourceAlembic,
+                                                                          self.validationUtils.getRebuildTime(skinSettings.deformerName),
+                                                                          self.validationUtils.wasRebuilt(skinSettings.deformerName),
+                                                                          self.validationUtils.getRebuildGroupSize(skinSettings.deformerName)))
 
-    def saveWeights(self, 
-                    inputSkinNode,
-                    targetSkinDirectory,
-                    displayReport=False):
-        targetSkinFile = posixpath.join(targetSkinDirectory,
-                                        '{0}.abc'.format(inputSkinNode))
+                self.batchProcessing.advanceProgress(1,
+                                                     byteCount=self.sourceByteCount,
+                                                     label=skinSettings.deformerName)
 
-        self.timeProcessing.displayReport = displayReport
         self.timeProcessing.report = ''
 
-        with self.timeProcessing:
-            skinWeightsHolder = maya.cmds.createNode(self.WEIGHT_HOLDER_TYPE)
-            self.timeProcessing.cleanupNodes.append(skinWeightsHolder)
+        for report in self.reportArray:
+            self.timeProcessing.report += report.replace('\n', '\n\t\t')
 
-            skinWeight = self.collectSkinWeights(inputSkinNode)
+            self.timeProcessing.report += '\n'
 
-            self.saveToDisk(skinWeightsHolder, 
-                            skinWeight, 
-                            targetSkinFile)
 
-            self.timeProcessing.report = self.reporter.publishReport(inputSkinNode, 
-                                                                     targetSkinFile,
-                                                                     skinWeight.weights.length())
+class SnapshotInjection(AlembicInjection):
+    """
+        Keep skin weights in memory across destructive rig operations,
+        restore goes through the same validation as archive imports.
+    """
+    def __init__(self):
+        self.snapshot = settings.WeightSnapshot()
 
-        return targetSkinFile
+        super(SnapshotInjection, self).__init__()
+
+        self.mayaFileType = 'snapshot'
 
     def export(self,
                inputTransform,
-               targetDirectory,
-               displayReport=True):
-        skinSettings = super(AlembicInjection, self).export(inputTransform,
-                                                            targetDirectory)
+               targetDirectory=None,
+               displayReport=False):
+        #Weights stay in memory, AlembicInjection.export would write them to disk
+        skinSettings = DataInjection.export(self,
+                                            inputTransform,
+                                            targetDirectory)
 
         if skinSettings is None:
             return None
 
-        skinSettings.abcWeightsFile = self.saveWeights(skinSettings.skinDeformer,
-                                                       targetDirectory)
+        with profiling.PROFILER.span('collect', skin=skinSettings.deformerName) as span:
+            skinWeight = self.collectSkinWeights(skinSettings.skinDeformer)
 
-        skinSettings.processingTime = float(self.timeProcessing.timeRange)
+            span.addBytes(skinWeight.weights.length() * settings.SkinSet.DOUBLE_SIZE)
 
-        skinSettings.report = self.timeProcessing.report
+        influenceCount = max(len(skinSettings.influences), 1)
+
+        sparseWeights = settings.SparseWeights(skinWeight.weights.length() // influenceCount,
+                                               influenceCount)
+
+        with profiling.PROFILER.span('encode', skin=skinSettings.deformerName) as span:
+            sparseWeights.collect(skinWeight.weights)
+
+            span.addBytes(sparseWeights.getByteSize())
+
+        self.snapshot.add(skinSettings,
+                          sparseWeights)
 
         return skinSettings
 
-    def importWeights(self,
-                      skinSettings,
-                      unpackDirectory):
-        self.sourceAlembic = os.path.join(unpackDirectory,
-                                          os.path.basename(skinSettings.abcWeightsFile))
+    def takeSnapshot(self,
+                     inputObjectArray):
+        """
+            args:
+                inputObjectArray(list of transform names influenced by a skincluster).
 
-        self.sourceAlembic = self.sourceAlembic.replace("\\", "/")
+            returns:
+                (WeightSnapshot)
+        """
+        objectArray = self.validateObjectArray(inputObjectArray)
 
-        self.timeProcessing.displayReport = False
-        self.timeProcessing.report = ''
+        self.resetManager(False,
+                          len(objectArray),
+                          False)
 
-        with self.timeProcessing:
-            self.loadFromDisk(skinSettings.deformerName,
-                              self.sourceAlembic)
+        self.snapshot = settings.WeightSnapshot()
 
-    def loadFromDisk(self,
-                     currentSkinCluster,
-                     sourceAlembic):
-        skinData = settings.SkinSet(currentSkinCluster)
+        for transform in objectArray:
+            self.export(transform)
+
+        return self.snapshot
+
+    def restoreWeights(self,
+                       skinSettings,
+                       sparseWeights):
+        """
+            args:
+                skinSettings(SkinSettings): validated settings, 
+                its deformerName is the skinCluster found or rebuilt in the scene.
+
+                sparseWeights(SparseWeights): weights stored by the snapshot.
+
+            returns:
+                (bool) False when the skin no longer matches its snapshot.
+        """
+        skinData = settings.SkinSet(skinSettings.deformerName)
 
         skinData.getShapeFullComponents()
 
-        skinData.getInfluenceIndices()
+        skinData.oldValues = maya.OpenMaya.MDoubleArray()
+        skinData.influenceIndices = self.getInfluenceRemap(skinSettings.influences,
+                                                           skinData)
 
-        skinData.extractFromAlembic(sourceAlembic,
-                                    "skinNamespace_weights")
+        if skinData.influenceIndices is None or skinData.pointCount != sparseWeights.pointCount:
+            maya.OpenMaya.MGlobal.displayWarning('{} no longer matches its snapshot'.format(skinSettings.deformerName))
+            return False
 
-        with context.SkinDisabled(currentSkinCluster):
-            skinData.skinFunctionUtils.setWeights(skinData.shapePath,
-                                                  skinData.fullComponentPointSet,
-                                                  skinData.influenceIndices,
-                                                  skinData.weightUtils.array(),
-                                                  False,
-                                                  skinData.oldValues) 
+        with profiling.PROFILER.span('decode', skin=skinSettings.deformerName) as span:
+            skinData.weightUtils = maya.OpenMaya.MFnDoubleArrayData()
+            skinData.weightUtils.create(sparseWeights.toWeights())
+
+            span.addBytes(skinData.weightUtils.length() * skinData.DOUBLE_SIZE)
+
+        self.applyWeights(skinSettings.deformerName,
+                          skinData)
+
+        return True
 
     def processWeights(self,
-                      unpackDirectory):
-        super(AlembicInjection, self).processWeights(unpackDirectory)
+                       unpackDirectory):
+        DataInjection.processWeights(self,
+                                     unpackDirectory)
 
-        with context.TemporaryNamespace(self.validationUtils.rootNameSpace,
-                                        self.validationUtils.namespacePrefix):
-            for skinSettings in self.jsonArray:
-                self.importWeights(skinSettings,
-                                   unpackDirectory)
+        with context.BatchSkinDisabled(self.skinNodeArray):
+            #jsonArray holds copies of the snapshot settings, in the same order
+            for skinSettings, snapshotSettings in zip(self.jsonArray,
+                                                      self.snapshot.skinSettingsArray):
+                if skinSettings.deformerName not in self.skinNodeArray:
+                    continue
 
-                self.reportArray.append(self.reporter.publishImportReport(skinSettings.shape, 
-                                                                          self.timeProcessing.report,
-                                                                          self.sourceAlembic,
-                                                                          self.validationUtils.rebuildTime,
-                                                                          self.validationUtils.skinWasrebuilt))
+                self.batchProcessing.checkCancelled()
 
-                if self.batchProcessing.displayProgressbar is True:
-                    self.batchProcessing.progressbar.advanceProgress(1)
+                self.timeProcessing.displayReport = False
+                self.timeProcessing.skin = skinSettings.deformerName
 
-        self.timeProcessing.report = ''
+                with self.timeProcessing:
+                    self.restoreWeights(skinSettings,
+                                        self.snapshot.weightMap[snapshotSettings.deformerName])
 
-        for report in self.reportArray:
-            self.timeProcessing.report += report.replace('\n', '\n\t\t')
+                self.batchProcessing.advanceProgress(1,
+                                                     label=skinSettings.deformerName)
 
-            self.timeProcessing.report += '\n'
+    def restoreSnapshot(self,
+                        snapshot,
+                        exposeWeightDetails=False,
+                        showProgressbar=False):
+        """
+            Apply a WeightSnapshot to the scene, rebuilding missing skinClusters.
+
+            returns:
+                (float) processing time.
+        """
+        self.snapshot = snapshot
+
+        #Validation renames rebuilt skins, the snapshot keeps its own settings
+        self.jsonArray = [skinSettings.copy() for skinSettings in snapshot.skinSettingsArray]
+
+        self.resetManager(showProgressbar,
+                          len(self.jsonArray),
+                          exposeWeightDetails)
+
+        self.weightJournal.clear()
+
+        with self.batchProcessing:
+            try:
+                self.processWeights(None)
+            except:
+                if self.rollbackOnError is True:
+                    self.rollback()
+
+                raise
+
+            self.batchProcessing.report += '\n\t<Successfully restored {} components>'.format(self.batchProcessing.processObjectCount) 
+
+        return float(self.batchProcessing.timeRange)
 
 
 class SkinIO(object):
@@ -1132,7 +2888,7 @@ class SkinIO(object):
                               'mayaAscii')
 
     def __init__(self):
-        self.timeProcessing = context.TimeProcessor()
+        self.timeProcessing = context.TimeProcessor(spanName='skinIO')
 
         self.reporter = validation.SkinReport()
 
@@ -1144,34 +2900,222 @@ class SkinIO(object):
 
         self.processingTime = 0
 
+        self.chunkPointCount = 0
+
+        self.weightMemoryBudget = 0
+
+        self.collectMetrics = False
+
+        self.metricsSinkFile = None
+
+        #progress.ProgressReporter receiving progress and cancellation requests
+        self.progressReporter = None
+
+        self.checkpointExport = False
+
+        self.shardCount = 0
+
+        self.shardMaxSkins = 0
+
+        self.shardMaxBytes = 0
+
+        #Fan-out import options, see AlembicInjection.getFanOutTargets,
+        #fanOutMatching also stores topology fingerprints on export
+        self.fanOutMap = {}
+
+        self.fanOutMatching = False
+
+        #Process wide cache of decoded archives, see core.cache.DecodeCache
+        self.useDecodeCache = True
+
+        #Size in bytes given to the decode cache, None keeps $SKINIO_DECODE_CACHE_MB (disabled when unset)
+        self.decodeCacheMemoryCap = None
+
+        self.diskCacheDirectory = None
+
+        #Archive skin metadata layout, see DataInjection.saveSettings
+        self.metadataFormat = 'skn'
+
+    def setupProcessor(self,
+                       skinProcessor):
+        """
+            Forward SkinIO options to a freshly created injection instance.
+
+            args:
+                skinProcessor(DataInjection).
+
+            returns:
+                (DataInjection)
+        """
+        self.skinProcessor = skinProcessor
+
+        self.skinProcessor.collectMetrics = self.collectMetrics
+        self.skinProcessor.metricsSinkFile = self.metricsSinkFile
+
+        self.skinProcessor.progressReporter = self.progressReporter
+
+        self.skinProcessor.checkpointExport = self.checkpointExport
+
+        self.skinProcessor.shardCount = self.shardCount
+        self.skinProcessor.shardMaxSkins = self.shardMaxSkins
+        self.skinProcessor.shardMaxBytes = self.shardMaxBytes
+
+        self.skinProcessor.useDecodeCache = self.useDecodeCache
+
+        if self.decodeCacheMemoryCap is not None:
+            cache.DECODE_CACHE.setMemoryCap(self.decodeCacheMemoryCap)
+        self.skinProcessor.diskCacheDirectory = self.diskCacheDirectory
+
+        self.skinProcessor.metadataFormat = self.metadataFormat
+
+        self.skinProcessor.storeTopology = self.fanOutMatching
+
+        if isinstance(self.skinProcessor, AlembicInjection):
+            self.skinProcessor.chunkPointCount = self.chunkPointCount
+            self.skinProcessor.weightMemoryBudget = self.weightMemoryBudget
+
+            #Old weights kept for rollback share the same budget
+            if self.weightMemoryBudget > 0:
+                self.skinProcessor.weightJournal.memoryBudget = self.weightMemoryBudget
+
+            self.skinProcessor.fanOutMap = self.fanOutMap
+            self.skinProcessor.fanOutMatching = self.fanOutMatching
+
+        return self.skinProcessor
+
     def importAssetWeights(self, 
                            sourceArchiveFile,
                            exposeWeightDetails=True,
                            showProgressbar=True,
                            loadOnSelection=False):
+        profiling.PROFILER.reset()
+
         self.skinProcessor = DataInjection()
         archiveIsValid = self.skinProcessor.processArchive(sourceArchiveFile)
 
         if not archiveIsValid:
-            return
+            return False
 
         self.skinHandler = str(self.skinProcessor.injectionSettings.weightMode)
 
         if self.skinHandler == 'alembicIO':
-            self.skinProcessor = AlembicInjection()
+            self.setupProcessor(AlembicInjection())
 
         elif self.skinHandler == 'mayaBinary':
-            self.skinProcessor = BinaryInjection()
-            showProgressbar = False
+            self.setupProcessor(BinaryInjection())
 
         elif self.skinHandler == 'mayaAscii':
-            self.skinProcessor = AsciiInjection()
+            self.setupProcessor(AsciiInjection())
 
-        self.skinProcessor.importAssetWeights(sourceArchiveFile,
-                                              exposeWeightDetails=exposeWeightDetails,
-                                              showProgressbar=showProgressbar)
+        if loadOnSelection is True:
+            self.skinProcessor.skinFilter = self.getSelectionFilter()
 
-        return
+        try:
+            return self.skinProcessor.importAssetWeights(sourceArchiveFile,
+                                                         exposeWeightDetails=exposeWeightDetails,
+                                                         showProgressbar=showProgressbar)
+        except progress.OperationCancelled as error:
+            maya.OpenMaya.MGlobal.displayWarning(str(error))
+
+        return False
+
+    def getSelectionFilter(self):
+        """
+            Names of the skinClusters and shapes driven by the selected transforms,
+            used to import only their weights.
+
+            returns:
+                (set of string)
+        """
+        validationUtils = validation.SkinValidator()
+
+        skinFilter = set()
+
+        for inputTransform in maya.cmds.ls(sl=True, long=True) or []:
+            skinFilter.update(validationUtils.getSkinHistory(inputTransform))
+
+            shapeArray = maya.cmds.listRelatives(inputTransform,
+                                                 s=True,
+                                                 fullPath=True) or [inputTransform]
+
+            skinFilter.update(shapeArray)
+            skinFilter.update(shape.split('|')[-1] for shape in shapeArray)
+
+        return skinFilter
+
+    def exportWithProcessor(self,
+                            objectArray,
+                            targetArchiveFile,
+                            exposeWeightDetails,
+                            showProgressbar):
+        try:
+            return self.skinProcessor.exportAssetWeights(objectArray,
+                                                         targetArchiveFile,
+                                                         exposeWeightDetails=exposeWeightDetails,
+                                                         showProgressbar=showProgressbar)
+        except progress.OperationCancelled as error:
+            maya.OpenMaya.MGlobal.displayWarning(str(error))
+
+        return None
+
+    def exportTrace(self,
+                    targetFile):
+        """
+            Save the profiling spans of the last import or export as Chrome trace-event
+            JSON (chrome://tracing or Perfetto).
+
+            args:
+                targetFile(string): output json file path.
+        """
+        return profiling.PROFILER.exportChromeTrace(targetFile)
+
+    def rollback(self):
+        """
+            Restore the weights overwritten by the last importAssetWeights call.
+
+            returns:
+                (list of string) names of the restored skinClusters.
+        """
+        if self.skinProcessor is None:
+            return []
+
+        return self.skinProcessor.rollback()
+
+    def snapshot(self,
+                 objectArray):
+        """
+            Copy skin weights of the provided transforms in memory.
+
+            args:
+                objectArray(list of transform names influenced by a skincluster).
+
+            returns:
+                (WeightSnapshot)
+        """
+        profiling.PROFILER.reset()
+
+        return SnapshotInjection().takeSnapshot(objectArray)
+
+    def restore(self,
+                snapshot,
+                exposeWeightDetails=False,
+                showProgressbar=False):
+        """
+            Apply weights taken by snapshot, influences are remapped by name.
+
+            args:
+                snapshot(WeightSnapshot).
+        """
+        profiling.PROFILER.reset()
+
+        self.setupProcessor(SnapshotInjection())
+
+        try:
+            return self.skinProcessor.restoreSnapshot(snapshot,
+                                                      exposeWeightDetails=exposeWeightDetails,
+                                                      showProgressbar=showProgressbar)
+        except progress.OperationCancelled as error:
+            maya.OpenMaya.MGlobal.displayWarning(str(error))
 
     def exportAssetWeights(self,
                            objectArray,
@@ -1184,27 +3128,32 @@ class SkinIO(object):
         if objectArray is None:
             return
 
+        profiling.PROFILER.reset()
+
         self.processingTime = 0
 
         self.reportArray = []
 
         if self.skinHandler == 'alembicIO':
-            self.skinProcessor = AlembicInjection()
+            self.setupProcessor(AlembicInjection())
 
-            return self.skinProcessor.exportAssetWeights(objectArray,
-                                                         targetArchiveFile,
-                                                         exposeWeightDetails=exposeWeightDetails)
+            return self.exportWithProcessor(objectArray,
+                                            targetArchiveFile,
+                                            exposeWeightDetails,
+                                            showProgressbar)
 
         if self.skinHandler == 'mayaBinary':
-            self.skinProcessor = BinaryInjection()
+            self.setupProcessor(BinaryInjection())
 
-            return self.skinProcessor.exportAssetWeights(objectArray,
-                                                         targetArchiveFile,
-                                                         exposeWeightDetails=exposeWeightDetails)
+            return self.exportWithProcessor(objectArray,
+                                            targetArchiveFile,
+                                            exposeWeightDetails,
+                                            showProgressbar)
 
         if self.skinHandler == 'mayaAscii':
-            self.skinProcessor = AsciiInjection()
+            self.setupProcessor(AsciiInjection())
 
-            return self.skinProcessor.exportAssetWeights(objectArray,
-                                                         targetArchiveFile,
-                                                         exposeWeightDetails=exposeWeightDetails)
\ No newline at end of file
+            return self.exportWithProcessor(objectArray,
+                                            targetArchiveFile,
+                                            exposeWeightDetails,
+                                            showProgressbar)
\ No newline at end of file
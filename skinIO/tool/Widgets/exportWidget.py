@@ -9,6 +9,8 @@ from PySide import QtCore
 
 from skinIO import skinUtils
 
+from skinIO.tool.Widgets import progressWidget
+
 
 class SkinExportWidget(QtGui.QWidget):
     def __init__(self,
@@ -37,10 +39,15 @@ class SkinExportWidget(QtGui.QWidget):
 
         self.reportWidget = QtGui.QTextEdit(self)
 
+        self.progressWidget = progressWidget.SkinProgressWidget(self)
+        self.skinManager.progressReporter = self.progressWidget.reporter
+
         self.mainLayout.addWidget(self._createInjectionWidget())
 
         self.mainLayout.addWidget(exportButton)
 
+        self.mainLayout.addWidget(self.progressWidget)
+
         self.mainLayout.addWidget(self.reportWidget)
 
         self.setLayout(self.mainLayout)
@@ -9,6 +9,8 @@ from PySide import QtCore
 
 from skinIO import skinUtils
 
+from skinIO.tool.Widgets import progressWidget
+
 
 class SkinImportWidget(QtGui.QWidget):
     def __init__(self,
@@ -38,8 +40,13 @@ class SkinImportWidget(QtGui.QWidget):
 
         self.reportWidget = QtGui.QTextEdit(self)
 
+        self.progressWidget = progressWidget.SkinProgressWidget(self)
+        self.skinManager.progressReporter = self.progressWidget.reporter
+
         self.mainLayout.addWidget(importButton)
 
+        self.mainLayout.addWidget(self.progressWidget)
+
         self.mainLayout.addWidget(self.reportWidget)
 
         self.setLayout(self.mainLayout)
@@ -0,0 +1,74 @@
+from PySide import QtGui
+from PySide import QtCore
+
+
+from skinIO.core import progress
+
+
+class QtProgressReporter(progress.ProgressReporter):
+    """
+        Progress reporter driving a SkinProgressWidget
+    """
+    def __init__(self,
+                 progressWidget):
+        super(QtProgressReporter, self).__init__()
+
+        self.progressWidget = progressWidget
+
+    def onStart(self):
+        self.progressWidget.progressBar.setRange(0, max(self.skinCount, 1))
+        self.progressWidget.progressBar.setValue(0)
+        self.progressWidget.statusLabel.setText(self.title)
+
+        self.progressWidget.cancelButton.setEnabled(True)
+
+        QtGui.QApplication.processEvents()
+
+    def onUpdate(self):
+        self.progressWidget.progressBar.setValue(min(self.skinsDone, max(self.skinCount, 1)))
+
+        status = '{0} ({1:.1f} MB)'.format(self.label,
+                                           self.bytesDone / 1048576.0)
+        self.progressWidget.statusLabel.setText(status)
+
+        QtGui.QApplication.processEvents()
+
+    def onEnd(self):
+        self.progressWidget.cancelButton.setEnabled(False)
+
+        if self.cancelRequested:
+            self.progressWidget.statusLabel.setText('Cancelled')
+
+
+class SkinProgressWidget(QtGui.QWidget):
+    def __init__(self,
+                 parent=None):
+        super(SkinProgressWidget, self).__init__(parent)
+
+        self.setupUi()
+
+        self.reporter = QtProgressReporter(self)
+
+    def setupUi(self):
+        layout = QtGui.QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(5)
+
+        self.statusLabel = QtGui.QLabel('')
+        self.statusLabel.setMinimumWidth(200)
+
+        self.progressBar = QtGui.QProgressBar(self)
+
+        self.cancelButton = QtGui.QPushButton('Cancel')
+        self.cancelButton.setEnabled(False)
+
+        layout.addWidget(self.statusLabel)
+        layout.addWidget(self.progressBar)
+        layout.addWidget(self.cancelButton)
+
+        self.setLayout(layout)
+
+        self.cancelButton.clicked.connect(self._cancel)
+
+    def _cancel(self):
+        self.reporter.cancel()
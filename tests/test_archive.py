@@ -0,0 +1,316 @@
+"""
+    MIT License
+
+    L I C E N S E:
+        Copyright (c) 2014-2017 Cedric BAZILLOU All rights reserved.
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+    and associated documentation files (the "Software"), to deal in the Software without restriction,
+    including without limitation the rights to use, copy, modify, merge, publish, distribute,
+    sublicense, and/or sell copies of the Software,and to permit persons to whom the Software 
+    is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies 
+    or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, 
+    INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+    HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+
+    https://opensource.org/licenses/MIT
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from skinIO.archive import commands
+from skinIO.archive import payloads
+from skinIO.archive import reader
+from skinIO.archive import weights
+from skinIO.core import components
+from skinIO.core import pointWeights
+from skinIO.core import serialization
+
+
+#Three points skinned to three joints, see expectedWeights
+DEFORMER_WEIGHTS_XML = '''<?xml version="1.0"?>
+<deformerWeight>
+  <headerInfo fileName="body.xml" worldMatrix="1 0 0 0 0 1 0 0 0 0 1 0 0 0 0 1 "/>
+  <shape name="bodyShape" group="3" stride="3" size="3" max="3">
+    <point index="0" value=" 0.000 0.000 0.000"/>
+    <point index="1" value=" 1.000 0.000 0.000"/>
+    <point index="2" value=" 0.000 1.000 0.000"/>
+  </shape>
+  <weights deformer="skinCluster1" source="joint1" shape="bodyShape" layer="0" defaultValue="0.000" size="2" max="2">
+    <point index="0" value="0.250"/>
+    <point index="2" value="0.500"/>
+  </weights>
+  <weights deformer="skinCluster1" source="joint2" shape="bodyShape" layer="0" defaultValue="0.000" size="2" max="2">
+    <point index="0" value="0.750"/>
+    <point index="1" value="1.000"/>
+  </weights>
+  <weights deformer="skinCluster1" source="joint3" shape="bodyShape" layer="0" defaultValue="0.000" size="1" max="2">
+    <point index="2" value="0.500"/>
+  </weights>
+</deformerWeight>
+'''
+
+
+def expectedWeights():
+    return weights.WeightData(3,
+                              ['joint1', 'joint2', 'joint3'],
+                              [0.25, 0.75, 0.0,
+                               0.0, 1.0, 0.0,
+                               0.5, 0.0, 0.5])
+
+
+class TemporaryDirectoryCase(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.mkdtemp(prefix='skinIO_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.temporaryDirectory)
+
+    def getPath(self,
+                fileName):
+        return os.path.join(self.temporaryDirectory, fileName)
+
+
+class SkinMetadataTest(unittest.TestCase):
+    def getSkinMetadata(self):
+        skinMetadata = {}
+
+        for deformerName, shape in (('skinCluster1', '|body|bodyShape'),
+                                    ('skinCluster2', '|head|headShape')):
+            skinSettings = serialization.SkinSettings(None,
+                                                      collectData=False)
+
+            skinSettings.deformerName = deformerName
+            skinSettings.shape = shape
+            skinSettings.influences = ['|root|joint1', '|root|joint1|joint2']
+            skinSettings.normalizeWeights = 1
+            skinSettings.abcWeightsFile = '{0}_skinWeights.ma'.format(deformerName)
+
+            skinMetadata[deformerName] = skinSettings.toDict()
+
+        return skinMetadata
+
+    def test_encodeDecode(self):
+        skinMetadata = self.getSkinMetadata()
+
+        metadata = serialization.SkinMetadata.fromMember('asset' + serialization.SkinMetadata.EXTENSION,
+                                                         serialization.SkinMetadata.encode(skinMetadata).encode('utf-8'))
+
+        self.assertEqual(metadata.keys(), ['skinCluster1', 'skinCluster2'])
+
+        #Influences shared by both skins are written once in the string table
+        self.assertEqual(metadata.strings, ['|root|joint1', '|root|joint1|joint2'])
+
+        for deformerName in skinMetadata:
+            self.assertEqual(metadata.getShape(deformerName), skinMetadata[deformerName]['shape'])
+
+            skinData = metadata.getSkinData(deformerName)
+
+            for key, value in skinMetadata[deformerName].items():
+                if value is not None:
+                    self.assertEqual(skinData[key], value)
+
+            skinSettings = metadata.getSkinSettings(deformerName)
+
+            self.assertEqual(skinSettings.influences, skinMetadata[deformerName]['influences'])
+            self.assertEqual(skinSettings.abcWeightsFile, skinMetadata[deformerName]['abcWeightsFile'])
+
+    def test_legacySkinData(self):
+        metadata = serialization.SkinMetadata.fromDict(self.getSkinMetadata())
+
+        skinData = metadata.getSkinData('skinCluster1')
+        skinData['influences'].append('|root|joint3')
+
+        self.assertEqual(metadata.getSkinData('skinCluster1')['influences'], 
+                         ['|root|joint1', '|root|joint1|joint2'])
+
+    def test_decodeUnknownFormat(self):
+        with self.assertRaises(ValueError):
+            serialization.SkinMetadata.decode('{"format": "other"}\n')
+
+
+class AsciiPayloadTest(unittest.TestCase):
+    def test_encodeDecode(self):
+        weightData = expectedWeights()
+
+        data = payloads.encodeAscii('skinCluster1',
+                                    weightData)
+
+        decodedData = payloads.decodeAscii(data.encode('utf-8'),
+                                           weightData.influences)
+
+        self.assertEqual(decodedData.pointCount, weightData.pointCount)
+        self.assertEqual(list(decodedData.values), list(weightData.values))
+
+
+class WgtTest(TemporaryDirectoryCase):
+    def writeWgt(self,
+                 wgtFile,
+                 weightData,
+                 chunkPointCount):
+        with pointWeights.WgtWriter(wgtFile) as wgtWriter:
+            wgtWriter.writeHeader('skinCluster1',
+                                  '|body|bodyShape',
+                                  weightData.pointCount,
+                                  weightData.influences)
+
+            influenceCount = weightData.influenceCount
+
+            for startIndex in range(0, weightData.pointCount, chunkPointCount):
+                wgtWriter.writeChunk(startIndex,
+                                     weightData.values[startIndex * influenceCount:(startIndex + chunkPointCount) * influenceCount])
+
+        return wgtWriter
+
+    def test_roundTrip(self):
+        weightData = expectedWeights()
+
+        wgtFile = self.getPath('body.wgt')
+
+        wgtWriter = self.writeWgt(wgtFile,
+                                  weightData,
+                                  2)
+
+        self.assertEqual(wgtWriter.nonZeroCount, 5)
+
+        #Read chunks don't need to match the written ones
+        for chunkPointCount in (1, 2, 3, 10):
+            with pointWeights.WgtReader(wgtFile) as wgtReader:
+                self.assertEqual(wgtReader.deformerName, 'skinCluster1')
+                self.assertEqual(wgtReader.shape, '|body|bodyShape')
+                self.assertEqual(wgtReader.pointCount, 3)
+                self.assertEqual(wgtReader.influences, weightData.influences)
+
+                values = []
+                nextIndex = 0
+
+                for startIndex, endIndex, chunkValues in wgtReader.iterChunks(chunkPointCount):
+                    self.assertEqual(startIndex, nextIndex)
+                    self.assertEqual(len(chunkValues), (endIndex - startIndex) * weightData.influenceCount)
+
+                    values.extend(chunkValues)
+                    nextIndex = endIndex
+
+            self.assertEqual(values, list(weightData.values))
+
+    def test_unorderedPoints(self):
+        wgtFile = self.getPath('unordered.wgt')
+
+        with open(wgtFile, 'w') as outputFile:
+            outputFile.write('\n'.join([pointWeights.WgtWriter.FORMAT_LINE,
+                                        'skin skinCluster1',
+                                        'shape bodyShape',
+                                        'points 4',
+                                        'influences 1',
+                                        'influence 0 joint1',
+                                        'weights',
+                                        '0 0:1.0',
+                                        '3 0:1.0',
+                                        '1 0:1.0']) + '\n')
+
+        with pointWeights.WgtReader(wgtFile) as wgtReader:
+            with self.assertRaises(pointWeights.WgtError):
+                list(wgtReader.iterChunks(2))
+
+    def test_notWgt(self):
+        wgtFile = self.getPath('other.wgt')
+
+        with open(wgtFile, 'w') as outputFile:
+            outputFile.write('weights\n')
+
+        with self.assertRaises(pointWeights.WgtError):
+            with pointWeights.WgtReader(wgtFile):
+                pass
+
+
+class DeformerWeightsTest(TemporaryDirectoryCase):
+    def setUp(self):
+        TemporaryDirectoryCase.setUp(self)
+
+        self.xmlFile = self.getPath('body.xml')
+
+        with open(self.xmlFile, 'w') as outputFile:
+            outputFile.write(DEFORMER_WEIGHTS_XML)
+
+        self.archiveFile = commands.convertDeformerWeights(self.xmlFile,
+                                                           self.getPath('body.zip'))
+
+    def test_convert(self):
+        weightData = expectedWeights()
+
+        with reader.ArchiveReader(self.archiveFile) as archiveReader:
+            self.assertEqual(archiveReader.weightMode, 'mayaAscii')
+
+            skinPayload = archiveReader.getSkin('skinCluster1')
+
+            self.assertEqual(skinPayload.shape, 'bodyShape')
+            self.assertEqual(skinPayload.skinSettings.influences, weightData.influences)
+
+            self.assertEqual(list(skinPayload.decode().values), list(weightData.values))
+
+            self.assertIsNone(archiveReader.getSkin('skinCluster2'))
+
+    def test_validate(self):
+        report = commands.validateArchive(self.archiveFile)
+
+        self.assertEqual(report['errors'], [])
+        self.assertEqual(report['warnings'], [])
+
+    def test_stats(self):
+        stats = commands.getArchiveStats(self.archiveFile)
+
+        self.assertEqual(stats['totals']['skins'], 1)
+        self.assertEqual(stats['totals']['points'], 3)
+        self.assertEqual(stats['totals']['nonZeroCount'], 5)
+
+        self.assertEqual(stats['skins'][0]['maxInfluences'], 2)
+
+    def test_notZip(self):
+        with self.assertRaises(payloads.ArchiveError):
+            commands.convertDeformerWeights(self.xmlFile,
+                                            self.getPath('body.json'))
+
+
+class ComponentsTest(unittest.TestCase):
+    def test_surfaceIndices(self):
+        pointIndices = components.getPointRange(0, 12)
+
+        uIndices, vIndices = components.getDoubleIndices(pointIndices,
+                                                         4)
+
+        self.assertEqual(list(uIndices[:5]), [0, 0, 0, 0, 1])
+        self.assertEqual(list(vIndices[:5]), [0, 1, 2, 3, 0])
+
+        self.assertEqual(components.getFlatIndices((uIndices, vIndices),
+                                                   (3, 4)),
+                         pointIndices)
+
+    def test_latticeIndices(self):
+        pointIndices = components.getPointRange(0, 24)
+
+        sIndices, tIndices, uIndices = components.getTripleIndices(pointIndices,
+                                                                   2,
+                                                                   3)
+
+        self.assertEqual((sIndices[7], tIndices[7], uIndices[7]), (1, 0, 1))
+
+        self.assertEqual(components.getFlatIndices((sIndices, tIndices, uIndices),
+                                                   (2, 3, 4)),
+                         pointIndices)
+
+    def test_meshIndices(self):
+        self.assertEqual(list(components.getFlatIndices(([3, 1, 2],), (4,))), [3, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()